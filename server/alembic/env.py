@@ -31,8 +31,8 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Import all models here
-from app.banking.models import Account, PaymentRequest, Transaction # noqa: F401
-from app.listings.models import Listing, Tag # noqa: F401
+from app.banking.models import Account, PaymentRequest, SinkCredit, Transaction, TransactionCounter, LedgerDailySummary, LedgerAuditBalance, LedgerAuditRun, LedgerAuditFinding # noqa: F401
+from app.listings.models import Listing, Tag, FeedCard # noqa: F401
 from app.users.models import User # noqa: F401
 from app.auth.models import Invite # noqa: F401
 from app.chat.models import MatrixUserCredentials, MatrixRoom, MatrixRoomParticipant, MatrixRegistrationStats # noqa: F401
@@ -0,0 +1,55 @@
+"""add sink_credits journal
+
+Revision ID: 5a7c1e9d2b40
+Revises: 9e931718bbfc
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a7c1e9d2b40"
+down_revision: Union[str, Sequence[str], None] = "9e931718bbfc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "sink_credits",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("transaction_id", sa.Uuid(), nullable=True),
+        sa.Column("amount_time", sa.Integer(), nullable=False),
+        sa.Column("amount_regio", sa.Numeric(10, 2), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("rolled_up_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_sink_credits_transaction_id"),
+        "sink_credits",
+        ["transaction_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_sink_credits_pending",
+        "sink_credits",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("rolled_up_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_sink_credits_pending", table_name="sink_credits")
+    op.drop_index(
+        op.f("ix_sink_credits_transaction_id"), table_name="sink_credits"
+    )
+    op.drop_table("sink_credits")
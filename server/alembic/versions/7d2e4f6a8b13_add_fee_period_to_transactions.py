@@ -0,0 +1,47 @@
+"""add fee_period to transactions
+
+Revision ID: 7d2e4f6a8b13
+Revises: 5a7c1e9d2b40
+Create Date: 2026-10-17 11:03:27.904512
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2e4f6a8b13"
+down_revision: Union[str, Sequence[str], None] = "5a7c1e9d2b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "fee_period",
+            sqlmodel.sql.sqltypes.AutoString(length=7),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "uq_transactions_sender_fee_period",
+        "transactions",
+        ["sender_id", "fee_period"],
+        unique=True,
+        postgresql_where=sa.text("fee_period IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "uq_transactions_sender_fee_period", table_name="transactions"
+    )
+    op.drop_column("transactions", "fee_period")
@@ -0,0 +1,86 @@
+"""keyset history indexes and transaction counters
+
+Revision ID: 8c3f5a7b9d24
+Revises: 7d2e4f6a8b13
+Create Date: 2026-10-17 13:41:09.226371
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3f5a7b9d24"
+down_revision: Union[str, Sequence[str], None] = "7d2e4f6a8b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_transactions_sender_created",
+        "transactions",
+        ["sender_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transactions_receiver_created",
+        "transactions",
+        ["receiver_id", "created_at", "id"],
+        unique=False,
+    )
+    # Covered by the two indexes above, which lead with the same column
+    op.drop_index(op.f("ix_transactions_sender_id"), table_name="transactions")
+    op.drop_index(
+        op.f("ix_transactions_receiver_id"), table_name="transactions"
+    )
+
+    op.create_table(
+        "transaction_counters",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # Backfill from the existing ledger
+    op.execute(
+        """
+        INSERT INTO transaction_counters (user_id, total)
+        SELECT user_id, count(*)
+        FROM (
+            SELECT sender_id AS user_id FROM transactions
+            UNION ALL
+            SELECT receiver_id FROM transactions
+        ) AS parties
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("transaction_counters")
+    op.create_index(
+        op.f("ix_transactions_receiver_id"),
+        "transactions",
+        ["receiver_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_transactions_sender_id"),
+        "transactions",
+        ["sender_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_transactions_receiver_created", table_name="transactions"
+    )
+    op.drop_index("ix_transactions_sender_created", table_name="transactions")
@@ -0,0 +1,91 @@
+"""add ledger_daily_summaries
+
+Revision ID: 9b4d6e8f0a35
+Revises: 8c3f5a7b9d24
+Create Date: 2026-10-17 15:02:53.771840
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4d6e8f0a35"
+down_revision: Union[str, Sequence[str], None] = "8c3f5a7b9d24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ledger_daily_summaries",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("time_in", sa.Integer(), nullable=False),
+        sa.Column("time_out", sa.Integer(), nullable=False),
+        sa.Column("regio_in", sa.Numeric(12, 2), nullable=False),
+        sa.Column("regio_out", sa.Numeric(12, 2), nullable=False),
+        sa.Column("fee_time", sa.Integer(), nullable=False),
+        sa.Column("fee_regio", sa.Numeric(12, 2), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+
+    # Backfill from the existing ledger
+    op.execute(
+        """
+        INSERT INTO ledger_daily_summaries (
+            user_id, day, time_in, time_out, regio_in, regio_out,
+            fee_time, fee_regio, transaction_count
+        )
+        SELECT
+            user_id,
+            day,
+            sum(time_in),
+            sum(time_out),
+            sum(regio_in),
+            sum(regio_out),
+            sum(fee_time),
+            sum(fee_regio),
+            count(*)
+        FROM (
+            SELECT
+                sender_id AS user_id,
+                (created_at AT TIME ZONE 'UTC')::date AS day,
+                0 AS time_in,
+                amount_time AS time_out,
+                0 AS regio_in,
+                amount_regio AS regio_out,
+                CASE WHEN is_system_fee THEN amount_time ELSE 0 END
+                    AS fee_time,
+                CASE WHEN is_system_fee THEN amount_regio ELSE 0 END
+                    AS fee_regio
+            FROM transactions
+            UNION ALL
+            SELECT
+                receiver_id,
+                (created_at AT TIME ZONE 'UTC')::date,
+                amount_time,
+                0,
+                amount_regio,
+                0,
+                0,
+                0
+            FROM transactions
+        ) AS legs
+        GROUP BY user_id, day
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("ledger_daily_summaries")
@@ -0,0 +1,114 @@
+"""add ledger audit tables
+
+Revision ID: a3c5e7f9b146
+Revises: 9b4d6e8f0a35
+Create Date: 2026-10-17 16:11:27.408215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c5e7f9b146"
+down_revision: Union[str, Sequence[str], None] = "9b4d6e8f0a35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ledger_audit_balances",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("expected_time", sa.Integer(), nullable=False),
+        sa.Column("expected_regio", sa.Numeric(12, 2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_table(
+        "ledger_audit_runs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "checkpoint_created_at", sa.DateTime(timezone=True), nullable=True
+        ),
+        sa.Column("checkpoint_id", sa.Uuid(), nullable=True),
+        sa.Column("transactions_scanned", sa.Integer(), nullable=False),
+        sa.Column("accounts_checked", sa.Integer(), nullable=False),
+        sa.Column("drift_count", sa.Integer(), nullable=False),
+        sa.Column("total_time", sa.Integer(), nullable=False),
+        sa.Column("total_regio", sa.Numeric(12, 2), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "ledger_audit_findings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("account_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "currency",
+            postgresql.ENUM(
+                "TIME", "REGIO", name="currency", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("expected", sa.Numeric(12, 2), nullable=False),
+        sa.Column("actual", sa.Numeric(12, 2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["run_id"],
+            ["ledger_audit_runs.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ledger_audit_findings_account_id"),
+        "ledger_audit_findings",
+        ["account_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_ledger_audit_findings_run_id"),
+        "ledger_audit_findings",
+        ["run_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transactions_created_id",
+        "transactions",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_created_id", table_name="transactions")
+    op.drop_index(
+        op.f("ix_ledger_audit_findings_run_id"),
+        table_name="ledger_audit_findings",
+    )
+    op.drop_index(
+        op.f("ix_ledger_audit_findings_account_id"),
+        table_name="ledger_audit_findings",
+    )
+    op.drop_table("ledger_audit_findings")
+    op.drop_table("ledger_audit_runs")
+    op.drop_table("ledger_audit_balances")
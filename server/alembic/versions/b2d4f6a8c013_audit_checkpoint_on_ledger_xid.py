@@ -0,0 +1,78 @@
+"""audit checkpoint on ledger xid
+
+Revision ID: b2d4f6a8c013
+Revises: f8b0d2e4a691
+Create Date: 2026-10-17 21:04:37.512893
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d4f6a8c013"
+down_revision: Union[str, Sequence[str], None] = "f8b0d2e4a691"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are all committed: 0 puts them before any checkpoint.
+    # New rows get the writing transaction's id.
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "ledger_xid", sa.BigInteger(), server_default="0", nullable=False
+        ),
+    )
+    op.alter_column(
+        "transactions",
+        "ledger_xid",
+        server_default=sa.text("pg_current_xact_id()::text::bigint"),
+    )
+    op.drop_index("ix_transactions_created_id", table_name="transactions")
+    op.create_index(
+        "ix_transactions_ledger_xid",
+        "transactions",
+        ["ledger_xid"],
+        unique=False,
+    )
+
+    op.add_column(
+        "ledger_audit_runs",
+        sa.Column("checkpoint_xid", sa.BigInteger(), nullable=True),
+    )
+    op.drop_column("ledger_audit_runs", "checkpoint_id")
+    op.drop_column("ledger_audit_runs", "checkpoint_created_at")
+    # Old (created_at, id) checkpoints cannot be carried over: the next
+    # run rebuilds the expected balances from the full history
+    op.execute("DELETE FROM ledger_audit_balances")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM ledger_audit_balances")
+    op.add_column(
+        "ledger_audit_runs",
+        sa.Column(
+            "checkpoint_created_at", sa.DateTime(timezone=True), nullable=True
+        ),
+    )
+    op.add_column(
+        "ledger_audit_runs",
+        sa.Column("checkpoint_id", sa.Uuid(), nullable=True),
+    )
+    op.drop_column("ledger_audit_runs", "checkpoint_xid")
+
+    op.drop_index("ix_transactions_ledger_xid", table_name="transactions")
+    op.create_index(
+        "ix_transactions_created_id",
+        "transactions",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.drop_column("transactions", "ledger_xid")
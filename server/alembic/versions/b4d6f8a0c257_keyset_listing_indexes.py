@@ -0,0 +1,41 @@
+"""keyset listing indexes
+
+Revision ID: b4d6f8a0c257
+Revises: a3c5e7f9b146
+Create Date: 2026-10-17 16:48:05.129377
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d6f8a0c257"
+down_revision: Union[str, Sequence[str], None] = "a3c5e7f9b146"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_listings_status_created",
+        "listings",
+        ["status", sa.text("created_at DESC"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_listings_owner_created",
+        "listings",
+        ["owner_id", sa.text("created_at DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_listings_owner_created", table_name="listings")
+    op.drop_index("ix_listings_status_created", table_name="listings")
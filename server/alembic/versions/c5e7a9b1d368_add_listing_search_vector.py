@@ -0,0 +1,55 @@
+"""add listing search vector
+
+Revision ID: c5e7a9b1d368
+Revises: b4d6f8a0c257
+Create Date: 2026-10-17 17:20:44.603918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e7a9b1d368"
+down_revision: Union[str, Sequence[str], None] = "b4d6f8a0c257"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.listings.models.SEARCH_DOCUMENT at the time of this revision
+SEARCH_DOCUMENT = """
+    setweight(to_tsvector('simple'::regconfig, coalesce(title_original, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, coalesce(title_en, '')), 'A')
+    || setweight(to_tsvector('german'::regconfig, coalesce(title_de, '')), 'A')
+    || setweight(to_tsvector('hungarian'::regconfig, coalesce(title_hu, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(description_original, '')), 'B')
+    || setweight(to_tsvector('english'::regconfig, coalesce(description_en, '')), 'B')
+    || setweight(to_tsvector('german'::regconfig, coalesce(description_de, '')), 'B')
+    || setweight(to_tsvector('hungarian'::regconfig, coalesce(description_hu, '')), 'B')
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: Postgres fills it for existing rows and keeps
+    # it current on every insert/update, translations included.
+    op.execute(
+        f"""
+        ALTER TABLE listings
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS ({SEARCH_DOCUMENT}) STORED
+        """
+    )
+    op.create_index(
+        "ix_listings_search_vector",
+        "listings",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_listings_search_vector", table_name="listings")
+    op.drop_column("listings", "search_vector")
@@ -0,0 +1,32 @@
+"""add listing zip d_class index
+
+Revision ID: d6f8a0c2e479
+Revises: c5e7a9b1d368
+Create Date: 2026-10-17 18:02:37.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6f8a0c2e479"
+down_revision: Union[str, Sequence[str], None] = "c5e7a9b1d368"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_listings_zip_d_class",
+        "listings",
+        ["zip_code", "d_class"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_listings_zip_d_class", table_name="listings")
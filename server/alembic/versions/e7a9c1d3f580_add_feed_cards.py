@@ -0,0 +1,73 @@
+"""add feed cards
+
+Revision ID: e7a9c1d3f580
+Revises: d6f8a0c2e479
+Create Date: 2026-10-17 18:41:09.224671
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a9c1d3f580"
+down_revision: Union[str, Sequence[str], None] = "d6f8a0c2e479"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are backfilled by the app on first startup (run_feed_card_rebuild)
+    op.create_table(
+        "feed_cards",
+        sa.Column("listing_id", sa.Uuid(), nullable=False),
+        sa.Column("lang", sa.String(length=2), nullable=False),
+        sa.Column(
+            "category",
+            postgresql.ENUM(
+                "OFFER_SERVICE",
+                "SEARCH_SERVICE",
+                "SELL_PRODUCT",
+                "SEARCH_PRODUCT",
+                "OFFER_RENTAL",
+                "RIDE_SHARE",
+                "EVENT_WORKSHOP",
+                name="listingcategory",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("zip_code", sa.String(length=4), nullable=True),
+        sa.Column("d_class", sa.String(length=2), nullable=True),
+        sa.Column(
+            "tag_ids",
+            postgresql.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "card", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["listing_id"], ["listings.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("listing_id", "lang"),
+    )
+    op.create_index(
+        "ix_feed_cards_lang_created",
+        "feed_cards",
+        ["lang", sa.text("created_at DESC"), "listing_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_feed_cards_lang_created", table_name="feed_cards")
+    op.drop_table("feed_cards")
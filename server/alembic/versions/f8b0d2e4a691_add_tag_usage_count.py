@@ -0,0 +1,48 @@
+"""add tag usage count
+
+Revision ID: f8b0d2e4a691
+Revises: e7a9c1d3f580
+Create Date: 2026-10-17 19:26:53.118407
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8b0d2e4a691"
+down_revision: Union[str, Sequence[str], None] = "e7a9c1d3f580"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tags",
+        sa.Column(
+            "usage_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.execute(
+        """
+        UPDATE tags
+        SET usage_count = counts.usage
+        FROM (
+            SELECT listing_tags.tag_id, count(*) AS usage
+            FROM listing_tags
+            JOIN listings ON listings.id = listing_tags.listing_id
+            WHERE listings.status = 'ACTIVE'
+            GROUP BY listing_tags.tag_id
+        ) AS counts
+        WHERE tags.id = counts.tag_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tags", "usage_count")
@@ -1,4 +1,5 @@
 import uuid
+from datetime import date
 from typing import Any, List, Literal, Optional
 
 from fastapi import (
@@ -9,11 +10,14 @@ from fastapi import (
     Query,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from app.admin.dependencies import AdminServiceDep
 from app.admin.schemas import (
     DisputeAction,
     DisputePublic,
+    LedgerAuditReport,
+    MetricsSnapshot,
     SystemStats,
     TagAdminUpdate,
     TagsAdminListResponse,
@@ -21,7 +25,16 @@ from app.admin.schemas import (
     UserListResponse,
 )
 from app.banking.dependencies import get_banking_service
+from app.banking.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_filename,
+    stream_transactions,
+)
+from app.banking.schemas import BalanceHistory
 from app.banking.service import BankingService
+from app.core.metrics import metrics
+from app.core.redis import record_pool_metrics
 from app.core.schemas import Message
 from app.email.config import email_settings
 from app.email.schemas import (
@@ -67,6 +80,26 @@ async def get_dashboard_stats(service: AdminServiceDep) -> Any:
     return await service.get_system_stats()
 
 
+@router.get(
+    "/metrics",
+    response_model=MetricsSnapshot,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Not authenticated."},
+        status.HTTP_403_FORBIDDEN: {"description": "Not a system admin."},
+    },
+)
+async def get_runtime_metrics() -> Any:
+    """
+    Get this worker's in-process counters and gauges.
+
+    Includes ledger contention (`banking_conflicts_total` per operation and
+    account, `banking_retries_total`, `banking_retries_exhausted_total`).
+    """
+    record_pool_metrics()
+    return metrics.snapshot()
+
+
 """USER MANAGEMENT"""
 
 
@@ -203,7 +236,9 @@ async def verify_user(
     },
 )
 async def toggle_user_active(
-    user_code: str, user_service: UserService = Depends(get_user_service)
+    user_code: str,
+    current_admin: CurrentUser,
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """
     Ban/Unban a user.
@@ -218,10 +253,99 @@ async def toggle_user_active(
 
     new_status = not user.is_active
     return await user_service.admin_update_user(
-        user_code, UserAdminUpdate(is_active=new_status)
+        user_code, UserAdminUpdate(is_active=new_status), current_admin
     )
 
 
+@router.get(
+    "/users/{user_code}/balance-history",
+    response_model=BalanceHistory,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The system account has no balance history."
+        },
+        status.HTTP_404_NOT_FOUND: {"description": "User not found."},
+    },
+)
+async def get_user_balance_history(
+    user_code: str,
+    days: int = Query(30, ge=1, le=366, description="Days to include."),
+    banking_service: BankingService = Depends(get_banking_service),
+) -> Any:
+    """
+    Daily balance series and period totals for any member.
+    """
+    return await banking_service.get_balance_history(user_code, days)
+
+
+@router.get(
+    "/ledger/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+            "description": "Ledger rows, oldest first.",
+        },
+        status.HTTP_404_NOT_FOUND: {"description": "User not found."},
+    },
+)
+async def export_ledger(
+    format: ExportFormat = Query("csv", description="csv or ndjson"),
+    start: Optional[date] = Query(None, description="First day (UTC)."),
+    end: Optional[date] = Query(None, description="Last day (UTC)."),
+    user_code: Optional[str] = Query(
+        None, description="Limit to one member; whole ledger if omitted."
+    ),
+    user_service: UserService = Depends(get_user_service),
+) -> StreamingResponse:
+    """
+    Stream the whole ledger (or one member's slice) for accounting/audits.
+    """
+    user_id = None
+    scope = "ledger"
+    if user_code:
+        user = await user_service.get_user_by_code(user_code)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        user_id, scope = user.id, user.user_code
+
+    return StreamingResponse(
+        stream_transactions(format, user_id, start, end),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": "attachment; filename="
+            + export_filename(format, scope)
+        },
+    )
+
+
+@router.get(
+    "/ledger/audit",
+    response_model=LedgerAuditReport,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "description": "The ledger auditor has not run yet."
+        },
+    },
+)
+async def get_ledger_audit(service: AdminServiceDep) -> Any:
+    """
+    Latest ledger consistency audit: accounts whose balance disagrees with
+    their transaction history, plus the zero-sum totals as of that run.
+    """
+    report = await service.get_ledger_audit_report()
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No ledger audit has run yet",
+        )
+    return report
+
+
 """TAG MANAGEMENT"""
 
 
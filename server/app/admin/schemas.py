@@ -5,7 +5,7 @@ from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
-from app.banking.enums import PaymentStatus
+from app.banking.enums import Currency, PaymentStatus
 from app.users.enums import TrustLevel, VerificationStatus
 
 
@@ -31,6 +31,50 @@ class SystemStats(BaseModel):
     pending_disputes: int = Field(
         ..., description="Count of unresolved disputes."
     )
+    ledger_audited_at: Optional[datetime] = Field(
+        default=None,
+        description="When the ledger auditor last finished; volumes are as of then. Null if it has never run (volumes are live).",
+    )
+    ledger_drift_count: Optional[int] = Field(
+        default=None,
+        description="Accounts whose balance disagreed with their transaction history in the last audit.",
+    )
+
+
+class MetricsSnapshot(BaseModel):
+    counters: dict[str, float] = Field(
+        ...,
+        description='Monotonic counters keyed as name{label="value"}.',
+    )
+    gauges: dict[str, float] = Field(
+        ..., description="Point-in-time values keyed the same way."
+    )
+
+
+class LedgerAuditFindingView(BaseModel):
+    user_code: str
+    currency: Currency
+    expected: Decimal = Field(
+        ..., description="Balance implied by the transaction history."
+    )
+    actual: Decimal = Field(..., description="Balance on the account.")
+
+
+class LedgerAuditReport(BaseModel):
+    started_at: datetime
+    finished_at: datetime
+    checkpoint_xid: Optional[int] = Field(
+        ...,
+        description="Transactions written by database transactions below this id are folded in.",
+    )
+    transactions_scanned: int = Field(
+        ..., description="New transactions folded in by this run."
+    )
+    accounts_checked: int
+    drift_count: int
+    total_time: int
+    total_regio: Decimal
+    findings: List[LedgerAuditFindingView]
 
 
 # USER MANAGEMENT
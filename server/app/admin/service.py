@@ -10,6 +10,8 @@ from sqlmodel import col, desc, func, or_, select
 from app.admin.schemas import (
     BroadcastCreate,
     DisputePublic,
+    LedgerAuditFindingView,
+    LedgerAuditReport,
     SystemStats,
     TagAdminUpdate,
     TagAdminView,
@@ -19,13 +21,18 @@ from app.admin.schemas import (
 )
 from app.banking.enums import Currency, PaymentStatus
 from app.banking.exceptions import PaymentRequestNotFound
-from app.banking.models import Account, PaymentRequest
-from app.listings.enums import ListingStatus
+from app.banking.ledger import audit_totals
+from app.banking.models import LedgerAuditFinding, PaymentRequest
+from app.banking.service import BankingService
+from app.listings.cache import invalidate_feed
 from app.listings.exceptions import TagNotFound
-from app.listings.models import Listing, ListingTagLink, Tag
+from app.listings.models import Tag
+from app.listings.service import ListingService
+from app.listings.tag_index import refresh_tag_index, tag_index
 from app.users.enums import VerificationStatus
 from app.users.exceptions import UserNotFound
 from app.users.models import User
+from app.users.principal import principal_cache
 from app.users.service import UserService
 
 
@@ -51,17 +58,14 @@ class AdminService:
         )
 
         # Zero-sum ledger: net balance across all accounts (incl. negatives)
-        # should settle to ~0. Summing every account surfaces that invariant.
-        total_time = await self.session.execute(
-            select(func.sum(Account.balance_time)).where(
-                Account.type == Currency.TIME
-            )
-        )
-        total_regio = await self.session.execute(
-            select(func.sum(Account.balance_regio)).where(
-                Account.type == Currency.REGIO
-            )
-        )
+        # should settle to ~0. The ledger auditor sums every account on its
+        # schedule; only fall back to live sums before its first run.
+        audit = await BankingService(self.session).get_last_ledger_audit()
+        if audit:
+            total_time, total_regio = audit.total_time, audit.total_regio
+        else:
+            totals = (await self.session.execute(audit_totals())).one()
+            total_time, total_regio = totals.total_time, totals.total_regio
 
         pending = await self.session.execute(
             select(func.count(PaymentRequest.id)).where(
@@ -75,9 +79,47 @@ class AdminService:
             active_users=active_users.one()[0] or 0,
             verification_pending_users=verification_pending_users.one()[0]
             or 0,
-            total_time_volume=total_time.one()[0] or 0,
-            total_regio_volume=total_regio.one()[0] or 0,
+            total_time_volume=total_time,
+            total_regio_volume=total_regio,
             pending_disputes=pending.one()[0] or 0,
+            ledger_audited_at=audit.finished_at if audit else None,
+            ledger_drift_count=audit.drift_count if audit else None,
+        )
+
+    async def get_ledger_audit_report(self) -> Optional[LedgerAuditReport]:
+        """
+        Latest ledger audit with its drift findings, or None if the auditor
+        has not run yet.
+        """
+        audit = await BankingService(self.session).get_last_ledger_audit()
+        if not audit:
+            return None
+
+        stmt = (
+            select(LedgerAuditFinding, User.user_code)
+            .join(User, col(User.id) == LedgerAuditFinding.user_id)
+            .where(LedgerAuditFinding.run_id == audit.id)
+            .order_by(User.user_code, LedgerAuditFinding.currency)
+        )
+        findings = [
+            LedgerAuditFindingView(
+                user_code=user_code,
+                currency=finding.currency,
+                expected=finding.expected,
+                actual=finding.actual,
+            )
+            for finding, user_code in (await self.session.execute(stmt)).all()
+        ]
+        return LedgerAuditReport(
+            started_at=audit.started_at,
+            finished_at=audit.finished_at,
+            checkpoint_xid=audit.checkpoint_xid,
+            transactions_scanned=audit.transactions_scanned,
+            accounts_checked=audit.accounts_checked,
+            drift_count=audit.drift_count,
+            total_time=audit.total_time,
+            total_regio=audit.total_regio,
+            findings=findings,
         )
 
     # USER MANAGEMENT
@@ -107,6 +149,7 @@ class AdminService:
         self.session.add(db_user)
         await self.session.commit()
         await self.session.refresh(db_user)
+        await principal_cache.invalidate(db_user.id)
         return db_user
 
     async def get_users_rich(
@@ -203,14 +246,8 @@ class AdminService:
             base_stmt = base_stmt.where(Tag.is_official)
 
         if q:
-            ilike = f"%{q}%"
             base_stmt = base_stmt.where(
-                or_(
-                    Tag.name.ilike(ilike),
-                    Tag.name_de.ilike(ilike),
-                    Tag.name_en.ilike(ilike),
-                    Tag.name_hu.ilike(ilike),
-                )
+                col(Tag.id).in_(tag_index.matching_ids(q))
             )
 
         total = (
@@ -229,24 +266,6 @@ class AdminService:
             .all()
         )
 
-        if not tags:
-            return TagsAdminListResponse(data=[], count=total)
-
-        # Count active listings per tag, scoped to the tags on this page
-        stats_stmt = (
-            select(ListingTagLink.tag_id, func.count(Listing.id))
-            .join(Listing, col(Listing.id) == ListingTagLink.listing_id)
-            .where(
-                Listing.status == ListingStatus.ACTIVE,
-                col(ListingTagLink.tag_id).in_([t.id for t in tags]),
-            )
-            .group_by(col(ListingTagLink.tag_id))
-        )
-        usage_map = {
-            row[0]: row[1]
-            for row in (await self.session.execute(stats_stmt)).all()
-        }
-
         results = [
             TagAdminView(
                 id=t.id,
@@ -255,7 +274,7 @@ class AdminService:
                 name_en=t.name_en,
                 name_hu=t.name_hu,
                 is_official=t.is_official,
-                usage_count=usage_map.get(t.id, 0),
+                usage_count=t.usage_count,
             )
             for t in tags
         ]
@@ -271,8 +290,14 @@ class AdminService:
         tag.sqlmodel_update(data)
 
         self.session.add(tag)
+        listing_service = ListingService(self.session)
+        await listing_service.refresh_feed_cards(
+            await listing_service.tagged_listing_ids(tag_id)
+        )
         await self.session.commit()
         await self.session.refresh(tag)
+        await invalidate_feed()  # feed cards show localized tag labels
+        await refresh_tag_index()
         return tag
 
     async def delete_tag(self, tag_id: int):
@@ -280,8 +305,13 @@ class AdminService:
         tag = await self.session.get(Tag, tag_id)
         if not tag:
             raise TagNotFound()
+        listing_service = ListingService(self.session)
+        tagged = await listing_service.tagged_listing_ids(tag_id)
         await self.session.delete(tag)
+        await listing_service.refresh_feed_cards(tagged)
         await self.session.commit()
+        await invalidate_feed()
+        await refresh_tag_index()
         # No return, route returns 204 (no content)
 
     # BROADCAST
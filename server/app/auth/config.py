@@ -8,6 +8,26 @@ class AuthConfig(RegioBaseSettings):
 
     ALGORITHM: str
 
+    # Per-worker cache of the user fields the auth checks read (see
+    # app/users/principal.py). Changes are pushed to every worker over
+    # Redis; the TTL bounds staleness if a message is lost.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_SIZE: int = 10000
+
+    # Argon2 hashing threads per worker (0 = one per CPU) and how many
+    # calls may wait for one before new logins get a 503
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
+
+    # Rate limits (token buckets, see app/core/rate_limit.py). Each allows
+    # a burst of N and refills N per period.
+    LOGIN_LIMIT_PER_MINUTE_IP: int = 20
+    LOGIN_LIMIT_PER_MINUTE_ACCOUNT: int = 5
+    REGISTER_LIMIT_PER_HOUR_IP: int = 10
+    REGISTER_LIMIT_PER_HOUR_INVITE: int = 10
+    PASSWORD_RESET_LIMIT_PER_HOUR_IP: int = 10
+    PASSWORD_RESET_LIMIT_PER_HOUR_ACCOUNT: int = 3
+
     # Password reset
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 30
     PASSWORD_RESET_BASE_URL: str = "http://localhost:3000/reset-password"
@@ -2,12 +2,40 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.auth.config import auth_settings
 from app.auth.service import AuthService
 from app.core.database import SessionDep
+from app.core.rate_limit import RateLimiter
+from app.core.redis import RedisDep
 
 
-def get_auth_service(session: SessionDep) -> AuthService:
-    return AuthService(session)
+def get_auth_service(session: SessionDep, redis: RedisDep) -> AuthService:
+    return AuthService(session, redis)
 
 
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
+
+
+# RATE LIMITS
+# Used as dependencies they key on the client IP; call .check() with the
+# email or invite code for the per-account limit.
+login_ip_limit = RateLimiter(
+    "login_ip", auth_settings.LOGIN_LIMIT_PER_MINUTE_IP, 60
+)
+login_account_limit = RateLimiter(
+    "login_account", auth_settings.LOGIN_LIMIT_PER_MINUTE_ACCOUNT, 60
+)
+register_ip_limit = RateLimiter(
+    "register_ip", auth_settings.REGISTER_LIMIT_PER_HOUR_IP, 3600
+)
+register_invite_limit = RateLimiter(
+    "register_invite", auth_settings.REGISTER_LIMIT_PER_HOUR_INVITE, 3600
+)
+password_reset_ip_limit = RateLimiter(
+    "password_reset_ip", auth_settings.PASSWORD_RESET_LIMIT_PER_HOUR_IP, 3600
+)
+password_reset_account_limit = RateLimiter(
+    "password_reset_account",
+    auth_settings.PASSWORD_RESET_LIMIT_PER_HOUR_ACCOUNT,
+    3600,
+)
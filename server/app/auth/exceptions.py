@@ -67,3 +67,16 @@ class InviteCodeDepleted(BadAuthRequest):
 
 class InvalidOrExpiredResetToken(BadAuthRequest):
     detail = "Password reset token is invalid or has expired"
+
+
+# ==========================================
+# Category: 503 Service Unavailable
+# ==========================================
+class AuthUnavailable(AuthBaseException):
+    """Base for 503 errors (Temporarily overloaded, retry later)"""
+
+    pass
+
+
+class PasswordHashingBusy(AuthUnavailable):
+    detail = "Too many sign-ins in progress, please try again shortly"
@@ -1,7 +1,12 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from app.auth.exceptions import BadAuthRequest, NotAuthorized, PermissionDenied
+from app.auth.exceptions import (
+    AuthUnavailable,
+    BadAuthRequest,
+    NotAuthorized,
+    PermissionDenied,
+)
 
 
 async def not_authorized_handler(request: Request, exc: NotAuthorized):
@@ -39,3 +44,14 @@ async def bad_auth_request_handler(request: Request, exc: BadAuthRequest):
         content={"detail": exc.detail},
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+async def auth_unavailable_handler(request: Request, exc: AuthUnavailable):
+    """
+    Catches 503 errors (PasswordHashingBusy, etc).
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.detail},
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,106 @@
+"""
+Revoked access tokens, checked on every authenticated request.
+
+Logout blacklists the access token's JTI in Redis, but looking it up
+there per request would add a network hop to every API call. Instead each
+worker keeps the revoked JTIs in memory, so the common "not revoked"
+check is a set lookup. Access tokens live ACCESS_TOKEN_EXPIRE_MINUTES,
+so the set only ever holds the last few minutes' logouts and entries are
+dropped once their token has expired.
+
+Revocations are shared through Redis: a sorted set of JTIs scored by
+expiry (read when a worker subscribes) plus a pub/sub channel that
+pushes each new one to every worker. While the subscription is down the
+check falls back to the ``blacklist:{jti}`` key itself.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.core.metrics import metrics
+from app.core.redis import get_redis, subscribe
+
+logger = logging.getLogger(__name__)
+
+_CHANNEL = "auth:revoked"
+_REVOKED_KEY = "auth:revoked:access"
+
+
+class RevokedTokens:
+    def __init__(self):
+        # JTI -> expiry (unix seconds) of the revoked token
+        self._revoked: dict[str, float] = {}
+        self._synced = False
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        now = time.time()
+        if expires_at > now:
+            self._revoked[jti] = expires_at
+        # Entries can go once their token would be rejected as expired
+        for expired in [j for j, exp in self._revoked.items() if exp <= now]:
+            del self._revoked[expired]
+        metrics.set_gauge("revoked_access_tokens", len(self._revoked))
+
+    def _handle(self, message: str) -> None:
+        jti, _, expires_at = message.partition(":")
+        self._add(jti, float(expires_at))
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Revokes an access token here and, through Redis, on every worker."""
+        self._add(jti, expires_at)
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.zadd(_REVOKED_KEY, {jti: expires_at})
+                pipe.zremrangebyscore(_REVOKED_KEY, "-inf", time.time())
+                pipe.publish(_CHANNEL, f"{jti}:{expires_at}")
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            metrics.incr("token_revocation_errors_total", op="publish")
+            logger.error(f"Failed to publish token revocation: {e}")
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        """
+        Whether the access token was revoked. No I/O while the worker is
+        subscribed; otherwise the Redis blacklist is asked directly, and
+        if Redis is unreachable too the token is let through (it expires
+        within minutes anyway).
+        """
+        if not jti:
+            return False
+        if jti in self._revoked:
+            return self._revoked[jti] > time.time()
+        if self._synced:
+            return False
+        try:
+            return await get_redis().exists(f"blacklist:{jti}") > 0
+        except (RedisError, OSError) as e:
+            metrics.incr("token_revocation_errors_total", op="check")
+            logger.warning(f"Token revocation check unavailable: {e}")
+            return False
+
+    async def _resync(self) -> None:
+        # Catch up on revocations published while unsubscribed
+        revoked = await get_redis().zrangebyscore(
+            _REVOKED_KEY, time.time(), "+inf", withscores=True
+        )
+        for jti, expires_at in revoked:
+            self._add(jti, expires_at)
+        self._synced = True
+
+    def _desync(self) -> None:
+        self._synced = False
+
+    async def listen(self) -> None:
+        """Receives revocations from other workers; run as a task."""
+        await subscribe(
+            _CHANNEL,
+            self._handle,
+            on_subscribe=self._resync,
+            on_disconnect=self._desync,
+        )
+
+
+revoked_tokens = RevokedTokens()
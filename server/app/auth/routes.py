@@ -11,7 +11,13 @@ from fastapi import (
 )
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.auth.dependencies import AuthServiceDep
+from app.auth.dependencies import (
+    AuthServiceDep,
+    login_account_limit,
+    login_ip_limit,
+    password_reset_account_limit,
+    password_reset_ip_limit,
+)
 from app.auth.schemas import (
     PasswordResetConfirm,
     PasswordResetRequest,
@@ -35,7 +41,11 @@ router = APIRouter()
         },
         status.HTTP_400_BAD_REQUEST: {"description": "Inactive user account"},
         status.HTTP_403_FORBIDDEN: {"description": "Account not verified"},
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "description": "Too many login attempts"
+        },
     },
+    dependencies=[Depends(login_ip_limit)],
 )
 async def login_access_token(
     response: Response,
@@ -50,6 +60,8 @@ async def login_access_token(
     - **username**: User's email address.
     - **password**: User's plain text password.
     """
+    # Before the user lookup and the Argon2 verify
+    await login_account_limit.check(form_data.username)
 
     token_data = await service.authenticate_user(
         form_data.username, form_data.password
@@ -148,6 +160,12 @@ async def logout(
     "/password-reset/request",
     response_model=Message,
     status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "description": "Too many reset requests"
+        }
+    },
+    dependencies=[Depends(password_reset_ip_limit)],
 )
 async def request_password_reset(
     body: PasswordResetRequest,
@@ -159,6 +177,7 @@ async def request_password_reset(
 
     Always returns 200 regardless of whether the email is registered.
     """
+    await password_reset_account_limit.check(body.email)
     email_data = await service.request_password_reset(body.email)
     if email_data:
         background_tasks.add_task(send_password_reset_email_task, email_data)
@@ -174,8 +193,12 @@ async def request_password_reset(
     responses={
         status.HTTP_400_BAD_REQUEST: {
             "description": "Token is invalid or has expired"
-        }
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "description": "Too many reset attempts"
+        },
     },
+    dependencies=[Depends(password_reset_ip_limit)],
 )
 async def confirm_password_reset(
     body: PasswordResetConfirm,
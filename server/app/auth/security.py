@@ -1,11 +1,85 @@
+"""
+Password hashing.
+
+Argon2 is deliberately slow (tens of milliseconds per hash), so hashing
+and verification never run on the event loop. They go to a dedicated
+thread pool sized to the CPU count; argon2-cffi releases the GIL while
+hashing, so throughput scales with cores. At most
+PASSWORD_HASH_QUEUE_LIMIT calls wait for a free thread. Beyond that the
+call fails fast with PasswordHashingBusy (503) rather than queueing
+logins behind each other.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 from pwdlib import PasswordHash
 
+from app.auth.config import auth_settings
+from app.auth.exceptions import PasswordHashingBusy
+from app.core.metrics import metrics
+
 PASSWORD_HASH = PasswordHash.recommended()
 
+T = TypeVar("T")
+
+
+class HashingPool:
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        # Calls submitted and not yet finished; only touched on the loop
+        self._pending = 0
+
+    def _record_depth(self) -> None:
+        metrics.set_gauge(
+            "password_hash_in_flight", min(self._pending, self.workers)
+        )
+        metrics.set_gauge(
+            "password_hash_queue_depth", max(self._pending - self.workers, 0)
+        )
+
+    def _release(self, _future: Future) -> None:
+        self._pending -= 1
+        self._record_depth()
+
+    async def run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        if self._pending >= self.workers + self.queue_limit:
+            metrics.incr("password_hash_rejected_total", op=operation)
+            raise PasswordHashingBusy()
+
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        self._record_depth()
+        metrics.incr("password_hash_total", op=operation)
+        future = self._executor.submit(fn, *args)
+        # Released when the thread finishes, even if the request was
+        # cancelled meanwhile: the hash still occupies the thread
+        future.add_done_callback(
+            lambda done: loop.call_soon_threadsafe(self._release, done)
+        )
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+hashing_pool = HashingPool(
+    workers=auth_settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+    queue_limit=auth_settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
+
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return PASSWORD_HASH.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run(
+        "verify", PASSWORD_HASH.verify, plain_password, hashed_password
+    )
 
 
-def get_password_hash(password: str) -> str:
-    return PASSWORD_HASH.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await hashing_pool.run("hash", PASSWORD_HASH.hash, password)
@@ -5,7 +5,6 @@ import string
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
-from urllib.parse import urlparse
 
 import jwt
 from redis.asyncio import Redis
@@ -24,6 +23,7 @@ from app.auth.exceptions import (
     RefreshTokenExpired,
 )
 from app.auth.models import Invite
+from app.auth.revocation import revoked_tokens
 from app.auth.schemas import InvitePublic, Token
 from app.auth.security import get_password_hash, verify_password
 from app.auth.utils import (
@@ -31,27 +31,20 @@ from app.auth.utils import (
     create_refresh_token,
     decode_token,
 )
-from app.core.config import settings
+from app.core.redis import get_redis
 from app.email.schemas import PasswordResetEmailData
 from app.users.models import User
+from app.users.principal import principal_cache
 
 logger = logging.getLogger(__name__)
 
 
 class AuthService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, redis: Optional[Redis] = None):
         self.session = session
-        # Initialize Redis for token blacklisting
-        _ssl_kwargs = (
-            {"ssl_cert_reqs": None}
-            if urlparse(settings.REDIS_URL).scheme == "rediss"
-            else {}
-        )
-        self.redis = Redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-            **_ssl_kwargs,
-        )
+        # Token blacklist and reset tokens; the process-wide pool unless
+        # one is injected
+        self.redis = redis or get_redis()
 
     async def authenticate_user(self, email: str, password: str) -> Token:
         # Fetch User
@@ -61,7 +54,7 @@ class AuthService:
         user = result.scalar_one_or_none()
 
         # Verify Identity (Timing attack safe)
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await verify_password(password, user.password_hash):
             raise InvalidCredentials()
 
         if not user.is_active:
@@ -102,6 +95,9 @@ class AuthService:
                 if ttl > 0:
                     # Set blacklisted token in Redis with ttl as expiry time
                     await self.redis.setex(f"blacklist:{jti}", ttl, "true")
+                    # Access tokens are checked per request from memory
+                    if payload.get("type") == "access":
+                        await revoked_tokens.revoke(jti, exp)
         except Exception as e:
             # Skip blacklisting if token is already invalid/expired
             logger.error(f"Failed to blacklist token: {str(e)}")
@@ -319,7 +315,8 @@ class AuthService:
             raise InvalidOrExpiredResetToken()
 
         await self.redis.delete(f"pwd_reset:{token}")
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await get_password_hash(new_password)
         user.tokens_valid_from = datetime.now(timezone.utc)
         self.session.add(user)
         await self.session.commit()
+        await principal_cache.invalidate(user.id)
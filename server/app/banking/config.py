@@ -7,5 +7,24 @@ class BankingConfig(RegioBaseSettings):
     DEMURRAGE_THRESHOLD_MINUTES: int = 1800
     DEMURRAGE_RATE_ANNUAL: float = 0.06
 
+    # Retry budget for ledger writes that lose a lock or serialization race
+    CONFLICT_RETRY_ATTEMPTS: int = 4
+    CONFLICT_RETRY_BASE_DELAY_MS: int = 20
+    CONFLICT_RETRY_MAX_DELAY_MS: int = 500
+
+    # How often journaled sink credits are folded into the sink accounts
+    SINK_ROLLUP_INTERVAL_MINUTES: int = 10
+
+    # Members charged per set-based statement in fee / demurrage runs
+    LEDGER_BATCH_SIZE: int = 500
+
+    # Payment requests claimed per enforcer batch, and how many enforcer
+    # notification emails may be in flight at once
+    ENFORCER_BATCH_SIZE: int = 100
+    ENFORCER_EMAIL_CONCURRENCY: int = 10
+
+    # Ledger auditor cadence
+    LEDGER_AUDIT_INTERVAL_MINUTES: int = 15
+
 
 banking_settings = BankingConfig()
@@ -20,6 +20,16 @@ TRUST_LIMITS: Dict[TrustLevel, Tuple[int, Decimal]] = {
     TrustLevel.T6: (-1200, Decimal("-200.00")),
 }
 
+# Lowest to highest; used to decide whether a level change is an upgrade
+TRUST_LEVEL_ORDER = [
+    TrustLevel.T1,
+    TrustLevel.T2,
+    TrustLevel.T3,
+    TrustLevel.T4,
+    TrustLevel.T5,
+    TrustLevel.T6,
+]
+
 TRUST_UPGRADE_THRESHOLDS = [
     (TrustLevel.T5, 3000),
     (TrustLevel.T4, 1500),
@@ -1,9 +1,17 @@
+import asyncio
+import functools
 import logging
+import uuid
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import select, update
 
+from app.banking.config import banking_settings
 from app.banking.enums import PaymentStatus
 from app.banking.models import PaymentRequest
 from app.banking.service import BankingService
@@ -19,6 +27,8 @@ logger = logging.getLogger(__name__)
 REMINDER_AFTER_DAYS = 5
 ENFORCE_AFTER_DAYS = 7
 
+EmailJob = tuple[Hashable, Callable[[], Awaitable[None]]]
+
 
 async def run_payment_enforcer() -> None:
     """
@@ -26,20 +36,74 @@ async def run_payment_enforcer() -> None:
 
     - Day 5–6: send reminder email to debtor (once).
     - Day 7+: force-execute the payment if no dispute has been raised.
+
+    Work is claimed in batches with FOR UPDATE SKIP LOCKED, so several
+    workers can run the job side by side without double-processing a
+    request. Emails go out concurrently once each batch is committed.
     """
     logger.info("Payment enforcer: starting run")
     now = datetime.now(timezone.utc)
-    five_days_ago = now - timedelta(days=REMINDER_AFTER_DAYS)
-    seven_days_ago = now - timedelta(days=ENFORCE_AFTER_DAYS)
 
     async with AsyncSessionLocal() as session:
-        service = BankingService(session)
+        reminded = await _send_reminders(session, now)
+        executed = await _enforce_overdue(session, now)
+
+    logger.info(
+        f"Payment enforcer: done — {reminded} reminder(s), {executed} executed"
+    )
+
+
+async def _send_concurrently(jobs: list[EmailJob]) -> list[Hashable]:
+    """
+    Runs the email jobs with at most ENFORCER_EMAIL_CONCURRENCY in flight.
+    Returns the keys of the jobs that failed.
+    """
+    semaphore = asyncio.Semaphore(
+        max(1, banking_settings.ENFORCER_EMAIL_CONCURRENCY)
+    )
+
+    async def run(key: Hashable, send: Callable[[], Awaitable[None]]):
+        async with semaphore:
+            try:
+                await send()
+            except Exception as e:
+                logger.error(f"Enforcer: email failed for {key}: {e}")
+                return key
+        return None
+
+    results = await asyncio.gather(*(run(key, send) for key, send in jobs))
+    return [key for key in results if key is not None]
+
 
-        # ------------------------------------------------------------------ #
-        # REMINDERS — overdue by 5–6 days, not yet reminded, not disputed
-        # ------------------------------------------------------------------ #
-        reminder_stmt = (
-            select(PaymentRequest)
+async def _load_requests(
+    session: AsyncSession, request_ids: list[uuid.UUID]
+) -> list[PaymentRequest]:
+    stmt = (
+        select(PaymentRequest)
+        .where(PaymentRequest.id.in_(request_ids))
+        .order_by(PaymentRequest.created_at, PaymentRequest.id)
+        .options(
+            selectinload(PaymentRequest.creditor),
+            selectinload(PaymentRequest.debtor),
+        )
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+# ---------------------------------------------------------------------- #
+# REMINDERS — overdue by 5–6 days, not yet reminded, not disputed
+# ---------------------------------------------------------------------- #
+
+
+async def _send_reminders(session: AsyncSession, now: datetime) -> int:
+    five_days_ago = now - timedelta(days=REMINDER_AFTER_DAYS)
+    seven_days_ago = now - timedelta(days=ENFORCE_AFTER_DAYS)
+    after: Optional[tuple[datetime, uuid.UUID]] = None
+    reminded = 0
+
+    while True:
+        candidates = (
+            select(PaymentRequest.id)
             .where(
                 PaymentRequest.status == PaymentStatus.PENDING,
                 PaymentRequest.created_at < five_days_ago,
@@ -48,126 +112,184 @@ async def run_payment_enforcer() -> None:
                 PaymentRequest.reminder_sent_at.is_(None),
                 PaymentRequest.dispute_raised.is_(False),
             )
-            .options(
-                selectinload(PaymentRequest.creditor),
-                selectinload(PaymentRequest.debtor),
-            )
+            .order_by(PaymentRequest.created_at, PaymentRequest.id)
+            .limit(banking_settings.ENFORCER_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
         )
-        reminder_requests = (
-            (await session.execute(reminder_stmt)).scalars().all()
+        if after is not None:
+            candidates = candidates.where(
+                sa.tuple_(PaymentRequest.created_at, PaymentRequest.id) > after
+            )
+
+        # Stamping reminder_sent_at is the claim: once committed, no other
+        # worker (or later run) will pick these requests up again.
+        claim = (
+            update(PaymentRequest)
+            .where(PaymentRequest.id.in_(candidates.scalar_subquery()))
+            .values(reminder_sent_at=now)
+            .returning(PaymentRequest.id)
+            .execution_options(synchronize_session=False)
         )
+        claimed = list((await session.execute(claim)).scalars().all())
+        if not claimed:
+            await session.commit()
+            break
 
-        reminded = 0
-        for req in reminder_requests:
-            try:
-                days_pending = (
+        requests = await _load_requests(session, claimed)
+        emails = {
+            req.id: PaymentReminderEmailData(
+                user_first_name=req.debtor.first_name,
+                user_email=req.debtor.email,
+                creditor_name=req.creditor.full_name,
+                amount_time=req.amount_time,
+                amount_regio=float(req.amount_regio),
+                description=req.description,
+                days_pending=(
                     now - req.created_at.astimezone(timezone.utc)
-                ).days
-                await email_service.send_payment_reminder_email(
-                    PaymentReminderEmailData(
-                        user_first_name=req.debtor.first_name,
-                        user_email=req.debtor.email,
-                        creditor_name=req.creditor.full_name,
-                        amount_time=req.amount_time,
-                        amount_regio=float(req.amount_regio),
-                        description=req.description,
-                        days_pending=days_pending,
-                        language=req.debtor.language,
-                    )
+                ).days,
+                language=req.debtor.language,
+            )
+            for req in requests
+        }
+        after = (requests[-1].created_at, requests[-1].id)
+        await session.commit()
+
+        failed = await _send_concurrently(
+            [
+                (
+                    request_id,
+                    functools.partial(
+                        email_service.send_payment_reminder_email, data
+                    ),
                 )
-                req.reminder_sent_at = now
-                session.add(req)
-                await (
-                    session.commit()
-                )  # commit per-request so a crash mid-loop
-                reminded += 1  # doesn't cause duplicate reminder emails
-                logger.info(f"Enforcer: reminder sent for request {req.id}")
-            except Exception as e:
-                await session.rollback()
-                logger.error(
-                    f"Enforcer: reminder failed for request {req.id}: {e}"
+                for request_id, data in emails.items()
+            ]
+        )
+        # Release failed claims so the next run tries those reminders again
+        if failed:
+            await session.execute(
+                update(PaymentRequest)
+                .where(
+                    PaymentRequest.id.in_(failed),
+                    PaymentRequest.reminder_sent_at == now,
                 )
+                .values(reminder_sent_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+        reminded += len(emails) - len(failed)
+        logger.info(
+            f"Enforcer: {len(emails) - len(failed)} reminder(s) sent, "
+            f"{len(failed)} failed in batch"
+        )
+
+    return reminded
+
+
+# ---------------------------------------------------------------------- #
+# FORCE EXECUTE — overdue by 7+ days, not disputed
+# ---------------------------------------------------------------------- #
+
+
+def _enforced_email_jobs(req: PaymentRequest) -> list[EmailJob]:
+    """Notifies both parties of an auto-executed request."""
+    jobs = []
+    for is_creditor, user, other in [
+        (True, req.creditor, req.debtor),
+        (False, req.debtor, req.creditor),
+    ]:
+        data = PaymentEnforcedEmailData(
+            user_first_name=user.first_name,
+            user_email=user.email,
+            is_creditor=is_creditor,
+            other_party_name=other.full_name,
+            amount_time=req.amount_time,
+            amount_regio=float(req.amount_regio),
+            description=req.description,
+            language=user.language,
+        )
+        key = f"request {req.id} ({'creditor' if is_creditor else 'debtor'})"
+        jobs.append(
+            (
+                key,
+                functools.partial(
+                    email_service.send_payment_enforced_email, data
+                ),
+            )
+        )
+    return jobs
 
-        # ------------------------------------------------------------------ #
-        # FORCE EXECUTE — overdue by 7+ days, not disputed
-        # ------------------------------------------------------------------ #
-        enforce_stmt = (
-            select(PaymentRequest)
+
+async def _execute_batch(
+    service: BankingService, request_ids: list[uuid.UUID]
+) -> list[uuid.UUID]:
+    """
+    Executes a batch in one statement; if that fails, replays it request
+    by request so one bad row cannot block the rest.
+    """
+    try:
+        return await service.force_execute_payment_requests(request_ids)
+    except Exception as e:
+        await service.session.rollback()
+        logger.warning(
+            f"Enforcer: batch of {len(request_ids)} failed ({e}); "
+            f"retrying request by request"
+        )
+
+    executed = []
+    for request_id in request_ids:
+        try:
+            executed += await service.force_execute_payment_requests(
+                [request_id]
+            )
+        except Exception as e:
+            await service.session.rollback()
+            logger.error(
+                f"Enforcer: force-execute failed for request {request_id}: {e}"
+            )
+    return executed
+
+
+async def _enforce_overdue(session: AsyncSession, now: datetime) -> int:
+    seven_days_ago = now - timedelta(days=ENFORCE_AFTER_DAYS)
+    service = BankingService(session)
+    after: Optional[tuple[datetime, uuid.UUID]] = None
+    executed = 0
+
+    while True:
+        candidates = (
+            select(PaymentRequest.id, PaymentRequest.created_at)
             .where(
                 PaymentRequest.status == PaymentStatus.PENDING,
                 PaymentRequest.created_at < seven_days_ago,
                 PaymentRequest.dispute_raised.is_(False),
             )
-            .options(
-                selectinload(PaymentRequest.creditor),
-                selectinload(PaymentRequest.debtor),
-            )
-        )
-        enforce_requests = (
-            (await session.execute(enforce_stmt)).scalars().all()
+            .order_by(PaymentRequest.created_at, PaymentRequest.id)
+            .limit(banking_settings.ENFORCER_BATCH_SIZE)
         )
+        if after is not None:
+            candidates = candidates.where(
+                sa.tuple_(PaymentRequest.created_at, PaymentRequest.id) > after
+            )
+        rows = (await session.execute(candidates)).all()
+        if not rows:
+            await session.commit()
+            break
+        after = (rows[-1].created_at, rows[-1].id)
 
-        executed = 0
-        for req in enforce_requests:
-            # Snapshot user info before processing — session state may change
-            creditor_name = req.creditor.full_name
-            creditor_email = req.creditor.email
-            creditor_first_name = req.creditor.first_name
-            creditor_language = req.creditor.language
-            debtor_name = req.debtor.full_name
-            debtor_email = req.debtor.email
-            debtor_first_name = req.debtor.first_name
-            debtor_language = req.debtor.language
-            amount_time = req.amount_time
-            amount_regio = float(req.amount_regio)
-            description = req.description
+        # Rows another worker holds are skipped inside the claim and left
+        # to that worker; the keyset moves past them either way.
+        done = await _execute_batch(service, [row.id for row in rows])
+        if not done:
+            continue
 
-            try:
-                await service.force_execute_payment_request(req.id)
-                executed += 1
-                logger.info(f"Enforcer: force-executed request {req.id}")
-
-                # Notify both parties
-                for is_creditor, first_name, email, other_name, language in [
-                    (
-                        True,
-                        creditor_first_name,
-                        creditor_email,
-                        debtor_name,
-                        creditor_language,
-                    ),
-                    (
-                        False,
-                        debtor_first_name,
-                        debtor_email,
-                        creditor_name,
-                        debtor_language,
-                    ),
-                ]:
-                    try:
-                        await email_service.send_payment_enforced_email(
-                            PaymentEnforcedEmailData(
-                                user_first_name=first_name,
-                                user_email=email,
-                                is_creditor=is_creditor,
-                                other_party_name=other_name,
-                                amount_time=amount_time,
-                                amount_regio=amount_regio,
-                                description=description,
-                                language=language,
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Enforcer: notification failed for request {req.id} "
-                            f"({'creditor' if is_creditor else 'debtor'}): {e}"
-                        )
-            except Exception as e:
-                await session.rollback()
-                logger.error(
-                    f"Enforcer: force-execute failed for request {req.id}: {e}"
-                )
+        requests = await _load_requests(session, done)
+        jobs = [job for req in requests for job in _enforced_email_jobs(req)]
+        await session.commit()
 
-    logger.info(
-        f"Payment enforcer: done — {reminded} reminder(s), {executed} executed"
-    )
+        executed += len(done)
+        logger.info(f"Enforcer: force-executed {len(done)} request(s)")
+        await _send_concurrently(jobs)
+
+    return executed
@@ -59,6 +59,14 @@ class InvalidPaymentAction(BankingBadRequest):
     detail = "Invalid action performed on payment request"
 
 
+class InvalidHistoryCursor(BankingBadRequest):
+    detail = "Invalid history cursor"
+
+
+class BalanceHistoryUnavailable(BankingBadRequest):
+    detail = "No balance history is kept for the system account"
+
+
 # ==========================================
 # Category: 403 Forbidden
 # ==========================================
@@ -84,6 +92,11 @@ class BankingConflict(BankingBaseException):
 class TransactionConflict(BankingConflict):
     detail = "Transaction conflict detected. Please retry."
 
+    def __init__(self, detail: str = None, accounts: tuple[str, ...] = ()):
+        # User codes whose accounts were contended, for retry metrics
+        self.accounts = accounts
+        super().__init__(detail)
+
 
 class DisputeAlreadyRaised(BankingConflict):
     detail = "A dispute has already been raised for this payment request"
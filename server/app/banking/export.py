@@ -0,0 +1,126 @@
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Literal, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import aliased
+
+from app.banking.models import Transaction
+from app.core.database import AsyncSessionLocal
+from app.users.models import User
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_COLUMNS = [
+    "id",
+    "created_at",
+    "sender_code",
+    "receiver_code",
+    "amount_time",
+    "amount_regio",
+    "reference",
+    "is_system_fee",
+    "payment_request_id",
+]
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Rows fetched per round-trip from the server-side cursor
+FETCH_SIZE = 1000
+
+
+def _export_statement(
+    user_id: Optional[uuid.UUID],
+    start: Optional[date],
+    end: Optional[date],
+) -> sa.Select:
+    sender = aliased(User)
+    receiver = aliased(User)
+    statement = (
+        sa.select(
+            Transaction.id,
+            Transaction.created_at,
+            sender.user_code.label("sender_code"),
+            receiver.user_code.label("receiver_code"),
+            Transaction.amount_time,
+            Transaction.amount_regio,
+            Transaction.reference,
+            Transaction.is_system_fee,
+            Transaction.payment_request_id,
+        )
+        .join(sender, sender.id == Transaction.sender_id)
+        .join(receiver, receiver.id == Transaction.receiver_id)
+        .order_by(Transaction.created_at, Transaction.id)
+    )
+    if user_id is not None:
+        statement = statement.where(
+            sa.or_(
+                Transaction.sender_id == user_id,
+                Transaction.receiver_id == user_id,
+            )
+        )
+    # Dates are whole UTC days, both ends inclusive
+    if start is not None:
+        start_at = datetime.combine(start, time.min, tzinfo=timezone.utc)
+        statement = statement.where(Transaction.created_at >= start_at)
+    if end is not None:
+        end_at = datetime.combine(
+            end + timedelta(days=1), time.min, tzinfo=timezone.utc
+        )
+        statement = statement.where(Transaction.created_at < end_at)
+    return statement
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)  # UUID, Decimal
+
+
+async def stream_transactions(
+    fmt: ExportFormat,
+    user_id: Optional[uuid.UUID] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> AsyncIterator[str]:
+    """
+    Yields the ledger as CSV or NDJSON text, oldest first.
+
+    Rows come straight off a server-side cursor as plain tuples (no ORM
+    objects) and are written out one fetch batch at a time, so memory stays
+    flat however large the range is. Uses its own session because the
+    response body outlives the request's dependencies.
+    """
+    statement = _export_statement(user_id, start, end).execution_options(
+        yield_per=FETCH_SIZE
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(EXPORT_COLUMNS)
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(statement)
+        async for partition in result.partitions():
+            for row in partition:
+                if fmt == "csv":
+                    writer.writerow(row)
+                else:
+                    record = dict(zip(EXPORT_COLUMNS, row))
+                    buffer.write(json.dumps(record, default=_to_json))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_filename(fmt: ExportFormat, scope: str) -> str:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return f"transactions-{scope}-{stamp}.{fmt}"
@@ -20,15 +20,17 @@ async def run_monthly_fees() -> None:
             logger.error(f"Monthly fees: aborted — {e}")
             return
 
-    succeeded = sum(1 for r in results if r["status"] == "SUCCESS")
-    failed = [r for r in results if r["status"] == "FAILED"]
-    if failed:
+    if results["failed"]:
         logger.error(
-            f"Monthly fees: {len(failed)} collection(s) failed — "
-            + ", ".join(r["user"] for r in failed)
+            f"Monthly fees: {len(results['failed'])} collection(s) failed — "
+            + ", ".join(results["failed"])
         )
     logger.info(
-        f"Monthly fees: done — {succeeded} collected, {len(failed)} failed"
+        f"Monthly fees: done for {results['period']} — "
+        f"{results['charged']} collected "
+        f"({results['total_minutes']} minutes), "
+        f"{results['already_charged']} already charged, "
+        f"{len(results['failed'])} failed"
     )
 
 
@@ -47,7 +49,59 @@ async def run_demurrage() -> None:
             logger.error(f"Demurrage: aborted — {e}")
             return
 
+    if result["failed"]:
+        logger.error(
+            f"Demurrage: {len(result['failed'])} charge(s) failed — "
+            + ", ".join(result["failed"])
+        )
     logger.info(
         f"Demurrage: done — {result['processed_users']} user(s), "
-        f"{result['total_minutes_collected']} minutes collected"
+        f"{result['total_minutes_collected']} minutes collected in "
+        f"{result['duration_seconds']}s "
+        f"({result['accounts_per_second']} accounts/s)"
+    )
+
+
+async def run_sink_rollup() -> None:
+    """
+    Frequent job: apply journaled fee and demurrage credits to the system
+    sink accounts in one write.
+    """
+    async with AsyncSessionLocal() as session:
+        service = BankingService(session)
+        try:
+            result = await service.roll_up_sink_credits()
+        except Exception as e:
+            logger.error(f"Sink rollup: aborted — {e}")
+            return
+
+    if result["entries"]:
+        logger.info(
+            f"Sink rollup: applied {result['entries']} credit(s) — "
+            f"{result['amount_time']} minutes, "
+            f"{result['amount_regio']} Regio"
+        )
+
+
+async def run_ledger_audit() -> None:
+    """
+    Frequent job: check account balances against the transaction history
+    and record any drift for the admin dashboard.
+    """
+    async with AsyncSessionLocal() as session:
+        service = BankingService(session)
+        try:
+            run = await service.audit_ledger()
+        except Exception as e:
+            logger.error(f"Ledger audit: aborted — {e}")
+            return
+
+    if run is None:
+        logger.info("Ledger audit: skipped — another run is in progress")
+        return
+    log = logger.error if run.drift_count else logger.info
+    log(
+        f"Ledger audit: {run.accounts_checked} account(s) checked, "
+        f"{run.transactions_scanned} new transaction(s), "
+        f"{run.drift_count} drifting"
     )
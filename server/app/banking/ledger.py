@@ -0,0 +1,607 @@
+"""
+Set-based SQL building blocks shared by the ledger writers.
+
+Everything here returns SQLAlchemy statements; executing and committing
+is left to BankingService so each caller keeps its own unit of work.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.banking.constants import TRUST_LEVEL_ORDER, TRUST_UPGRADE_THRESHOLDS
+from app.banking.enums import Currency
+from app.banking.models import (
+    Account,
+    LedgerAuditBalance,
+    LedgerDailySummary,
+    SinkCredit,
+    Transaction,
+    TransactionCounter,
+)
+from app.users.enums import TrustLevel
+from app.users.models import User
+
+
+def sink_credit_insert(
+    amount_time,
+    amount_regio,
+    now: datetime,
+    transaction_id=None,
+    where=None,
+) -> sa.Insert:
+    """
+    Journals a credit to the system sink. Amounts may be literals or SQL
+    expressions; `where` gates the insert inside a larger statement.
+    """
+    select = sa.select(
+        _as_sql(transaction_id, sa.Uuid),
+        _as_sql(amount_time, sa.Integer),
+        _as_sql(amount_regio, sa.Numeric(10, 2)),
+        sa.literal(now, sa.DateTime(timezone=True)),
+    )
+    if where is not None:
+        select = select.where(where)
+    return sa.insert(SinkCredit).from_select(
+        ["transaction_id", "amount_time", "amount_regio", "created_at"],
+        select,
+    )
+
+
+def transaction_counter_upsert(recorded: sa.CTE, sink_code: str) -> sa.Insert:
+    """
+    Ledger hook: bumps the per-member transaction counters for every row in
+    `recorded` (a CTE exposing sender_id and receiver_id). The sink is
+    skipped so its counter never becomes a hot row.
+    """
+    sink_id = sa.select(User.id).where(User.user_code == sink_code)
+    parties = sa.union_all(
+        sa.select(recorded.c.sender_id.label("user_id")),
+        sa.select(recorded.c.receiver_id),
+    ).subquery("parties")
+    insert = pg_insert(TransactionCounter).from_select(
+        ["user_id", "total"],
+        sa.select(parties.c.user_id, sa.func.count())
+        .where(parties.c.user_id != sink_id.scalar_subquery())
+        .group_by(parties.c.user_id),
+    )
+    return insert.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={"total": TransactionCounter.total + insert.excluded.total},
+    )
+
+
+def daily_summary_upsert(recorded: sa.CTE, sink_code: str) -> sa.Insert:
+    """
+    Ledger hook: folds every row in `recorded` (sender_id, receiver_id,
+    amount_time, amount_regio, is_system_fee, created_at) into the
+    per-member daily summaries. The sink is skipped, as for counters.
+    """
+    sink_id = sa.select(User.id).where(User.user_code == sink_code)
+    day = sa.cast(sa.func.timezone("UTC", recorded.c.created_at), sa.Date)
+    zero_time = sa.literal(0, sa.Integer)
+    zero_regio = sa.literal(Decimal(0), sa.Numeric(12, 2))
+
+    legs = sa.union_all(
+        sa.select(
+            recorded.c.sender_id.label("user_id"),
+            day.label("day"),
+            zero_time.label("time_in"),
+            recorded.c.amount_time.label("time_out"),
+            zero_regio.label("regio_in"),
+            recorded.c.amount_regio.label("regio_out"),
+            sa.case(
+                (recorded.c.is_system_fee, recorded.c.amount_time),
+                else_=zero_time,
+            ).label("fee_time"),
+            sa.case(
+                (recorded.c.is_system_fee, recorded.c.amount_regio),
+                else_=zero_regio,
+            ).label("fee_regio"),
+        ),
+        sa.select(
+            recorded.c.receiver_id,
+            day,
+            recorded.c.amount_time,
+            zero_time,
+            recorded.c.amount_regio,
+            zero_regio,
+            zero_time,
+            zero_regio,
+        ),
+    ).subquery("legs")
+
+    sums = ["time_in", "time_out", "regio_in", "regio_out"]
+    sums += ["fee_time", "fee_regio"]
+    insert = pg_insert(LedgerDailySummary).from_select(
+        ["user_id", "day", *sums, "transaction_count"],
+        sa.select(
+            legs.c.user_id,
+            legs.c.day,
+            *[sa.func.sum(legs.c[name]) for name in sums],
+            sa.func.count(),
+        )
+        .where(legs.c.user_id != sink_id.scalar_subquery())
+        .group_by(legs.c.user_id, legs.c.day),
+    )
+    summary = LedgerDailySummary.__table__.c
+    return insert.on_conflict_do_update(
+        index_elements=["user_id", "day"],
+        set_={
+            name: summary[name] + insert.excluded[name]
+            for name in [*sums, "transaction_count"]
+        },
+    )
+
+
+def pending_sink_credits() -> sa.Select:
+    """Totals journaled to the sink but not yet rolled up."""
+    return sa.select(
+        sa.func.coalesce(sa.func.sum(SinkCredit.amount_time), 0),
+        sa.func.coalesce(sa.func.sum(SinkCredit.amount_regio), Decimal(0)),
+    ).where(SinkCredit.rolled_up_at.is_(None))
+
+
+def sink_rollup_statement(sink_code: str, now: datetime) -> sa.Select:
+    """
+    Claims every pending journal entry and applies the totals to the sink's
+    TIME and REGIO accounts (and its earned-time counter) in one statement.
+    Returns a single row: entries, amount_time, amount_regio.
+    """
+    sink_id = sa.select(User.id).where(User.user_code == sink_code)
+    sink_id = sink_id.scalar_subquery()
+
+    claimed = (
+        sa.update(SinkCredit)
+        .where(SinkCredit.rolled_up_at.is_(None), sink_id.is_not(None))
+        .values(rolled_up_at=now)
+        .returning(SinkCredit.amount_time, SinkCredit.amount_regio)
+        .cte("claimed")
+    )
+    totals = sa.select(
+        sa.func.count().label("entries"),
+        sa.func.coalesce(sa.func.sum(claimed.c.amount_time), 0).label(
+            "amount_time"
+        ),
+        sa.func.coalesce(
+            sa.func.sum(claimed.c.amount_regio), Decimal(0)
+        ).label("amount_regio"),
+    ).cte("totals")
+
+    applied = (
+        sa.update(Account)
+        .where(Account.user_id == sink_id, totals.c.entries > 0)
+        .values(
+            balance_time=Account.balance_time
+            + sa.case(
+                (Account.type == Currency.TIME, totals.c.amount_time),
+                else_=0,
+            ),
+            balance_regio=Account.balance_regio
+            + sa.case(
+                (Account.type == Currency.REGIO, totals.c.amount_regio),
+                else_=Decimal(0),
+            ),
+            version=Account.version + 1,
+        )
+        .returning(Account.id)
+        .cte("applied")
+    )
+    # Column onupdate defaults are not applied inside a CTE
+    earned = (
+        sa.update(User)
+        .where(User.id == sink_id, totals.c.entries > 0)
+        .values(
+            total_time_earned=User.total_time_earned + totals.c.amount_time,
+            updated_at=now,
+        )
+        .returning(User.id)
+        .cte("earned")
+    )
+
+    return sa.select(
+        totals.c.entries, totals.c.amount_time, totals.c.amount_regio
+    ).add_cte(applied, earned)
+
+
+def bulk_transfer_statement(
+    batch: sa.CTE,
+    sink_code: str,
+    now: datetime,
+    is_system_fee: bool = False,
+    demurrage_calc_at: datetime | None = None,
+) -> sa.Select:
+    """
+    Set-based counterpart of `BankingService.transfer_funds` for system jobs.
+
+    `batch` yields one row per transfer with sender_id, receiver_id,
+    amount_time, amount_regio and reference, and optionally fee_period and
+    payment_request_id. Trust limits are not checked (system jobs always
+    bypassed them). Transactions are inserted first; a row whose
+    (sender_id, fee_period) already exists is skipped, and only recorded
+    rows move money: per-member deltas are applied with one UPDATE ... FROM,
+    receivers' earned time and trust level are bumped, and everything owed
+    to the sink becomes a single journal entry. With `demurrage_calc_at`
+    the senders' TIME accounts also get `last_demurrage_calc` advanced in
+    the same write.
+
+    Returns one row per transaction actually recorded.
+    """
+    sink_id = sa.select(User.id).where(User.user_code == sink_code)
+    sink_id = sink_id.scalar_subquery()
+
+    recorded = (
+        pg_insert(Transaction)
+        .from_select(
+            [
+                "id",
+                "sender_id",
+                "receiver_id",
+                "amount_time",
+                "amount_regio",
+                "reference",
+                "payment_request_id",
+                "fee_period",
+                "is_system_fee",
+                "created_at",
+            ],
+            sa.select(
+                sa.func.gen_random_uuid(),
+                batch.c.sender_id,
+                batch.c.receiver_id,
+                batch.c.amount_time,
+                batch.c.amount_regio,
+                batch.c.reference,
+                _batch_column(batch, "payment_request_id", sa.Uuid),
+                _batch_column(batch, "fee_period", sa.String),
+                sa.literal(is_system_fee),
+                sa.literal(now, sa.DateTime(timezone=True)),
+            ),
+        )
+        .on_conflict_do_nothing(
+            index_elements=["sender_id", "fee_period"],
+            index_where=Transaction.fee_period.is_not(None),
+        )
+        .returning(
+            Transaction.id,
+            Transaction.sender_id,
+            Transaction.receiver_id,
+            Transaction.amount_time,
+            Transaction.amount_regio,
+            Transaction.payment_request_id,
+            Transaction.is_system_fee,
+            Transaction.created_at,
+        )
+        .cte("recorded")
+    )
+
+    # Net movement per member: debits for senders, credits for receivers
+    # other than the sink (whose share is journaled below).
+    legs = sa.union_all(
+        sa.select(
+            recorded.c.sender_id.label("user_id"),
+            (-recorded.c.amount_time).label("delta_time"),
+            (-recorded.c.amount_regio).label("delta_regio"),
+        ),
+        sa.select(
+            recorded.c.receiver_id,
+            recorded.c.amount_time,
+            recorded.c.amount_regio,
+        ).where(recorded.c.receiver_id != sink_id),
+    ).subquery("legs")
+    deltas = (
+        sa.select(
+            legs.c.user_id,
+            sa.func.sum(legs.c.delta_time).label("delta_time"),
+            sa.func.sum(legs.c.delta_regio).label("delta_regio"),
+        )
+        .group_by(legs.c.user_id)
+        .cte("deltas")
+    )
+    account_values = {
+        "balance_time": Account.balance_time
+        + sa.case(
+            (Account.type == Currency.TIME, deltas.c.delta_time),
+            else_=0,
+        ),
+        "balance_regio": Account.balance_regio
+        + sa.case(
+            (Account.type == Currency.REGIO, deltas.c.delta_regio),
+            else_=Decimal(0),
+        ),
+        "version": Account.version + 1,
+    }
+    if demurrage_calc_at is not None:
+        account_values["last_demurrage_calc"] = sa.case(
+            (
+                sa.and_(
+                    Account.type == Currency.TIME,
+                    Account.user_id.in_(sa.select(recorded.c.sender_id)),
+                ),
+                sa.literal(demurrage_calc_at, sa.DateTime(timezone=True)),
+            ),
+            else_=Account.last_demurrage_calc,
+        )
+    moved = (
+        sa.update(Account)
+        .where(
+            Account.user_id == deltas.c.user_id,
+            sa.or_(
+                sa.and_(
+                    Account.type == Currency.TIME, deltas.c.delta_time != 0
+                ),
+                sa.and_(
+                    Account.type == Currency.REGIO,
+                    deltas.c.delta_regio != 0,
+                ),
+            ),
+        )
+        .values(account_values)
+        .returning(Account.id)
+        .cte("moved")
+    )
+
+    earnings = (
+        sa.select(
+            recorded.c.receiver_id.label("user_id"),
+            sa.func.sum(recorded.c.amount_time).label("amount_time"),
+        )
+        .where(recorded.c.receiver_id != sink_id, recorded.c.amount_time > 0)
+        .group_by(recorded.c.receiver_id)
+        .cte("earnings")
+    )
+    new_total = User.total_time_earned + earnings.c.amount_time
+    # Column onupdate defaults are not applied inside a CTE
+    credited = (
+        sa.update(User)
+        .where(User.id == earnings.c.user_id)
+        .values(
+            total_time_earned=new_total,
+            trust_level=_upgraded_trust_level(User.trust_level, new_total),
+            updated_at=now,
+        )
+        .returning(User.id)
+        .cte("credited")
+    )
+
+    to_sink = (
+        sa.select(
+            sa.func.count().label("transfers"),
+            sa.func.coalesce(sa.func.sum(recorded.c.amount_time), 0).label(
+                "amount_time"
+            ),
+            sa.func.coalesce(
+                sa.func.sum(recorded.c.amount_regio), Decimal(0)
+            ).label("amount_regio"),
+        )
+        .where(recorded.c.receiver_id == sink_id)
+        .cte("to_sink")
+    )
+    journaled = sink_credit_insert(
+        to_sink.c.amount_time,
+        to_sink.c.amount_regio,
+        now,
+        where=to_sink.c.transfers > 0,
+    ).cte("journaled")
+
+    counted = transaction_counter_upsert(recorded, sink_code).cte("counted")
+    summarized = daily_summary_upsert(recorded, sink_code).cte("summarized")
+
+    return sa.select(recorded).add_cte(
+        moved, credited, journaled, counted, summarized
+    )
+
+
+# pg advisory lock held for the length of an audit run
+AUDIT_LOCK_KEY = 0x4C41554449  # "LAUDI"
+
+# ledger_xid below which every transaction is folded in; None before the
+# first run
+AuditCheckpoint = Optional[int]
+
+
+def audit_lock() -> sa.Select:
+    """True if this transaction may run the ledger audit."""
+    return sa.select(sa.func.pg_try_advisory_xact_lock(AUDIT_LOCK_KEY))
+
+
+def audit_fold_statement(after: AuditCheckpoint) -> sa.Select:
+    """
+    Folds transactions past the `after` checkpoint into the expected
+    balances, up to the oldest database transaction still running. Rows
+    below that can no longer appear or change; newer ones wait for the
+    next run. Returns a single row: scanned, checkpoint (the new one).
+    """
+    # Taken from the statement's own snapshot, so every row below it that
+    # committed is visible to the scan
+    horizon = sa.cast(
+        sa.cast(
+            sa.func.pg_snapshot_xmin(sa.func.pg_current_snapshot()), sa.Text
+        ),
+        sa.BigInteger,
+    )
+    scanned = (
+        sa.select(
+            Transaction.sender_id,
+            Transaction.receiver_id,
+            Transaction.amount_time,
+            Transaction.amount_regio,
+        )
+        .where(_after_checkpoint(after), Transaction.ledger_xid < horizon)
+        .cte("scanned")
+    )
+    deltas = _net_deltas(scanned)
+    folded = pg_insert(LedgerAuditBalance).from_select(
+        ["user_id", "expected_time", "expected_regio"],
+        sa.select(deltas.c.user_id, deltas.c.delta_time, deltas.c.delta_regio),
+    )
+    folded = folded.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={
+            "expected_time": LedgerAuditBalance.expected_time
+            + folded.excluded.expected_time,
+            "expected_regio": LedgerAuditBalance.expected_regio
+            + folded.excluded.expected_regio,
+        },
+    ).cte("folded")
+
+    return sa.select(
+        sa.select(sa.func.count())
+        .select_from(scanned)
+        .scalar_subquery()
+        .label("scanned"),
+        horizon.label("checkpoint"),
+    ).add_cte(folded)
+
+
+def audit_drift_select(after: AuditCheckpoint, sink_code: str) -> sa.Select:
+    """
+    Accounts whose balance differs from the expected balance at the `after`
+    checkpoint plus every transaction written since. Balances and recent
+    transactions are read in one statement, so both come from the same
+    snapshot. Rows: account_id, user_id, currency, expected, actual.
+    """
+    sink_id = sa.select(User.id).where(User.user_code == sink_code)
+    recent = _net_deltas(
+        sa.select(
+            Transaction.sender_id,
+            Transaction.receiver_id,
+            Transaction.amount_time,
+            Transaction.amount_regio,
+        )
+        .where(_after_checkpoint(after))
+        .cte("recent")
+    )
+    pending = pending_sink_credits().subquery("pending")
+    pending_time, pending_regio = pending.c
+
+    is_time = Account.type == Currency.TIME
+    actual = sa.case(
+        (is_time, Account.balance_time), else_=Account.balance_regio
+    ) + sa.case(
+        # The sink's journaled credits are already in transactions
+        (
+            Account.user_id == sink_id.scalar_subquery(),
+            sa.case((is_time, pending_time), else_=pending_regio),
+        ),
+        else_=Decimal(0),
+    )
+    expected = sa.case(
+        (
+            is_time,
+            sa.func.coalesce(LedgerAuditBalance.expected_time, 0)
+            + sa.func.coalesce(recent.c.delta_time, 0),
+        ),
+        else_=sa.func.coalesce(LedgerAuditBalance.expected_regio, 0)
+        + sa.func.coalesce(recent.c.delta_regio, 0),
+    )
+    return (
+        sa.select(
+            Account.id.label("account_id"),
+            Account.user_id,
+            Account.type.label("currency"),
+            sa.cast(expected, sa.Numeric(12, 2)).label("expected"),
+            sa.cast(actual, sa.Numeric(12, 2)).label("actual"),
+        )
+        .select_from(Account)
+        .outerjoin(
+            LedgerAuditBalance,
+            LedgerAuditBalance.user_id == Account.user_id,
+        )
+        .outerjoin(recent, recent.c.user_id == Account.user_id)
+        .join(pending, sa.true())
+        .where(expected != actual)
+    )
+
+
+def audit_totals() -> sa.Select:
+    """Account count and net TIME / REGIO across the ledger."""
+    pending = pending_sink_credits().subquery("pending")
+    pending_time, pending_regio = pending.c
+    return sa.select(
+        sa.func.count(Account.id).label("accounts"),
+        (
+            sa.func.coalesce(
+                sa.func.sum(Account.balance_time).filter(
+                    Account.type == Currency.TIME
+                ),
+                0,
+            )
+            + sa.func.coalesce(sa.func.max(pending_time), 0)
+        ).label("total_time"),
+        (
+            sa.func.coalesce(
+                sa.func.sum(Account.balance_regio).filter(
+                    Account.type == Currency.REGIO
+                ),
+                Decimal(0),
+            )
+            + sa.func.coalesce(sa.func.max(pending_regio), 0)
+        ).label("total_regio"),
+    ).select_from(sa.join(Account, pending, sa.true()))
+
+
+def _after_checkpoint(after: AuditCheckpoint):
+    if after is None:
+        return sa.true()
+    return Transaction.ledger_xid >= after
+
+
+def _net_deltas(transfers: sa.CTE) -> sa.Subquery:
+    """Per-member net movement for the rows in `transfers`."""
+    legs = sa.union_all(
+        sa.select(
+            transfers.c.sender_id.label("user_id"),
+            (-transfers.c.amount_time).label("delta_time"),
+            (-transfers.c.amount_regio).label("delta_regio"),
+        ),
+        sa.select(
+            transfers.c.receiver_id,
+            transfers.c.amount_time,
+            transfers.c.amount_regio,
+        ),
+    ).subquery()
+    return (
+        sa.select(
+            legs.c.user_id,
+            sa.func.sum(legs.c.delta_time).label("delta_time"),
+            sa.func.sum(legs.c.delta_regio).label("delta_regio"),
+        )
+        .group_by(legs.c.user_id)
+        .subquery()
+    )
+
+
+def _upgraded_trust_level(current, total_earned):
+    """SQL mirror of the trust upgrade rule: only ever move up a level."""
+    level_type = User.__table__.c.trust_level.type
+    earned = sa.case(
+        *[
+            (total_earned >= threshold, sa.literal(level, level_type))
+            for level, threshold in TRUST_UPGRADE_THRESHOLDS
+        ],
+        else_=sa.literal(TrustLevel.T1, level_type),
+    )
+    rank = {level: i for i, level in enumerate(TRUST_LEVEL_ORDER)}
+    return sa.case(
+        (
+            sa.case(rank, value=earned) > sa.case(rank, value=current),
+            earned,
+        ),
+        else_=current,
+    )
+
+
+def _batch_column(batch: sa.CTE, name: str, type_):
+    if name in batch.c:
+        return batch.c[name]
+    return sa.cast(sa.null(), type_)
+
+
+def _as_sql(value, type_):
+    if isinstance(value, sa.ColumnElement):
+        return value
+    return sa.literal(value, type_)
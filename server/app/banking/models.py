@@ -1,8 +1,9 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
+import sqlalchemy as sa
 from sqlmodel import DateTime, Field, Numeric, Relationship, SQLModel
 
 from app.banking.enums import Currency, PaymentStatus
@@ -10,6 +11,9 @@ from app.banking.enums import Currency, PaymentStatus
 if TYPE_CHECKING:
     from app.users.models import User
 
+# Server default of Transaction.ledger_xid (xid8 has no bigint cast)
+LEDGER_XID_DEFAULT = sa.text("pg_current_xact_id()::text::bigint")
+
 
 class Account(SQLModel, table=True):
     __tablename__ = "accounts"
@@ -40,11 +44,34 @@ class Account(SQLModel, table=True):
 
 class Transaction(SQLModel, table=True):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # One membership fee per member per billing period
+        sa.Index(
+            "uq_transactions_sender_fee_period",
+            "sender_id",
+            "fee_period",
+            unique=True,
+            postgresql_where=sa.text("fee_period IS NOT NULL"),
+        ),
+        # Keyset history: one index scan per side of the transfer
+        sa.Index(
+            "ix_transactions_sender_created", "sender_id", "created_at", "id"
+        ),
+        sa.Index(
+            "ix_transactions_receiver_created",
+            "receiver_id",
+            "created_at",
+            "id",
+        ),
+        # Ledger audit: scans only what was written since its checkpoint
+        sa.Index("ix_transactions_ledger_xid", "ledger_xid"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
-    sender_id: uuid.UUID = Field(foreign_key="users.id", index=True)
-    receiver_id: uuid.UUID = Field(foreign_key="users.id", index=True)
+    # Indexed by the keyset history indexes above, which lead with them
+    sender_id: uuid.UUID = Field(foreign_key="users.id")
+    receiver_id: uuid.UUID = Field(foreign_key="users.id")
 
     amount_time: int = Field(default=0)
     amount_regio: Decimal = Field(default=0, sa_type=Numeric(10, 2))
@@ -53,12 +80,24 @@ class Transaction(SQLModel, table=True):
     payment_request_id: Optional[uuid.UUID] = Field(default=None, index=True)
 
     is_system_fee: bool = Field(default=False)
+    # Billing period ("YYYY-MM") for membership fees; makes runs idempotent
+    fee_period: Optional[str] = Field(default=None, max_length=7)
 
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_type=DateTime(timezone=True),
     )
 
+    # Id of the database transaction that wrote the row, set by Postgres.
+    # Unlike created_at it is safe to checkpoint on: once it is below every
+    # running transaction's id, no more rows can appear before it.
+    ledger_xid: Optional[int] = Field(
+        default=None,
+        nullable=False,
+        sa_type=sa.BigInteger,
+        sa_column_kwargs={"server_default": LEDGER_XID_DEFAULT},
+    )
+
     # ORM relationships
     sender: "User" = Relationship(
         back_populates="outgoing_tx",
@@ -70,6 +109,135 @@ class Transaction(SQLModel, table=True):
     )
 
 
+class SinkCredit(SQLModel, table=True):
+    """
+    Append-only journal of credits owed to the system sink account.
+
+    Fee and demurrage charges land here instead of updating the sink's
+    account rows, so they never contend with each other. A scheduled
+    rollup folds pending entries into the sink accounts.
+    """
+
+    __tablename__ = "sink_credits"
+    __table_args__ = (
+        sa.Index(
+            "ix_sink_credits_pending",
+            "id",
+            postgresql_where=sa.text("rolled_up_at IS NULL"),
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # Null when one entry aggregates a batch of transactions
+    transaction_id: Optional[uuid.UUID] = Field(default=None, index=True)
+
+    amount_time: int = Field(default=0)
+    amount_regio: Decimal = Field(default=0, sa_type=Numeric(10, 2))
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+    )
+    rolled_up_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True)
+    )
+
+
+class TransactionCounter(SQLModel, table=True):
+    """
+    Number of transactions each member is party to, maintained by every
+    ledger write so history pages never need a COUNT(*). The system sink
+    is not tracked here; its count is computed on demand.
+    """
+
+    __tablename__ = "transaction_counters"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    total: int = Field(default=0)
+
+
+class LedgerDailySummary(SQLModel, table=True):
+    """
+    Per-member, per-day (UTC) ledger aggregates, maintained by every ledger
+    write. Balance-over-time charts and period totals read this table
+    instead of scanning transactions. The system sink is not tracked.
+    """
+
+    __tablename__ = "ledger_daily_summaries"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    day: date = Field(primary_key=True)
+
+    time_in: int = Field(default=0)
+    time_out: int = Field(default=0)
+    regio_in: Decimal = Field(default=0, sa_type=Numeric(12, 2))
+    regio_out: Decimal = Field(default=0, sa_type=Numeric(12, 2))
+
+    # System charges (membership fee, demurrage) paid, part of *_out
+    fee_time: int = Field(default=0)
+    fee_regio: Decimal = Field(default=0, sa_type=Numeric(12, 2))
+
+    transaction_count: int = Field(default=0)
+
+
+class LedgerAuditBalance(SQLModel, table=True):
+    """
+    Balances implied by the transaction history up to the auditor's
+    checkpoint. Each audit run folds in only the transactions written
+    since the previous one.
+    """
+
+    __tablename__ = "ledger_audit_balances"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    expected_time: int = Field(default=0)
+    expected_regio: Decimal = Field(default=0, sa_type=Numeric(12, 2))
+
+
+class LedgerAuditRun(SQLModel, table=True):
+    """
+    One pass of the ledger auditor. The latest finished run carries the
+    checkpoint for the next one and the totals shown on the dashboard.
+    """
+
+    __tablename__ = "ledger_audit_runs"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    started_at: datetime = Field(sa_type=DateTime(timezone=True))
+    finished_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True)
+    )
+
+    # Every transaction with a lower ledger_xid is folded in
+    checkpoint_xid: Optional[int] = Field(default=None, sa_type=sa.BigInteger)
+
+    transactions_scanned: int = Field(default=0)
+    accounts_checked: int = Field(default=0)
+    drift_count: int = Field(default=0)
+
+    # Net balance across all accounts (incl. pending sink credits)
+    total_time: int = Field(default=0)
+    total_regio: Decimal = Field(default=0, sa_type=Numeric(12, 2))
+
+
+class LedgerAuditFinding(SQLModel, table=True):
+    """An account whose balance disagreed with its transaction history."""
+
+    __tablename__ = "ledger_audit_findings"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    run_id: int = Field(foreign_key="ledger_audit_runs.id", index=True)
+
+    account_id: uuid.UUID = Field(foreign_key="accounts.id", index=True)
+    user_id: uuid.UUID = Field(foreign_key="users.id")
+    currency: Currency
+
+    expected: Decimal = Field(sa_type=Numeric(12, 2))
+    actual: Decimal = Field(sa_type=Numeric(12, 2))
+
+
 class PaymentRequest(SQLModel, table=True):
     __tablename__ = "payment_requests"
 
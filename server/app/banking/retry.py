@@ -0,0 +1,100 @@
+import asyncio
+import functools
+import logging
+import random
+from contextvars import ContextVar
+
+from sqlalchemy.exc import DBAPIError
+
+from app.banking.config import banking_settings
+from app.banking.exceptions import TransactionConflict
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# serialization_failure, deadlock_detected, lock_not_available
+RETRYABLE_SQLSTATES = {"40001", "40P01", "55P03"}
+
+# Set while a retrying unit of work is running, so nested banking calls
+# (e.g. process_payment_request -> transfer_funds) let the conflict bubble
+# up to the outermost boundary, which owns the transaction.
+_in_retry_scope: ContextVar[bool] = ContextVar(
+    "banking_in_retry_scope", default=False
+)
+
+
+def is_retryable_db_error(exc: BaseException) -> bool:
+    if not isinstance(exc, DBAPIError):
+        return False
+    orig = exc.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code in RETRYABLE_SQLSTATES
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Full-jitter exponential backoff, capped at the configured maximum."""
+    ceiling = min(
+        banking_settings.CONFLICT_RETRY_MAX_DELAY_MS,
+        banking_settings.CONFLICT_RETRY_BASE_DELAY_MS * 2**attempt,
+    )
+    return random.uniform(0, ceiling) / 1000
+
+
+def retry_on_conflict(func):
+    """
+    Retries a BankingService unit of work when it loses a ledger race.
+
+    On a TransactionConflict or a retryable database error the session is
+    rolled back, so the next attempt re-reads current balances and versions
+    from scratch. Database errors that survive the budget are surfaced as
+    TransactionConflict (409) rather than a 500.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if _in_retry_scope.get():
+            return await func(self, *args, **kwargs)
+
+        operation = func.__name__
+        attempts = max(1, banking_settings.CONFLICT_RETRY_ATTEMPTS)
+        token = _in_retry_scope.set(True)
+        try:
+            for attempt in range(attempts):
+                try:
+                    return await func(self, *args, **kwargs)
+                except (TransactionConflict, DBAPIError) as e:
+                    if isinstance(e, DBAPIError) and not (
+                        is_retryable_db_error(e)
+                    ):
+                        raise
+                    await self.session.rollback()
+
+                    accounts = getattr(e, "accounts", ()) or ("unknown",)
+                    for account in accounts:
+                        metrics.incr(
+                            "banking_conflicts_total",
+                            operation=operation,
+                            account=account,
+                        )
+
+                    if attempt + 1 >= attempts:
+                        metrics.incr(
+                            "banking_retries_exhausted_total",
+                            operation=operation,
+                        )
+                        logger.warning(
+                            f"{operation} gave up after {attempts} attempts "
+                            f"on {', '.join(accounts)}: {e}"
+                        )
+                        if isinstance(e, TransactionConflict):
+                            raise
+                        raise TransactionConflict(
+                            accounts=tuple(accounts)
+                        ) from e
+
+                    metrics.incr("banking_retries_total", operation=operation)
+                    await asyncio.sleep(_backoff_seconds(attempt))
+        finally:
+            _in_retry_scope.reset(token)
+
+    return wrapper
@@ -1,10 +1,19 @@
 import uuid
-from typing import Any, List
+from datetime import date
+from typing import Any, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.banking.dependencies import BankingServiceDep
+from app.banking.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_filename,
+    stream_transactions,
+)
 from app.banking.schemas import (
+    BalanceHistory,
     BalanceResponse,
     DisputeCreate,
     PaymentRequestCreate,
@@ -16,7 +25,7 @@ from app.banking.schemas import (
 from app.core.schemas import Message
 from app.email.schemas import PaymentRequestRejectedEmailData
 from app.email.tasks import send_payment_request_rejected_email_task
-from app.users.dependencies import CurrentUser
+from app.users.dependencies import CurrentPrincipal, CurrentUser
 
 router = APIRouter()
 
@@ -31,7 +40,7 @@ router = APIRouter()
     },
 )
 async def get_my_balance(
-    current_user: CurrentUser, service: BankingServiceDep
+    current_user: CurrentPrincipal, service: BankingServiceDep
 ) -> Any:
     """
     Get current user's balance, trust level, and limits.
@@ -39,6 +48,26 @@ async def get_my_balance(
     return await service.get_balance_info(current_user.user_code)
 
 
+@router.get(
+    "/balance-history",
+    response_model=BalanceHistory,
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Account not found for user."
+        }
+    },
+)
+async def get_my_balance_history(
+    current_user: CurrentPrincipal,
+    service: BankingServiceDep,
+    days: int = Query(30, ge=1, le=366, description="Days to include."),
+) -> Any:
+    """
+    Get daily end-of-day balances and in/out/fee totals for charts.
+    """
+    return await service.get_balance_history(current_user.user_code, days)
+
+
 @router.get(
     "/history",
     response_model=TransactionHistory,
@@ -54,12 +83,49 @@ async def get_my_history(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     days: int = Query(None, description="Filter history by last N days"),
+    cursor: Optional[str] = Query(
+        None,
+        description="meta.next_cursor from the previous page; overrides page.",
+    ),
 ) -> Any:
     """
     Get paginated transaction history.
     """
     return await service.get_transaction_history(
-        user=current_user, page=page, page_size=page_size, days=days
+        user=current_user,
+        page=page,
+        page_size=page_size,
+        days=days,
+        cursor=cursor,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+            "description": "The user's transactions, oldest first.",
+        }
+    },
+)
+async def export_my_transactions(
+    current_user: CurrentPrincipal,
+    format: ExportFormat = Query("csv", description="csv or ndjson"),
+    start: Optional[date] = Query(None, description="First day (UTC)."),
+    end: Optional[date] = Query(None, description="Last day (UTC)."),
+) -> StreamingResponse:
+    """
+    Download your full transaction history as a streamed file.
+    """
+    return StreamingResponse(
+        stream_transactions(format, current_user.id, start, end),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": "attachment; filename="
+            + export_filename(format, current_user.user_code)
+        },
     )
 
 
@@ -78,7 +144,7 @@ async def get_my_history(
 )
 async def transfer_funds(
     request: TransferRequest,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BankingServiceDep,
 ) -> Any:
     """
@@ -105,7 +171,7 @@ async def transfer_funds(
 )
 async def create_payment_request(
     data: PaymentRequestCreate,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BankingServiceDep,
 ) -> Any:
     """
@@ -155,7 +221,7 @@ async def get_outgoing_requests(
 )
 async def confirm_payment_request(
     request_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BankingServiceDep,
 ) -> Message:
     """
@@ -179,7 +245,7 @@ async def confirm_payment_request(
 )
 async def reject_payment_request(
     request_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BankingServiceDep,
     background_tasks: BackgroundTasks,
 ) -> Message:
@@ -222,7 +288,7 @@ async def reject_payment_request(
 async def raise_dispute(
     request_id: uuid.UUID,
     data: DisputeCreate,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BankingServiceDep,
 ) -> Any:
     """
@@ -261,7 +327,7 @@ async def raise_dispute(
 )
 async def cancel_payment_request(
     request_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BankingServiceDep,
 ) -> Message:
     """
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
 
@@ -105,10 +105,19 @@ class TransactionPublic(SQLModel):
 class TransactionMeta(SQLModel):
     page: int = Field(..., description="Current page number.")
     page_size: int = Field(..., description="Items per page.")
-    total_count: int = Field(
-        ..., description="Total number of transactions found."
+    total_count: Optional[int] = Field(
+        ...,
+        description=(
+            "Total number of transactions found; null for the system sink."
+        ),
+    )
+    total_pages: Optional[int] = Field(
+        ..., description="Total pages available; null for the system sink."
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page; null on the last page.",
     )
-    total_pages: int = Field(..., description="Total pages available.")
 
 
 class TransactionHistory(SQLModel):
@@ -118,6 +127,43 @@ class TransactionHistory(SQLModel):
     meta: TransactionMeta = Field(..., description="Pagination metadata.")
 
 
+class BalanceHistoryPoint(SQLModel):
+    """
+    One day (UTC) of a member's ledger activity.
+    """
+
+    day: date = Field(..., description="Calendar day (UTC).")
+    balance: MoneyAmounts = Field(
+        ..., description="Balances at the end of the day."
+    )
+    incoming: MoneyAmounts = Field(..., description="Received that day.")
+    outgoing: MoneyAmounts = Field(
+        ..., description="Sent that day, including system charges."
+    )
+    fees: MoneyAmounts = Field(
+        ..., description="System charges (fees, demurrage) paid that day."
+    )
+
+
+class BalanceHistoryTotals(SQLModel):
+    incoming: MoneyAmounts = Field(..., description="Received in the window.")
+    outgoing: MoneyAmounts = Field(..., description="Sent in the window.")
+    fees: MoneyAmounts = Field(
+        ..., description="System charges paid in the window."
+    )
+
+
+class BalanceHistory(SQLModel):
+    user_code: str = Field(..., description="User's public ID.")
+    days: int = Field(..., description="Number of days in the series.")
+    data: List[BalanceHistoryPoint] = Field(
+        ..., description="One point per day, oldest first."
+    )
+    totals: BalanceHistoryTotals = Field(
+        ..., description="Sums over the whole window."
+    )
+
+
 class PaymentRequestPublic(SQLModel):
     """
     Public view of an invoice/payment request.
@@ -1,26 +1,33 @@
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import List, Optional, Sequence
 
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import func, or_, select, update
+from sqlalchemy.orm import aliased, selectinload
+from sqlmodel import func, select, update
 
+from app.banking.config import banking_settings
 from app.banking.constants import (
     DEMURRAGE_RATE_ANNUAL,
     DEMURRAGE_THRESHOLD_MINUTES,
     MONTHLY_FEE_MINUTES,
+    TRUST_LEVEL_ORDER,
     TRUST_LIMITS,
     TRUST_UPGRADE_THRESHOLDS,
 )
 from app.banking.enums import Currency, PaymentStatus, TransactionType
 from app.banking.exceptions import (
     AccountNotFound,
+    BalanceHistoryUnavailable,
     DisputeAlreadyRaised,
     DisputeNotAllowed,
     InsufficientFunds,
+    InvalidHistoryCursor,
     InvalidPaymentAction,
     InvalidPaymentRequestStatus,
     InvalidTransactionAmount,
@@ -29,14 +36,41 @@ from app.banking.exceptions import (
     TransactionConflict,
     UnauthorizedPaymentRequestAccess,
 )
-from app.banking.models import Account, PaymentRequest, Transaction
+from app.banking.ledger import (
+    audit_drift_select,
+    audit_fold_statement,
+    audit_lock,
+    audit_totals,
+    bulk_transfer_statement,
+    daily_summary_upsert,
+    pending_sink_credits,
+    sink_credit_insert,
+    sink_rollup_statement,
+    transaction_counter_upsert,
+)
+from app.banking.models import (
+    Account,
+    LedgerAuditFinding,
+    LedgerAuditRun,
+    LedgerDailySummary,
+    PaymentRequest,
+    Transaction,
+    TransactionCounter,
+)
+from app.banking.retry import is_retryable_db_error, retry_on_conflict
 from app.banking.schemas import (
+    BalanceHistory,
+    BalanceHistoryPoint,
+    BalanceHistoryTotals,
+    MoneyAmounts,
     PaymentRequestPublic,
     TransactionHistory,
     TransactionMeta,
     TransactionPublic,
 )
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.pagination import InvalidCursor, decode_cursor, encode_cursor
 from app.users.enums import TrustLevel
 from app.users.exceptions import UserNotFound
 from app.users.models import User
@@ -44,6 +78,15 @@ from app.users.models import User
 logger = logging.getLogger(__name__)
 
 
+def _trust_limit(trust_level, index: int) -> sa.Case:
+    """SQL mirror of TRUST_LIMITS (0 = TIME floor, 1 = REGIO floor)."""
+    return sa.case(
+        {level: limits[index] for level, limits in TRUST_LIMITS.items()},
+        value=trust_level,
+        else_=TRUST_LIMITS[TrustLevel.T1][index],
+    )
+
+
 class BankingService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -72,16 +115,9 @@ class BankingService:
     def _is_higher_level(
         self, new_level: TrustLevel, current_level: TrustLevel
     ) -> bool:
-        levels = [
-            TrustLevel.T1,
-            TrustLevel.T2,
-            TrustLevel.T3,
-            TrustLevel.T4,
-            TrustLevel.T5,
-            TrustLevel.T6,
-        ]
         try:
-            return levels.index(new_level) > levels.index(current_level)
+            new_rank = TRUST_LEVEL_ORDER.index(new_level)
+            return new_rank > TRUST_LEVEL_ORDER.index(current_level)
         except ValueError:
             return False
 
@@ -126,6 +162,7 @@ class BankingService:
         self.session.add(time_acc)
         self.session.add(regio_acc)
 
+    @retry_on_conflict
     async def transfer_funds(
         self,
         sender_code: str,
@@ -141,143 +178,316 @@ class BankingService:
         if sender_code == receiver_code:
             raise SelfTransferError()
 
-        # Resolve Users
-        sender = await self._get_user_by_code_or_fail(sender_code)
-        receiver = await self._get_user_by_code_or_fail(receiver_code)
+        # Credits to the system sink are journaled rather than applied, so
+        # only the sender's two accounts take part in the transfer.
+        to_sink = receiver_code == settings.SYSTEM_SINK_CODE
 
-        # Load Accounts
-        sender_time_acc = await self._get_account_or_fail(
-            sender.id, Currency.TIME
-        )
-        sender_regio_acc = await self._get_account_or_fail(
-            sender.id, Currency.REGIO
-        )
-
-        receiver_time_acc = await self._get_account_or_fail(
-            receiver.id, Currency.TIME
-        )
-        receiver_regio_acc = await self._get_account_or_fail(
-            receiver.id, Currency.REGIO
+        tx_id = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        statement = self._build_transfer_statement(
+            sender_code,
+            receiver_code,
+            amount_time,
+            amount_regio,
+            reference,
+            payment_request_id,
+            skip_limit_check,
+            tx_id,
+            now,
+            to_sink,
         )
-
-        # Limit Checks (VERY IMPORTANT)
-        if not skip_limit_check:
-            limits = TRUST_LIMITS.get(
-                sender.trust_level, TRUST_LIMITS[TrustLevel.T1]
+        try:
+            row = (await self.session.execute(statement)).one()
+        except DBAPIError as e:
+            if is_retryable_db_error(e):
+                raise TransactionConflict(
+                    accounts=(sender_code, receiver_code)
+                ) from e
+            raise
+
+        # Nothing was written unless the statement approved the transfer,
+        # so translate the diagnostic columns back into the domain errors.
+        if row.sender_id is None:
+            raise UserNotFound(f"User {sender_code} not found")
+        if row.receiver_id is None:
+            raise UserNotFound(f"User {receiver_code} not found")
+        if row.accounts != (2 if to_sink else 4):
+            raise AccountNotFound(
+                f"Accounts not found for transfer "
+                f"{sender_code} -> {receiver_code}"
+            )
+        if not row.approved:
+            if row.time_after < row.limit_time:
+                raise InsufficientFunds("TIME", row.time_after, row.limit_time)
+            raise InsufficientFunds(
+                "REGIO", float(row.regio_after), float(row.limit_regio)
             )
-            limit_time_min, limit_regio_min = limits
-
-            potential_time_bal = sender_time_acc.balance_time - amount_time
-            potential_regio_bal = sender_regio_acc.balance_regio - amount_regio
 
-            if potential_time_bal < limit_time_min:
-                raise InsufficientFunds(
-                    "TIME", potential_time_bal, limit_time_min
+        # Trust Level Logic: the receiver's new total came back from the
+        # statement, so an upgrade only costs a write when the level changes.
+        if amount_time > 0 and not to_sink:
+            potential_level = self._calculate_new_trust_level(
+                row.total_time_earned
+            )
+            if self._is_higher_level(potential_level, row.trust_level):
+                await self.session.execute(
+                    update(User)
+                    .where(User.id == row.receiver_id)
+                    .values(trust_level=potential_level)
                 )
 
-            if potential_regio_bal < limit_regio_min:
-                raise InsufficientFunds(
-                    "REGIO", float(potential_regio_bal), float(limit_regio_min)
-                )
+        await self.session.commit()
 
-        # Optimistic Locking Updates
-        # Update Sender TIME
-        stmt_sender_time = (
-            update(Account)
-            .where(
-                Account.id == sender_time_acc.id,
-                Account.version == sender_time_acc.version,
+        # Return Schema immediately (Decoupling)
+        return TransactionPublic(
+            id=row.transaction_id,
+            date=row.created_at,
+            type=TransactionType.OUTGOING,  # Context is always the initiator
+            other_party_code=receiver_code,
+            other_party_name=User.format_full_name(
+                row.first_name, row.middle_name, row.last_name
+            ),
+            amount_time=amount_time,
+            amount_regio=amount_regio,
+            reference=reference,
+            is_system_fee=False,
+        )
+
+    def _build_transfer_statement(
+        self,
+        sender_code: str,
+        receiver_code: str,
+        amount_time: int,
+        amount_regio: Decimal,
+        reference: str,
+        payment_request_id: Optional[uuid.UUID],
+        skip_limit_check: bool,
+        tx_id: uuid.UUID,
+        now: datetime,
+        to_sink: bool = False,
+    ) -> sa.Select:
+        """
+        Builds the fused transfer: one statement that resolves both users,
+        locks their four accounts, applies the trust-limit check, moves the
+        balances, credits the receiver's earned time and inserts the
+        transaction row. Writes only happen when the check passes; the
+        returned row carries enough state to explain a refusal.
+
+        With `to_sink` only the sender's accounts are locked and the credit
+        goes to the sink journal (see `roll_up_sink_credits`).
+        """
+        sender = (
+            sa.select(
+                User.id,
+                _trust_limit(User.trust_level, 0).label("limit_time"),
+                _trust_limit(User.trust_level, 1).label("limit_regio"),
             )
-            .values(
-                balance_time=sender_time_acc.balance_time - amount_time,
-                version=sender_time_acc.version + 1,
+            .where(User.user_code == sender_code)
+            .cte("sender")
+        )
+        receiver = (
+            sa.select(User.id)
+            .where(User.user_code == receiver_code)
+            .cte("receiver")
+        )
+        sender_id = sa.select(sender.c.id).scalar_subquery()
+        receiver_id = sa.select(receiver.c.id).scalar_subquery()
+
+        # Plain parameters, not a join: when a locked row was changed by a
+        # concurrent transfer, Postgres rechecks it against this condition,
+        # and a join against the CTEs drops the row at that point.
+        parties = [sender_id] if to_sink else [sender_id, receiver_id]
+
+        # Row locks are taken in primary-key order so two transfers between
+        # the same pair of members queue up instead of deadlocking.
+        locked = (
+            sa.select(
+                Account.id,
+                Account.user_id,
+                Account.type,
+                Account.balance_time,
+                Account.balance_regio,
             )
+            .where(Account.user_id.in_(parties))
+            .order_by(Account.id)
+            .with_for_update(of=Account)
+            .cte("locked")
         )
-        if (await self.session.execute(stmt_sender_time)).rowcount == 0:
-            raise TransactionConflict()
 
-        # Update Sender REGIO
-        stmt_sender_regio = (
-            update(Account)
-            .where(
-                Account.id == sender_regio_acc.id,
-                Account.version == sender_regio_acc.version,
+        is_sender = locked.c.user_id == sender_id
+        accounts = func.count()
+        time_after = func.max(
+            sa.case(
+                (
+                    sa.and_(is_sender, locked.c.type == Currency.TIME),
+                    locked.c.balance_time - amount_time,
+                )
             )
-            .values(
-                balance_regio=sender_regio_acc.balance_regio - amount_regio,
-                version=sender_regio_acc.version + 1,
+        )
+        regio_after = func.max(
+            sa.case(
+                (
+                    sa.and_(is_sender, locked.c.type == Currency.REGIO),
+                    locked.c.balance_regio - amount_regio,
+                )
             )
         )
-        if (await self.session.execute(stmt_sender_regio)).rowcount == 0:
-            raise TransactionConflict()
+        limit_time = sa.select(sender.c.limit_time).scalar_subquery()
+        limit_regio = sa.select(sender.c.limit_regio).scalar_subquery()
 
-        # Update Receiver TIME
-        stmt_rec_time = (
-            update(Account)
-            .where(
-                Account.id == receiver_time_acc.id,
-                Account.version == receiver_time_acc.version,
+        approved = accounts == (2 if to_sink else 4)
+        if not skip_limit_check:
+            approved = sa.and_(
+                approved, time_after >= limit_time, regio_after >= limit_regio
             )
-            .values(
-                balance_time=receiver_time_acc.balance_time + amount_time,
-                version=receiver_time_acc.version + 1,
+
+        checked = (
+            sa.select(
+                accounts.label("accounts"),
+                time_after.label("time_after"),
+                regio_after.label("regio_after"),
+                limit_time.label("limit_time"),
+                limit_regio.label("limit_regio"),
+                approved.label("approved"),
             )
+            .select_from(locked)
+            .cte("checked")
         )
-        if (await self.session.execute(stmt_rec_time)).rowcount == 0:
-            raise TransactionConflict()
+        is_approved = sa.select(checked.c.approved).scalar_subquery()
 
-        # Update Receiver REGIO
-        stmt_rec_regio = (
-            update(Account)
-            .where(
-                Account.id == receiver_regio_acc.id,
-                Account.version == receiver_regio_acc.version,
-            )
+        moved = (
+            sa.update(Account)
+            .where(Account.id.in_(sa.select(locked.c.id)), is_approved)
             .values(
-                balance_regio=receiver_regio_acc.balance_regio + amount_regio,
-                version=receiver_regio_acc.version + 1,
+                balance_time=Account.balance_time
+                + sa.case(
+                    (
+                        Account.type != Currency.TIME,
+                        0,
+                    ),
+                    (Account.user_id == sender_id, -amount_time),
+                    else_=amount_time,
+                ),
+                balance_regio=Account.balance_regio
+                + sa.case(
+                    (
+                        Account.type != Currency.REGIO,
+                        Decimal(0),
+                    ),
+                    (Account.user_id == sender_id, -amount_regio),
+                    else_=amount_regio,
+                ),
+                version=Account.version + 1,
             )
+            .returning(Account.id)
+            .cte("moved")
         )
-        if (await self.session.execute(stmt_rec_regio)).rowcount == 0:
-            raise TransactionConflict()
-
-        # Trust Level Logic
-        if amount_time > 0:
-            new_total_earned = receiver.total_time_earned + amount_time
-            receiver.total_time_earned = new_total_earned
-            self.session.add(receiver)
-
-            potential_level = self._calculate_new_trust_level(new_total_earned)
-            if self._is_higher_level(potential_level, receiver.trust_level):
-                receiver.trust_level = potential_level
-                self.session.add(receiver)
 
-        # Record Transaction
-        transaction = Transaction(
-            sender_id=sender.id,
-            receiver_id=receiver.id,
-            amount_time=amount_time,
-            amount_regio=amount_regio,
-            reference=reference,
-            payment_request_id=payment_request_id,
+        receiver_columns = (
+            User.first_name,
+            User.middle_name,
+            User.last_name,
+            User.total_time_earned,
+            User.trust_level,
         )
-        self.session.add(transaction)
+        if amount_time > 0 and not to_sink:
+            # Column onupdate defaults are not applied inside a CTE
+            credited = (
+                sa.update(User)
+                .where(User.id == receiver_id, is_approved)
+                .values(
+                    total_time_earned=User.total_time_earned + amount_time,
+                    updated_at=now,
+                )
+                .returning(*receiver_columns)
+                .cte("credited")
+            )
+        else:
+            credited = (
+                sa.select(*receiver_columns)
+                .where(User.id == receiver_id)
+                .cte("credited")
+            )
 
-        await self.session.commit()
-        await self.session.refresh(transaction)
+        recorded = (
+            sa.insert(Transaction)
+            .from_select(
+                [
+                    "id",
+                    "sender_id",
+                    "receiver_id",
+                    "amount_time",
+                    "amount_regio",
+                    "reference",
+                    "payment_request_id",
+                    "is_system_fee",
+                    "created_at",
+                ],
+                sa.select(
+                    sa.literal(tx_id, sa.Uuid),
+                    sender_id,
+                    receiver_id,
+                    sa.literal(amount_time, sa.Integer),
+                    sa.literal(amount_regio, sa.Numeric(10, 2)),
+                    sa.literal(reference, sa.String),
+                    sa.literal(payment_request_id, sa.Uuid),
+                    sa.false(),
+                    sa.literal(now, sa.DateTime(timezone=True)),
+                ).where(is_approved),
+            )
+            .returning(
+                Transaction.id.label("transaction_id"),
+                Transaction.sender_id,
+                Transaction.receiver_id,
+                Transaction.amount_time,
+                Transaction.amount_regio,
+                Transaction.is_system_fee,
+                Transaction.created_at,
+            )
+            .cte("recorded")
+        )
+        counted = transaction_counter_upsert(
+            recorded, settings.SYSTEM_SINK_CODE
+        ).cte("counted")
+        summarized = daily_summary_upsert(
+            recorded, settings.SYSTEM_SINK_CODE
+        ).cte("summarized")
 
-        # Return Schema immediately (Decoupling)
-        return TransactionPublic(
-            id=transaction.id,
-            date=transaction.created_at,
-            type=TransactionType.OUTGOING,  # Context is always the initiator
-            other_party_code=receiver.user_code,
-            other_party_name=receiver.full_name,
-            amount_time=transaction.amount_time,
-            amount_regio=transaction.amount_regio,
-            reference=transaction.reference,
-            is_system_fee=False,
+        statement = (
+            sa.select(
+                sender_id.label("sender_id"),
+                receiver_id.label("receiver_id"),
+                checked.c.accounts,
+                checked.c.time_after,
+                checked.c.regio_after,
+                checked.c.limit_time,
+                checked.c.limit_regio,
+                checked.c.approved,
+                credited.c.first_name,
+                credited.c.middle_name,
+                credited.c.last_name,
+                credited.c.total_time_earned,
+                credited.c.trust_level,
+                recorded.c.transaction_id,
+                recorded.c.created_at,
+            )
+            .select_from(checked)
+            .outerjoin(credited, sa.true())
+            .outerjoin(recorded, sa.true())
+            # Data-modifying CTEs always run; this just attaches the ones
+            # the final projection does not reference.
+            .add_cte(moved, counted, summarized)
         )
+        if to_sink:
+            journaled = sink_credit_insert(
+                amount_time,
+                amount_regio,
+                now,
+                transaction_id=tx_id,
+                where=is_approved,
+            ).cte("journaled")
+            statement = statement.add_cte(journaled)
+        return statement
 
     async def get_transaction_history(
         self,
@@ -285,45 +495,76 @@ class BankingService:
         page: int = 1,
         page_size: int = 50,
         days: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> TransactionHistory:
         """
         Returns transaction history transformed for the specific viewer (user).
-        """
-        skip = (page - 1) * page_size
 
-        # Base filter condition
-        conditions = [
-            or_(
-                Transaction.sender_id == user.id,
-                Transaction.receiver_id == user.id,
-            )
-        ]
-
-        # Date filter
+        Pages are keyset-paginated newest first on (created_at, id): pass the
+        previous page's `meta.next_cursor` as `cursor` to continue. `page`
+        is still honoured when no cursor is given.
+        """
+        cutoff_date = None
         if days:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-            conditions.append(Transaction.created_at >= cutoff_date)
-
-        # Count Query
-        count_statement = select(func.count()).where(*conditions)
-        total_count = (await self.session.execute(count_statement)).one()[0]
 
-        total_pages = (total_count + page_size - 1) // page_size
+        after = None
+        skip = 0
+        if cursor:
+            try:
+                after = decode_cursor(
+                    cursor, datetime.fromisoformat, uuid.UUID
+                )
+            except InvalidCursor:
+                raise InvalidHistoryCursor()
+        else:
+            skip = (page - 1) * page_size
+
+        def side(party_column):
+            conditions = [party_column == user.id]
+            if cutoff_date:
+                conditions.append(Transaction.created_at >= cutoff_date)
+            if after:
+                conditions.append(
+                    sa.tuple_(Transaction.created_at, Transaction.id)
+                    < sa.tuple_(*after)
+                )
+            return (
+                sa.select(Transaction)
+                .where(*conditions)
+                .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+                .limit(skip + page_size + 1)
+            )
 
-        # Data Query
+        # Each side is a bounded scan of its own (party, created_at, id)
+        # index; merging two short lists replaces an OR across both columns.
+        merged = sa.union_all(
+            side(Transaction.sender_id), side(Transaction.receiver_id)
+        ).subquery("merged")
+        tx_row = aliased(Transaction, merged)
         statement = (
-            select(Transaction)
-            .where(*conditions)
+            select(tx_row)
             .options(
-                selectinload(Transaction.sender),
-                selectinload(Transaction.receiver),
+                selectinload(tx_row.sender),
+                selectinload(tx_row.receiver),
             )
-            .order_by(Transaction.created_at.desc())
+            .order_by(tx_row.created_at.desc(), tx_row.id.desc())
             .offset(skip)
-            .limit(page_size)
+            .limit(page_size + 1)
         )
         transactions = (await self.session.execute(statement)).scalars().all()
 
+        next_cursor = None
+        if len(transactions) > page_size:
+            transactions = transactions[:page_size]
+            last = transactions[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        total_count = await self._count_transactions(user, cutoff_date)
+        total_pages = None
+        if total_count is not None:
+            total_pages = (total_count + page_size - 1) // page_size
+
         formatted_data = []
         for tx in transactions:
             is_outgoing = tx.sender_id == user.id
@@ -352,9 +593,44 @@ class BankingService:
                 page_size=page_size,
                 total_count=total_count,
                 total_pages=total_pages,
+                next_cursor=next_cursor,
             ),
         )
 
+    async def _count_transactions(
+        self, user: User, cutoff_date: Optional[datetime]
+    ) -> Optional[int]:
+        """
+        Full-history counts come from the write-maintained counter and
+        date-bounded counts from two index range counts. The sink has no
+        counter (it would be a hot row) and its history is the largest in
+        the system, so it gets no total at all.
+        """
+        if user.user_code == settings.SYSTEM_SINK_CODE:
+            return None
+        if cutoff_date is None:
+            total = await self.session.scalar(
+                select(TransactionCounter.total).where(
+                    TransactionCounter.user_id == user.id
+                )
+            )
+            return total or 0
+
+        def side_count(party_column):
+            statement = sa.select(func.count()).where(party_column == user.id)
+            if cutoff_date:
+                statement = statement.where(
+                    Transaction.created_at >= cutoff_date
+                )
+            return statement.scalar_subquery()
+
+        return await self.session.scalar(
+            sa.select(
+                side_count(Transaction.sender_id)
+                + side_count(Transaction.receiver_id)
+            )
+        )
+
     async def get_balance_info(self, user_code: str):
         user = await self._get_user_by_code_or_fail(user_code)
 
@@ -366,22 +642,134 @@ class BankingService:
         )
         limit_time, limit_regio = limits
 
+        balance_time = time_acc.balance_time
+        balance_regio = regio_acc.balance_regio
+        if user.user_code == settings.SYSTEM_SINK_CODE:
+            pending = (
+                await self.session.execute(pending_sink_credits())
+            ).one()
+            balance_time += pending[0]
+            balance_regio += pending[1]
+
         return {
             "user_code": user.user_code,
             "trust_level": user.trust_level,
             "total_time_earned": user.total_time_earned,
             "balance": {
-                "time": time_acc.balance_time,
-                "regio": regio_acc.balance_regio,
+                "time": balance_time,
+                "regio": balance_regio,
             },
             "limits": {
                 "max_debt_time": limit_time,
                 "max_debt_regio": limit_regio,
-                "available_time": time_acc.balance_time - limit_time,
-                "available_regio": regio_acc.balance_regio - limit_regio,
+                "available_time": balance_time - limit_time,
+                "available_regio": balance_regio - limit_regio,
             },
         }
 
+    async def get_balance_history(
+        self, user_code: str, days: int = 30
+    ) -> BalanceHistory:
+        """
+        Daily balance series for the last `days` days, rebuilt backwards
+        from the current balance using the daily ledger summaries.
+
+        The balances and the summaries are read in one statement, so a
+        transfer committing meanwhile cannot shift the series. The sink
+        has no summaries (see `daily_summary_upsert`) and is refused.
+        """
+        user = await self._get_user_by_code_or_fail(user_code)
+        if user.user_code == settings.SYSTEM_SINK_CODE:
+            raise BalanceHistoryUnavailable()
+
+        today = datetime.now(timezone.utc).date()
+        start = today - timedelta(days=days - 1)
+        balances = (
+            sa.select(
+                func.sum(
+                    sa.case(
+                        (Account.type == Currency.TIME, Account.balance_time)
+                    )
+                ).label("time"),
+                func.sum(
+                    sa.case(
+                        (Account.type == Currency.REGIO, Account.balance_regio)
+                    )
+                ).label("regio"),
+                func.count().label("accounts"),
+            )
+            .where(Account.user_id == user.id)
+            .subquery("balances")
+        )
+        statement = (
+            select(balances, LedgerDailySummary)
+            .select_from(balances)
+            .outerjoin(
+                LedgerDailySummary,
+                sa.and_(
+                    LedgerDailySummary.user_id == user.id,
+                    LedgerDailySummary.day >= start,
+                ),
+            )
+        )
+        rows = (await self.session.execute(statement)).all()
+        current = rows[0]
+        if current.accounts < 2:
+            raise AccountNotFound(f"Accounts not found for {user_code}")
+        summaries = {
+            row.LedgerDailySummary.day: row.LedgerDailySummary
+            for row in rows
+            if row.LedgerDailySummary is not None
+        }
+
+        balance_time = current.time
+        balance_regio = current.regio
+        points = []
+        for offset in range(days):
+            day = today - timedelta(days=offset)
+            row = summaries.get(day) or LedgerDailySummary(
+                user_id=user.id, day=day
+            )
+            points.append(
+                BalanceHistoryPoint(
+                    day=day,
+                    balance=MoneyAmounts(
+                        time=balance_time, regio=balance_regio
+                    ),
+                    incoming=MoneyAmounts(
+                        time=row.time_in, regio=row.regio_in
+                    ),
+                    outgoing=MoneyAmounts(
+                        time=row.time_out, regio=row.regio_out
+                    ),
+                    fees=MoneyAmounts(time=row.fee_time, regio=row.fee_regio),
+                )
+            )
+            # Step back to the previous day's closing balance
+            balance_time -= row.time_in - row.time_out
+            balance_regio -= row.regio_in - row.regio_out
+        points.reverse()
+
+        def window_total(time_field: str, regio_field: str) -> MoneyAmounts:
+            rows = summaries.values()
+            return MoneyAmounts(
+                time=sum(getattr(r, time_field) for r in rows),
+                regio=sum(
+                    (getattr(r, regio_field) for r in rows), Decimal("0.00")
+                ),
+            )
+
+        return BalanceHistory(
+            user_code=user.user_code,
+            days=days,
+            data=points,
+            totals=BalanceHistoryTotals(
+                incoming=window_total("time_in", "regio_in"),
+                outgoing=window_total("time_out", "regio_out"),
+                fees=window_total("fee_time", "fee_regio"),
+            ),
+        )
+
     async def create_payment_request(
         self,
         creditor_code: str,
@@ -574,6 +962,7 @@ class BankingService:
         await self.session.commit()
         return req
 
+    @retry_on_conflict
     async def process_payment_request(
         self,
         request_id: uuid.UUID,
@@ -636,6 +1025,7 @@ class BankingService:
         else:
             raise InvalidPaymentAction()
 
+    @retry_on_conflict
     async def force_execute_payment_request(
         self, request_id: uuid.UUID
     ) -> PaymentRequest:
@@ -694,103 +1084,414 @@ class BankingService:
         await self.session.commit()
         return req
 
+    @retry_on_conflict
+    async def force_execute_payment_requests(
+        self, request_ids: list[uuid.UUID]
+    ) -> list[uuid.UUID]:
+        """
+        Set-based force_execute_payment_request for the enforcer job.
+
+        Requests are claimed with FOR UPDATE SKIP LOCKED, so rows another
+        worker is already enforcing are skipped rather than waited on.
+        Returns the ids of the requests this call moved to EXECUTED.
+        """
+        now = datetime.now(timezone.utc)
+        claimed = (
+            sa.select(
+                PaymentRequest.id,
+                PaymentRequest.creditor_id,
+                PaymentRequest.debtor_id,
+                PaymentRequest.amount_time,
+                PaymentRequest.amount_regio,
+                PaymentRequest.description,
+            )
+            .where(
+                PaymentRequest.id.in_(request_ids),
+                PaymentRequest.status == PaymentStatus.PENDING,
+                PaymentRequest.dispute_raised.is_(False),
+            )
+            .order_by(PaymentRequest.id)
+            .with_for_update(skip_locked=True)
+            .cte("claimed")
+        )
+        # Idempotency guard: a request that already has a transaction only
+        # needs its status finalised below, not a second transfer.
+        already_paid = sa.exists().where(
+            Transaction.payment_request_id == claimed.c.id
+        )
+        description = func.coalesce(
+            func.nullif(claimed.c.description, ""), "Payment Request"
+        )
+        batch = (
+            sa.select(
+                claimed.c.debtor_id.label("sender_id"),
+                claimed.c.creditor_id.label("receiver_id"),
+                claimed.c.amount_time,
+                claimed.c.amount_regio,
+                ("Auto-executed: " + description).label("reference"),
+                claimed.c.id.label("payment_request_id"),
+            )
+            .where(~already_paid)
+            .cte("batch")
+        )
+        await self.session.execute(
+            bulk_transfer_statement(batch, settings.SYSTEM_SINK_CODE, now)
+        )
+
+        # Runs as a second statement so it sees the transactions written
+        # above. It claims the same way: rows another worker holds are
+        # skipped, while the ones claimed above are already ours.
+        pending = (
+            select(PaymentRequest.id)
+            .where(
+                PaymentRequest.id.in_(request_ids),
+                PaymentRequest.status == PaymentStatus.PENDING,
+            )
+            .order_by(PaymentRequest.id)
+            .with_for_update(skip_locked=True)
+        )
+        finalised = (
+            update(PaymentRequest)
+            .where(
+                PaymentRequest.id.in_(pending.scalar_subquery()),
+                PaymentRequest.id == Transaction.payment_request_id,
+                PaymentRequest.status == PaymentStatus.PENDING,
+            )
+            .values(
+                status=PaymentStatus.EXECUTED,
+                transaction_id=Transaction.id,
+            )
+            .returning(PaymentRequest.id)
+            .execution_options(synchronize_session=False)
+        )
+        executed = list(
+            (await self.session.execute(finalised)).scalars().all()
+        )
+        await self.session.commit()
+        return executed
+
     # CRON / SYSTEM JOBS
 
-    async def collect_monthly_fees(self) -> list[dict]:
+    async def collect_monthly_fees(self) -> dict:
+        """
+        Charges the membership fee to every active member in set-based
+        chunks. Each member is charged at most once per calendar month, so
+        re-running after a crash only picks up whoever was missed.
+        """
         stmt_sys = select(User).where(
             User.user_code == settings.SYSTEM_SINK_CODE
         )
         if not (await self.session.execute(stmt_sys)).scalar_one_or_none():
             raise Exception("System Sink User not found")
 
-        stmt_users = select(User).where(
-            User.is_active, User.is_system_admin.is_(False)
-        )
-        users = (await self.session.execute(stmt_users)).scalars().all()
+        # Fixed for the whole run: it is what makes a re-run idempotent.
+        # Each chunk stamps its rows with its own time.
+        period = datetime.now(timezone.utc).strftime("%Y-%m")
+        summary = {
+            "period": period,
+            "charged": 0,
+            "already_charged": 0,
+            "total_minutes": 0,
+            "failed": [],
+        }
 
-        results = []
-        for user in users:
+        after: Optional[uuid.UUID] = None
+        while chunk := await self._next_fee_chunk(after):
+            after = chunk[-1].id
+            user_ids = [row.id for row in chunk]
             try:
-                await self.transfer_funds(
-                    sender_code=user.user_code,
-                    receiver_code=settings.SYSTEM_SINK_CODE,
-                    amount_time=MONTHLY_FEE_MINUTES,
-                    amount_regio=Decimal(0),
-                    reference="Membership Fee",
-                    skip_limit_check=True,
-                )
-                results.append({"user": user.user_code, "status": "SUCCESS"})
+                recorded = await self._charge_fee_chunk(user_ids, period)
             except Exception as e:
                 await self.session.rollback()
                 logger.error(
-                    f"Monthly fee collection failed for {user.user_code}: {e}"
-                )
-                results.append(
-                    {
-                        "user": user.user_code,
-                        "status": "FAILED",
-                        "error": str(e),
-                    }
+                    f"Monthly fee chunk of {len(chunk)} member(s) failed: {e}"
                 )
-        return results
+                summary["failed"].extend(row.user_code for row in chunk)
+                continue
 
-    async def process_demurrage(self) -> dict:
+            summary["charged"] += len(recorded)
+            summary["already_charged"] += len(chunk) - len(recorded)
+            summary["total_minutes"] += sum(r.amount_time for r in recorded)
+
+        return summary
+
+    async def _next_fee_chunk(self, after: Optional[uuid.UUID]):
+        """Next page of fee-paying members (with a TIME account), by id."""
         statement = (
-            select(Account)
-            .join(User)
+            select(User.id, User.user_code)
+            .join(
+                Account,
+                (Account.user_id == User.id) & (Account.type == Currency.TIME),
+            )
             .where(
-                Account.type == Currency.TIME,
-                Account.balance_time > DEMURRAGE_THRESHOLD_MINUTES,
-                User.is_active.is_(True),
+                User.is_active,
                 User.is_system_admin.is_(False),
+                User.user_code != settings.SYSTEM_SINK_CODE,
+            )
+            .order_by(User.id)
+            .limit(banking_settings.LEDGER_BATCH_SIZE)
+        )
+        if after is not None:
+            statement = statement.where(User.id > after)
+        return (await self.session.execute(statement)).all()
+
+    @retry_on_conflict
+    async def _charge_fee_chunk(self, user_ids: list[uuid.UUID], period: str):
+        now = datetime.now(timezone.utc)
+        sink_id = select(User.id).where(
+            User.user_code == settings.SYSTEM_SINK_CODE
+        )
+        batch = (
+            sa.select(
+                User.id.label("sender_id"),
+                sink_id.scalar_subquery().label("receiver_id"),
+                sa.literal(MONTHLY_FEE_MINUTES, sa.Integer).label(
+                    "amount_time"
+                ),
+                sa.literal(Decimal(0), sa.Numeric(10, 2)).label(
+                    "amount_regio"
+                ),
+                sa.literal("Membership Fee", sa.String).label("reference"),
+                sa.literal(period, sa.String).label("fee_period"),
             )
-            .options(selectinload(Account.user))
+            .where(User.id.in_(user_ids))
+            .cte("batch")
         )
-        hoarding_accounts = (
-            (await self.session.execute(statement)).scalars().all()
+        statement = bulk_transfer_statement(
+            batch, settings.SYSTEM_SINK_CODE, now, is_system_fee=True
         )
+        recorded = (await self.session.execute(statement)).all()
+        await self.session.commit()
+        return recorded
+
+    async def audit_ledger(self) -> Optional[LedgerAuditRun]:
+        """
+        Checks every account balance against the transaction history.
+
+        Expected balances are kept incrementally: each run folds in only the
+        transactions committed since the previous run's checkpoint (see
+        `audit_fold_statement`), then compares balances in one pass.
+        Accounts that disagree are stored as findings. Returns None if
+        another worker is already auditing.
+        """
+        if not (await self.session.execute(audit_lock())).scalar_one():
+            await self.session.rollback()
+            return None
 
         now = datetime.now(timezone.utc)
-        processed_count = 0
-        total_minutes = 0
+        previous = await self.get_last_ledger_audit()
+        after = previous.checkpoint_xid if previous else None
 
-        for acc in hoarding_accounts:
-            user = acc.user
-            last_calc = acc.last_demurrage_calc.astimezone(timezone.utc)
-            delta = now - last_calc
-            days_elapsed = delta.total_seconds() / (24 * 3600)
+        fold = (await self.session.execute(audit_fold_statement(after))).one()
+        after = fold.checkpoint
 
-            if days_elapsed < 1:
-                continue
+        run = LedgerAuditRun(
+            started_at=now,
+            checkpoint_xid=after,
+            transactions_scanned=fold.scanned,
+        )
+        self.session.add(run)
+        await self.session.flush()
+
+        drift = audit_drift_select(after, settings.SYSTEM_SINK_CODE).subquery()
+        recorded = await self.session.execute(
+            sa.insert(LedgerAuditFinding)
+            .from_select(
+                [
+                    "run_id",
+                    "account_id",
+                    "user_id",
+                    "currency",
+                    "expected",
+                    "actual",
+                ],
+                sa.select(sa.literal(run.id), *drift.c),
+            )
+            .returning(LedgerAuditFinding.id)
+        )
+        totals = (await self.session.execute(audit_totals())).one()
+
+        run.drift_count = len(recorded.all())
+        run.accounts_checked = totals.accounts
+        run.total_time = totals.total_time
+        run.total_regio = totals.total_regio
+        run.finished_at = datetime.now(timezone.utc)
+        self.session.add(run)
+        await self.session.commit()
 
-            taxable_amount = acc.balance_time - DEMURRAGE_THRESHOLD_MINUTES
-            daily_rate = DEMURRAGE_RATE_ANNUAL / 365
-            demurrage_minutes = int(
-                round(taxable_amount * daily_rate * days_elapsed)
-            )
-
-            if demurrage_minutes > 0:
-                try:
-                    await self.transfer_funds(
-                        sender_code=user.user_code,
-                        receiver_code=settings.SYSTEM_SINK_CODE,
-                        amount_time=demurrage_minutes,
-                        amount_regio=Decimal(0),
-                        reference=f"Demurrage ({days_elapsed:.1f} days)",
-                        skip_limit_check=True,
-                    )
-                    # Only advance the timestamp on success — a failed charge
-                    # is retried next run rather than silently skipped.
-                    acc.last_demurrage_calc = now
-                    self.session.add(acc)
-                    await self.session.commit()
-                    total_minutes += demurrage_minutes
-                    processed_count += 1
-                except Exception as e:
-                    await self.session.rollback()
-                    logger.error(f"Demurrage failed for {user.user_code}: {e}")
+        metrics.set_gauge("ledger_audit_drift_accounts", run.drift_count)
+        return run
+
+    async def get_last_ledger_audit(self) -> Optional[LedgerAuditRun]:
+        stmt = (
+            select(LedgerAuditRun)
+            .where(LedgerAuditRun.finished_at.is_not(None))
+            .order_by(LedgerAuditRun.id.desc())
+            .limit(1)
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
 
+    @retry_on_conflict
+    async def roll_up_sink_credits(self) -> dict:
+        """
+        Folds pending sink journal entries into the system sink accounts.
+        """
+        statement = sink_rollup_statement(
+            settings.SYSTEM_SINK_CODE, datetime.now(timezone.utc)
+        )
+        row = (await self.session.execute(statement)).one()
+        await self.session.commit()
+        return {
+            "entries": row.entries,
+            "amount_time": row.amount_time,
+            "amount_regio": row.amount_regio,
+        }
+
+    async def process_demurrage(self) -> dict:
+        """
+        Two phases: every charge is computed in one SQL pass, then applied
+        in set-based chunks. A chunk that fails is replayed account by
+        account so one bad row cannot block the rest.
+        """
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        charges = await self._compute_demurrage_charges(now)
+
+        processed_count = 0
+        total_minutes = 0
+        failed: list[str] = []
+        size = banking_settings.LEDGER_BATCH_SIZE
+
+        for i in range(0, len(charges), size):
+            chunk = charges[i : i + size]
+            try:
+                recorded = await self._apply_demurrage_chunk(chunk, now)
+            except Exception as e:
+                await self.session.rollback()
+                logger.warning(
+                    f"Demurrage chunk of {len(chunk)} failed ({e}); "
+                    f"retrying account by account"
+                )
+                recorded = []
+                for charge in chunk:
+                    try:
+                        recorded += await self._apply_demurrage_chunk(
+                            [charge], now
+                        )
+                    except Exception as e:
+                        await self.session.rollback()
+                        logger.error(
+                            f"Demurrage failed for {charge.user_code}: {e}"
+                        )
+                        failed.append(charge.user_code)
+
+            processed_count += len(recorded)
+            total_minutes += sum(r.amount_time for r in recorded)
+
+        elapsed = time.perf_counter() - started
         return {
             "processed_users": processed_count,
             "total_minutes_collected": total_minutes,
+            "candidates": len(charges),
+            "failed": failed,
+            "duration_seconds": round(elapsed, 3),
+            "accounts_per_second": round(len(charges) / elapsed, 1)
+            if elapsed
+            else 0.0,
         }
+
+    async def _compute_demurrage_charges(self, now: datetime):
+        """
+        Computes every due demurrage charge in one pass: the taxable share
+        above the threshold, times the daily rate, times the days since
+        the last charge (same float arithmetic and rounding as before).
+        """
+        now_sql = sa.literal(now, sa.DateTime(timezone=True))
+        days_elapsed = sa.cast(
+            func.extract("epoch", now_sql - Account.last_demurrage_calc),
+            sa.Float,
+        ) / sa.literal(24 * 3600, sa.Float)
+        taxable_amount = Account.balance_time - DEMURRAGE_THRESHOLD_MINUTES
+        daily_rate = sa.literal(DEMURRAGE_RATE_ANNUAL / 365, sa.Float)
+
+        due = (
+            sa.select(
+                Account.id.label("account_id"),
+                User.user_code,
+                Account.last_demurrage_calc,
+                days_elapsed.label("days_elapsed"),
+                func.round(taxable_amount * daily_rate * days_elapsed).label(
+                    "minutes"
+                ),
+            )
+            .join(User, User.id == Account.user_id)
+            .where(
+                Account.type == Currency.TIME,
+                Account.balance_time > DEMURRAGE_THRESHOLD_MINUTES,
+                User.is_active.is_(True),
+                User.is_system_admin.is_(False),
+                days_elapsed >= 1,
+            )
+            .subquery("due")
+        )
+        statement = (
+            sa.select(due).where(due.c.minutes > 0).order_by(due.c.account_id)
+        )
+        return (await self.session.execute(statement)).all()
+
+    @retry_on_conflict
+    async def _apply_demurrage_chunk(self, charges, computed_at: datetime):
+        """
+        Applies precomputed charges with the bulk engine. An account is
+        only charged if its `last_demurrage_calc` is still the value the
+        charge was computed from, so overlapping runs cannot double-charge.
+        `last_demurrage_calc` moves to `computed_at`, the time the charges
+        run up to; the transactions are stamped with the chunk's own time.
+        """
+        now = datetime.now(timezone.utc)
+        values = sa.values(
+            sa.column("account_id", sa.Uuid),
+            sa.column("computed_from", sa.DateTime(timezone=True)),
+            sa.column("amount_time", sa.Integer),
+            sa.column("reference", sa.String),
+            name="charges",
+        ).data(
+            [
+                (
+                    c.account_id,
+                    c.last_demurrage_calc,
+                    int(c.minutes),
+                    f"Demurrage ({c.days_elapsed:.1f} days)",
+                )
+                for c in charges
+            ]
+        )
+        sink_id = select(User.id).where(
+            User.user_code == settings.SYSTEM_SINK_CODE
+        )
+        batch = (
+            sa.select(
+                Account.user_id.label("sender_id"),
+                sink_id.scalar_subquery().label("receiver_id"),
+                values.c.amount_time,
+                sa.literal(Decimal(0), sa.Numeric(10, 2)).label(
+                    "amount_regio"
+                ),
+                values.c.reference,
+            )
+            .join_from(values, Account, Account.id == values.c.account_id)
+            .where(Account.last_demurrage_calc == values.c.computed_from)
+            .order_by(Account.id)
+            .with_for_update(of=Account)
+            .cte("batch")
+        )
+        statement = bulk_transfer_statement(
+            batch,
+            settings.SYSTEM_SINK_CODE,
+            now,
+            is_system_fee=True,
+            demurrage_calc_at=computed_at,
+        )
+        recorded = (await self.session.execute(statement)).all()
+        await self.session.commit()
+        return recorded
@@ -11,7 +11,10 @@ from app.broadcast.schemas import (
 )
 from app.email.schemas import BroadcastDigestEmailData
 from app.email.tasks import send_broadcast_digest_emails_task
-from app.users.dependencies import CurrentUser, get_current_active_system_admin
+from app.users.dependencies import (
+    CurrentPrincipal,
+    get_current_active_system_admin,
+)
 
 router = APIRouter()
 
@@ -26,7 +29,7 @@ router = APIRouter()
 )
 async def send_broadcast(
     data: BroadcastCreateRequest,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BroadcastServiceDep,
     background_tasks: BackgroundTasks,
 ) -> Any:
@@ -73,7 +76,7 @@ async def send_broadcast(
     operation_id="get_my_inbox",
 )
 async def get_my_inbox(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BroadcastServiceDep,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
@@ -94,7 +97,7 @@ async def get_my_inbox(
 )
 async def mark_message_read(
     message_id: UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: BroadcastServiceDep,
 ) -> None:
     """
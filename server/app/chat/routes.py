@@ -16,7 +16,7 @@ from app.chat.schemas import (
 )
 from app.core.config import settings
 from app.core.database import SessionDep
-from app.users.dependencies import CurrentUser, UserServiceDep
+from app.users.dependencies import CurrentPrincipal, UserServiceDep
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -27,7 +27,7 @@ router = APIRouter()
     status_code=status.HTTP_200_OK,
     summary="Lazy-register Matrix account for current user",
 )
-async def matrix_register(current_user: CurrentUser, db: SessionDep):
+async def matrix_register(current_user: CurrentPrincipal, db: SessionDep):
     """
     Called when a user opens the chat for the first time.
     Provisions a Matrix account if one doesn't exist yet.
@@ -48,7 +48,7 @@ async def matrix_register(current_user: CurrentUser, db: SessionDep):
     status_code=status.HTTP_200_OK,
     summary="Get Matrix access token for current user",
 )
-async def get_matrix_token(current_user: CurrentUser, db: SessionDep):
+async def get_matrix_token(current_user: CurrentPrincipal, db: SessionDep):
     """
     Returns the Matrix access token (and user id / homeserver) for the
     currently authenticated platform user.  Provisions a Matrix account
@@ -72,7 +72,7 @@ async def get_matrix_token(current_user: CurrentUser, db: SessionDep):
 )
 async def inquire_listing(
     data: ListingInquiryRequest,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     user_service: UserServiceDep,
     db: SessionDep,
 ):
@@ -107,7 +107,7 @@ async def inquire_listing(
     status_code=status.HTTP_200_OK,
     summary="List user's Matrix chat rooms",
 )
-async def get_my_rooms(current_user: CurrentUser, db: SessionDep):
+async def get_my_rooms(current_user: CurrentPrincipal, db: SessionDep):
     """Return all Matrix rooms the current user participates in."""
     rooms_data = await get_user_rooms(current_user.id, db)
     rooms = [RoomSummary(**r) for r in rooms_data]
@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.metrics import metrics
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class LocalLRU:
+    """Small thread-safe LRU with a per-entry time-to-live."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TwoTierCache:
+    """
+    Read-through cache of rendered strings: an in-process LRU in front of
+    Redis.
+
+    Invalidation is by generation. Redis keys embed a shared generation
+    counter, so one INCR retires every entry at once, on every worker. A
+    value computed before an invalidation is stored under the old
+    generation and never served. Other workers' local tiers keep serving
+    for at most ``local_ttl_seconds``, which is why that TTL stays short.
+
+    Redis being down degrades to the local tier, never to an error.
+    Hits and misses are counted per tier in ``cache_requests_total``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: int,
+        local_ttl_seconds: float,
+        local_max_size: int,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._local = LocalLRU(local_max_size, local_ttl_seconds)
+        self._local_generation = 0
+        self._generation_key = f"cache:{name}:generation"
+
+    async def _redis_generation(self) -> Optional[str]:
+        try:
+            return await get_redis().get(self._generation_key) or "0"
+        except (RedisError, OSError) as e:
+            self._record_error("get", e)
+            return None
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        metrics.incr("cache_errors_total", cache=self.name, op=operation)
+        logger.warning(f"{self.name} cache: Redis {operation} failed: {error}")
+
+    async def get_or_set(
+        self, key: str, compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        value = self._local.get(key)
+        if value is not None:
+            metrics.incr("cache_requests_total", cache=self.name, tier="local")
+            return value
+
+        # Both generations are read before computing, so a write that lands
+        # while we compute retires what we are about to store.
+        local_generation = self._local_generation
+        generation = await self._redis_generation()
+        redis_key = f"cache:{self.name}:{generation}:{key}"
+
+        if generation is not None:
+            try:
+                value = await get_redis().get(redis_key)
+            except (RedisError, OSError) as e:
+                self._record_error("get", e)
+                generation = None
+        if value is not None:
+            metrics.incr("cache_requests_total", cache=self.name, tier="redis")
+            self._local.set(key, value)
+            return value
+
+        metrics.incr("cache_requests_total", cache=self.name, tier="miss")
+        value = await compute()
+
+        if generation is not None:
+            try:
+                await get_redis().set(redis_key, value, ex=self.ttl_seconds)
+            except (RedisError, OSError) as e:
+                self._record_error("set", e)
+        if local_generation == self._local_generation:
+            self._local.set(key, value)
+        return value
+
+    async def invalidate(self) -> None:
+        """Drops every entry, locally at once and on other workers via Redis."""
+        self._local_generation += 1
+        self._local.clear()
+        metrics.incr("cache_invalidations_total", cache=self.name)
+        try:
+            await get_redis().incr(self._generation_key)
+        except (RedisError, OSError) as e:
+            self._record_error("incr", e)
@@ -52,6 +52,17 @@ class Settings(RegioBaseSettings):
     POSTGRES_PORT: int = 5432
 
     REDIS_URL: str
+    # One pool per worker, shared by auth, caches and rate limiting.
+    # Callers wait up to REDIS_POOL_TIMEOUT_SECONDS for a free connection
+    # once all REDIS_MAX_CONNECTIONS are in use; idle connections are
+    # pinged before reuse after REDIS_HEALTH_CHECK_SECONDS.
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5
+    REDIS_HEALTH_CHECK_SECONDS: int = 30
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5
+    # Where rate-limit buckets live: "redis" (shared by all workers) or
+    # "memory" (per worker; for tests and local runs without Redis)
+    RATE_LIMIT_BACKEND: Literal["redis", "memory"] = "redis"
 
     R2_BUCKET_NAME: str
     R2_ENDPOINT_URL: str
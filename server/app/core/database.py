@@ -113,7 +113,7 @@ async def init_db() -> None:
                 db_user = User(
                     user_code=user_settings.SYSTEM_SINK_CODE,
                     email=user_settings.SYSTEM_SINK_EMAIL,
-                    password_hash=get_password_hash(
+                    password_hash=await get_password_hash(
                         user_settings.SYSTEM_SINK_PASSWORD
                     ),
                     first_name=user_settings.SYSTEM_SINK_FIRST_NAME,
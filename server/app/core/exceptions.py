@@ -4,3 +4,12 @@ class FileUploadError(Exception):
     def __init__(self, detail: str = "File upload failed."):
         self.detail = detail
         super().__init__(self.detail)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a rate limiter bucket is empty."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        self.detail = "Too many requests, please try again later."
+        super().__init__(self.detail)
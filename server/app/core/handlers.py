@@ -1,8 +1,11 @@
 import logging
+import math
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
+from app.core.exceptions import RateLimitExceeded
+
 # Setup a logger (or import your configured logger)
 logger = logging.getLogger("uvicorn.error")
 
@@ -24,3 +27,14 @@ async def global_exception_handler(request: Request, exc: Exception):
             "detail": "An unexpected error occurred. Please contact support."
         },
     )
+
+
+async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+    """
+    Returns 429 with the seconds until the client may retry.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
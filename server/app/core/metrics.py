@@ -0,0 +1,50 @@
+import threading
+from collections import defaultdict
+
+
+def _series_key(name: str, labels: dict[str, str]) -> str:
+    """Renders a series the way Prometheus does: name{a="x",b="y"}."""
+    if not labels:
+        return name
+    rendered = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+class MetricsRegistry:
+    """
+    Process-local counters and gauges.
+
+    Cheap enough to call from hot paths; a lock keeps it safe for the
+    worker threads used alongside the event loop. Exposed to admins via
+    GET /admin/metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(float)
+        self._gauges: dict[str, float] = {}
+
+    def incr(self, name: str, value: float = 1, **labels: str) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] += value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def adjust_gauge(self, name: str, delta: float, **labels: str) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + delta
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+            }
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,46 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor is the sort key of the last row a client has seen, serialised as
+URL-safe base64 JSON. Clients must treat it as an opaque string.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded."""
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> list:
+    """
+    Decodes a cursor and converts each position with the matching parser,
+    e.g. decode_cursor(c, datetime.fromisoformat, uuid.UUID).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values: Sequence[Any] = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise InvalidCursor(cursor)
+        return [parse(v) for parse, v in zip(parsers, values)]
+    except InvalidCursor:
+        raise
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
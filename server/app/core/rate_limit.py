@@ -0,0 +1,126 @@
+"""
+Token-bucket rate limiting.
+
+Each bucket holds up to ``capacity`` tokens and refills at
+``capacity / per_seconds`` tokens a second; a request takes one token or
+is rejected with RateLimitExceeded (429 + Retry-After). Buckets live in
+Redis, updated atomically by a Lua script on the server's clock, so every
+worker shares them. If Redis is unreachable, or RATE_LIMIT_BACKEND is
+"memory" (tests, local runs), each worker keeps its own buckets instead.
+
+A ``RateLimiter`` is a FastAPI dependency keyed by client IP, and
+``check(key)`` limits on anything else (an email, an invite code). Both
+run before the route touches the database.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import Request
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.exceptions import RateLimitExceeded
+from app.core.metrics import metrics
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] bucket; ARGV capacity, refill rate (tokens/s).
+# Returns {allowed (0/1), seconds until a token is available}.
+_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, tostring(retry_after)}
+"""
+
+# Buckets kept per worker by the in-memory backend; the least recently
+# used go first, so a spray of addresses cannot grow it without bound
+_LOCAL_MAX_BUCKETS = 10000
+
+
+class _LocalBuckets:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def take(self, key: str, capacity: int, rate: float) -> tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - ts) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_size:
+                self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+
+_local_buckets = _LocalBuckets(_LOCAL_MAX_BUCKETS)
+
+
+def client_ip(request: Request) -> str:
+    # Behind a proxy, run uvicorn with --proxy-headers so this is the
+    # real client rather than the proxy
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimiter:
+    def __init__(self, name: str, capacity: int, per_seconds: float):
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / per_seconds
+
+    async def _take(self, key: str) -> tuple[bool, float]:
+        if settings.RATE_LIMIT_BACKEND == "redis":
+            try:
+                script = get_redis().register_script(_TOKEN_BUCKET)
+                allowed, retry_after = await script(
+                    keys=[f"ratelimit:{self.name}:{key}"],
+                    args=[self.capacity, self.rate],
+                )
+                return bool(allowed), float(retry_after)
+            except (RedisError, OSError) as e:
+                metrics.incr("rate_limit_errors_total", limiter=self.name)
+                logger.warning(
+                    f"{self.name} rate limit: Redis unavailable, "
+                    f"using per-worker buckets: {e}"
+                )
+        return _local_buckets.take(
+            f"{self.name}:{key}", self.capacity, self.rate
+        )
+
+    async def check(self, key: str) -> None:
+        """Takes a token for ``key`` or raises RateLimitExceeded."""
+        # Hashed so emails and codes are not stored in Redis as-is
+        digest = hashlib.sha256(key.strip().lower().encode()).hexdigest()
+        allowed, retry_after = await self._take(digest[:32])
+        if not allowed:
+            metrics.incr("rate_limit_rejected_total", limiter=self.name)
+            raise RateLimitExceeded(retry_after)
+
+    async def __call__(self, request: Request) -> None:
+        """Dependency form: limits per client IP."""
+        await self.check(client_ip(request))
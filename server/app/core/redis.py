@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Optional
+from urllib.parse import urlparse
+
+from fastapi import Depends
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before resubscribing after a dropped connection
+_RESUBSCRIBE_DELAY_SECONDS = 5
+
+# How long a subscriber waits for a message before looping again; each
+# loop pings the server once REDIS_HEALTH_CHECK_SECONDS have passed
+_LISTEN_POLL_SECONDS = 10
+
+# Only pass SSL options for rediss:// URLs; the plain redis:// connection
+# class rejects them.
+_ssl_kwargs = (
+    {"ssl_cert_reqs": None}
+    if urlparse(settings.REDIS_URL).scheme == "rediss"
+    else {}
+)
+
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """
+    The process-wide client and its connection pool. The app lifespan
+    opens and closes it (``open_redis`` / ``close_redis``); scripts and
+    code running outside the app get it on first use.
+    """
+    global _client
+    if _client is None:
+        pool = BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            **_ssl_kwargs,
+        )
+        _client = Redis.from_pool(pool)
+    return _client
+
+
+# Shared client for routes and services
+RedisDep = Annotated[Redis, Depends(get_redis)]
+
+
+def _subscriber_client() -> Redis:
+    """
+    A client of its own for one subscription. A subscriber sits idle
+    between messages, so it must not inherit the pool's socket timeout,
+    and holding one of the pool's connections for the app's lifetime
+    would shrink it.
+    """
+    return Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_SECONDS,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_timeout=None,
+        **_ssl_kwargs,
+    )
+
+
+async def ping_redis() -> bool:
+    try:
+        return bool(await get_redis().ping())
+    except (RedisError, OSError) as e:
+        logger.warning(f"Redis ping failed: {e}")
+        return False
+
+
+async def open_redis() -> None:
+    """
+    Creates the pool at startup and checks the server answers. Redis
+    being down is not fatal: caches fall back to memory and the auth
+    checks degrade as documented in their modules.
+    """
+    logger.info("Establishing Redis connection...")
+    if await ping_redis():
+        logger.info("✅ Redis connection established.")
+    else:
+        logger.error("❌ Redis is unreachable; continuing without it.")
+
+
+async def close_redis() -> None:
+    """Closes the client and every pooled connection at shutdown."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+def record_pool_metrics() -> None:
+    """Sets the pool gauges: connections in use, idle and the maximum."""
+    if _client is None:
+        return
+    pool = _client.connection_pool
+    metrics.set_gauge(
+        "redis_pool_connections",
+        len(pool._in_use_connections),
+        state="in_use",
+    )
+    metrics.set_gauge(
+        "redis_pool_connections",
+        len(pool._available_connections),
+        state="idle",
+    )
+    metrics.set_gauge("redis_pool_max_connections", pool.max_connections)
+
+
+async def subscribe(
+    channel: str,
+    handle: Callable[[str], None],
+    on_subscribe: Optional[Callable[[], Awaitable[None]]] = None,
+    on_disconnect: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Calls ``handle`` with every message published on ``channel``, for the
+    lifetime of the app; run it as a task. Messages published while not
+    subscribed are lost, so ``on_subscribe`` runs after every
+    (re)subscribe to catch up, and ``on_disconnect`` whenever the
+    subscription drops. Connection errors are logged and retried; a
+    quiet channel is not an error.
+    """
+    while True:
+        client = _subscriber_client()
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(channel)
+                if on_subscribe is not None:
+                    await on_subscribe()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=_LISTEN_POLL_SECONDS,
+                    )
+                    if message is not None and message["type"] == "message":
+                        handle(message["data"])
+        except (RedisError, OSError) as e:
+            metrics.incr("redis_subscribe_errors_total", channel=channel)
+            logger.warning(f"Redis subscription to {channel} failed: {e}")
+        finally:
+            if on_disconnect is not None:
+                on_disconnect()
+            await client.aclose()
+        await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
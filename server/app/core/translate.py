@@ -7,7 +7,9 @@ from sqlmodel import select
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.listings.cache import invalidate_feed
 from app.listings.models import Listing
+from app.listings.service import ListingService
 
 logger = logging.getLogger(__name__)
 
@@ -139,7 +141,9 @@ class TranslateService:
                     setattr(listing, field, value)
 
                 session.add(listing)
+                await ListingService(session).refresh_feed_cards([listing.id])
                 await session.commit()
+                await invalidate_feed()
 
                 logger.info(f"Translations saved for listing {listing_id}")
         except Exception:
@@ -0,0 +1,77 @@
+"""
+Caches for the listings feed.
+
+Only the unsearched first page is cached: it is what every feed visit
+opens with, while search terms and deeper pages spread across too many
+keys to hit often. Feed facets are cached per viewer and search with a
+short TTL. Entries hold the rendered JSON body, so a hit skips both the
+queries and serialization.
+"""
+
+import json
+from typing import List, Optional
+
+from app.core.cache import TwoTierCache
+from app.listings.config import listing_settings
+from app.listings.enums import ListingCategory
+from app.listings.search import search_terms
+
+feed_cache = TwoTierCache(
+    "feed",
+    ttl_seconds=listing_settings.FEED_CACHE_TTL_SECONDS,
+    local_ttl_seconds=listing_settings.FEED_CACHE_LOCAL_TTL_SECONDS,
+    local_max_size=listing_settings.FEED_CACHE_LOCAL_SIZE,
+)
+facets_cache = TwoTierCache(
+    "feed_facets",
+    ttl_seconds=listing_settings.FACETS_CACHE_TTL_SECONDS,
+    local_ttl_seconds=listing_settings.FEED_CACHE_LOCAL_TTL_SECONDS,
+    local_max_size=listing_settings.FEED_CACHE_LOCAL_SIZE,
+)
+
+
+def feed_cache_key(
+    categories: Optional[List[ListingCategory]],
+    tags: Optional[List[str]],
+    viewer_zip: Optional[str],
+    max_distance_km: Optional[int],
+    user_lang: str,
+) -> str:
+    """
+    Normalized filter tuple: order and duplicates in the repeated params
+    do not change the result, so they do not change the key either.
+    """
+    return json.dumps(
+        [
+            sorted({c.value for c in categories or []}),
+            sorted(set(tags or [])),
+            viewer_zip or None,
+            max_distance_km if viewer_zip else None,
+            user_lang.lower(),
+        ],
+        separators=(",", ":"),
+    )
+
+
+def facets_cache_key(
+    search_query: Optional[str],
+    viewer_zip: Optional[str],
+    max_distance_km: Optional[int],
+    user_lang: str,
+) -> str:
+    """Searches for the same words share an entry, however they are typed."""
+    return json.dumps(
+        [
+            search_terms(search_query) if search_query else None,
+            viewer_zip or None,
+            max_distance_km if viewer_zip else None,
+            user_lang.lower(),
+        ],
+        separators=(",", ":"),
+    )
+
+
+async def invalidate_feed() -> None:
+    """Call after any change that can alter what a feed card shows."""
+    await feed_cache.invalidate()
+    await facets_cache.invalidate()
@@ -0,0 +1,32 @@
+from typing import Literal
+
+from app.base_config import RegioBaseSettings
+
+
+class ListingConfig(RegioBaseSettings):
+    # First feed pages are cached in Redis for FEED_CACHE_TTL_SECONDS and in
+    # each worker's memory for FEED_CACHE_LOCAL_TTL_SECONDS. The local TTL
+    # bounds how long another worker may serve a page after a listing
+    # change, so keep it short.
+    FEED_CACHE_TTL_SECONDS: int = 60
+    FEED_CACHE_LOCAL_TTL_SECONDS: int = 5
+    FEED_CACHE_LOCAL_SIZE: int = 256
+    # Feed facets (counts per category / tag / D-class) in Redis
+    FACETS_CACHE_TTL_SECONDS: int = 30
+
+    # How often each worker checks zip_distances for changes and reloads
+    # its in-memory ZIP index
+    ZIP_INDEX_REFRESH_MINUTES: int = 60
+    # How often each worker reloads its in-memory tag autocomplete index,
+    # picking up tags changed by other workers and new usage counts
+    TAG_INDEX_REFRESH_MINUTES: int = 5
+    # How often tags.usage_count is recounted to correct any drift
+    TAG_USAGE_RECONCILE_MINUTES: int = 60
+
+    # How the feed decides which local (D1–D4) listings a viewer ZIP sees:
+    # "fanout" precomputes post_visibilities rows per listing, "radius"
+    # resolves it at query time. See app/listings/visibility.py.
+    VISIBILITY_ENGINE: Literal["fanout", "radius"] = "fanout"
+
+
+listing_settings = ListingConfig()
@@ -46,3 +46,7 @@ class TagNotAllowed(InvalidListingData):
 
 class MediaLimitExceeded(InvalidListingData):
     detail = "Too many files or file exceeds size/type limits"
+
+
+class InvalidFeedCursor(InvalidListingData):
+    detail = "Invalid feed cursor"
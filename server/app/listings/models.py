@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import sqlalchemy as sa
 from sqlalchemy import DateTime, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from app.listings.enums import ListingCategory, ListingStatus
@@ -89,6 +89,11 @@ class Tag(SQLModel, table=True):
     is_official: bool = Field(
         default=False
     )  # False = User suggested (Pending), True = Approved
+    # ACTIVE listings carrying this tag. Kept in step by every listing
+    # write in the same transaction; run_tag_usage_reconcile fixes drift.
+    usage_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"}
+    )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_type=DateTime(timezone=True),
@@ -149,8 +154,55 @@ class ListingEditLog(SQLModel, table=True):
     )
 
 
+# Weighted full-text document behind listings.search_vector: titles (A)
+# outrank descriptions (B). The original text is indexed with the
+# language-neutral 'simple' config so it is searchable before translation;
+# each translation is stemmed in its own language.
+SEARCH_DOCUMENT_SOURCES = (
+    ("title_original", "simple", "A"),
+    ("title_en", "english", "A"),
+    ("title_de", "german", "A"),
+    ("title_hu", "hungarian", "A"),
+    ("description_original", "simple", "B"),
+    ("description_en", "english", "B"),
+    ("description_de", "german", "B"),
+    ("description_hu", "hungarian", "B"),
+)
+SEARCH_DOCUMENT = " || ".join(
+    f"setweight(to_tsvector('{config}'::regconfig, "
+    f"coalesce({column}, '')), '{weight}')"
+    for column, config, weight in SEARCH_DOCUMENT_SOURCES
+)
+
+
 class Listing(SQLModel, table=True):
     __tablename__ = "listings"
+    # The search vector is maintained by Postgres and only read in SQL, so
+    # it is kept out of the ORM mapping (and out of every SELECT).
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+    __table_args__ = (
+        # Keyset pagination, newest first with id as tie-breaker: the feed
+        # seeks within a status, "My Listings" within an owner.
+        sa.Index(
+            "ix_listings_status_created",
+            "status",
+            sa.text("created_at DESC"),
+            "id",
+        ),
+        sa.Index(
+            "ix_listings_owner_created",
+            "owner_id",
+            sa.text("created_at DESC"),
+            "id",
+        ),
+        # Query-time radius visibility matches listing ZIPs per D-class
+        sa.Index("ix_listings_zip_d_class", "zip_code", "d_class"),
+        sa.Index(
+            "ix_listings_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     owner_id: uuid.UUID = Field(
@@ -200,6 +252,13 @@ class Listing(SQLModel, table=True):
     # POLYMORPHIC ATTRIBUTES
     attributes: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
 
+    search_vector: Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            TSVECTOR, sa.Computed(SEARCH_DOCUMENT, persisted=True)
+        ),
+    )
+
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_type=DateTime(timezone=True),
@@ -213,3 +272,60 @@ class Listing(SQLModel, table=True):
     # Relationships
     owner: "User" = Relationship(back_populates="listings")
     tags: List[Tag] = Relationship(link_model=ListingTagLink)
+
+
+# Languages a feed card is pre-rendered in
+CARD_LANGUAGES = ("en", "de", "hu")
+
+
+class FeedCard(SQLModel, table=True):
+    """
+    Read model for the feed: one pre-rendered ``ListingPublic`` per ACTIVE
+    listing and language.
+
+    Maintained by ListingService whenever a listing, its owner, its tags or
+    its translations change, in the same transaction as the change. Rows
+    exist only while the listing is ACTIVE. The columns next to ``card``
+    are copies of what the feed filters and sorts on, so a feed page is a
+    single scan of this table.
+    """
+
+    __tablename__ = "feed_cards"
+    __table_args__ = (
+        sa.Index(
+            "ix_feed_cards_lang_created",
+            "lang",
+            sa.text("created_at DESC"),
+            "listing_id",
+        ),
+    )
+
+    listing_id: uuid.UUID = Field(
+        sa_column=Column(
+            sa.Uuid,
+            sa.ForeignKey("listings.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        )
+    )
+    lang: str = Field(
+        sa_column=Column(String(2), primary_key=True, nullable=False)
+    )
+
+    category: ListingCategory
+    zip_code: Optional[str] = Field(
+        default=None, sa_column=Column(String(4), nullable=True)
+    )
+    d_class: Optional[str] = Field(
+        default=None, sa_column=Column(String(2), nullable=True)
+    )
+    tag_ids: List[int] = Field(
+        default=[],
+        sa_column=Column(
+            ARRAY(sa.Integer), nullable=False, server_default="{}"
+        ),
+    )
+    created_at: datetime = Field(sa_type=DateTime(timezone=True))
+
+    # ListingPublic.model_dump(mode="json") for this language
+    card: Dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
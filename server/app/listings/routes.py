@@ -1,13 +1,22 @@
+import functools
 import uuid
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Query, UploadFile, status
+from fastapi.responses import Response
 
 from app.core.file_storage import StorageServiceDep
 from app.core.translate import TranslateService
+from app.listings.cache import (
+    facets_cache,
+    facets_cache_key,
+    feed_cache,
+    feed_cache_key,
+)
 from app.listings.dependencies import ListingServiceDep
 from app.listings.enums import ListingCategory, ListingStatus
 from app.listings.schemas import (
+    FeedFacets,
     FeedResponse,
     ListingCreate,
     ListingEditLogEntry,
@@ -66,9 +75,10 @@ async def create_listing(
     response_model=FeedResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor."},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "description": "Internal server error."
-        }
+        },
     },
 )
 async def get_feed(
@@ -95,6 +105,10 @@ async def get_feed(
     offset: int = Query(
         0, ge=0, description="Pagination offset (skip N items)."
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from next_page_cursor; takes precedence over offset.",
+    ),
     lang: str = Query(
         "en", description="Language for localized content (en, de, hu)."
     ),
@@ -106,16 +120,81 @@ async def get_feed(
       - Listings with d_class D5 (Nationwide) or D6 (Online) always appear.
       - Local listings (D1–D4) appear only when the viewer's ZIP is in post_visibilities.
       - max_distance_km adds an extra viewer-side cap on top of the listing's declared range.
+
+    First pages without a search term are served from the feed cache.
     """
-    return await service.get_feed(
+    get_feed_page = functools.partial(
+        service.get_feed,
         categories=categories,
         search_query=q,
         tags=tags,
         viewer_zip=viewer_zip,
         max_distance_km=max_distance_km,
         offset=offset,
+        cursor=cursor,
         user_lang=lang,
     )
+    if q or cursor or offset:
+        return await get_feed_page()
+
+    async def render() -> str:
+        return (await get_feed_page()).model_dump_json()
+
+    # Unsearched first pages come pre-rendered from the feed cache
+    key = feed_cache_key(categories, tags, viewer_zip, max_distance_km, lang)
+    body = await feed_cache.get_or_set(key, render)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/feed/facets",
+    response_model=FeedFacets,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+        },
+    },
+)
+async def get_feed_facets(
+    service: ListingServiceDep,
+    q: Optional[str] = Query(
+        None, description="Search term for titles and descriptions."
+    ),
+    viewer_zip: Optional[str] = Query(
+        None, description="Viewer's homebase ZIP code."
+    ),
+    max_distance_km: Optional[int] = Query(
+        None,
+        ge=0,
+        le=50,
+        description="Max distance (km) from viewer's ZIP. Only applies when viewer_zip is set.",
+    ),
+    lang: str = Query(
+        "en", description="Language for tag labels (en, de, hu)."
+    ),
+) -> Any:
+    """
+    Filter counts for the feed.
+
+    How many listings the feed shows for this viewer and search term per
+    category, per D-class and for the most used tags. Category and tag
+    filters are not applied, so the counts can label the filter options.
+    Cached briefly per viewer and search.
+    """
+
+    async def render() -> str:
+        facets = await service.get_feed_facets(
+            search_query=q,
+            viewer_zip=viewer_zip,
+            max_distance_km=max_distance_km,
+            user_lang=lang,
+        )
+        return facets.model_dump_json()
+
+    key = facets_cache_key(q, viewer_zip, max_distance_km, lang)
+    body = await facets_cache.get_or_set(key, render)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -150,6 +229,7 @@ async def autocomplete_tags(
     response_model=FeedResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor."},
         status.HTTP_401_UNAUTHORIZED: {
             "description": "User is not authenticated."
         },
@@ -169,6 +249,10 @@ async def get_my_listings(
     offset: int = Query(
         0, ge=0, description="Pagination offset (skip N items)."
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from next_page_cursor; takes precedence over offset.",
+    ),
     lang: str = Query(
         "en", description="Language for localized content (en, de, hu)."
     ),
@@ -183,6 +267,7 @@ async def get_my_listings(
         current_user,
         status_filter=listing_status,
         offset=offset,
+        cursor=cursor,
         user_lang=lang,
     )
 
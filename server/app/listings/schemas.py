@@ -270,7 +270,26 @@ class ListingPublic(BaseModel):
 
 class FeedResponse(BaseModel):
     data: List[ListingPublic]
+    # Offset of the next page, for clients still paginating by offset
     next_cursor: Optional[int] = None
+    # Opaque keyset cursor for the next page; pass it back as ?cursor=
+    next_page_cursor: Optional[str] = None
+
+
+class FacetCount(BaseModel):
+    value: str
+    # Localized display label (tags only)
+    label: Optional[str] = None
+    count: int
+
+
+class FeedFacets(BaseModel):
+    """Counts of visible listings per filter value, for the feed's filter UI."""
+
+    total: int
+    categories: List[FacetCount]
+    tags: List[FacetCount]  # most used first; value is the canonical name
+    d_classes: List[FacetCount]
 
 
 class ListingEditLogEntry(BaseModel):
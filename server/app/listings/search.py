@@ -0,0 +1,72 @@
+"""
+Full-text search over listings.
+
+Queries run against the generated ``listings.search_vector`` column (see
+``SEARCH_DOCUMENT``), backed by a GIN index. Every word of the input is
+matched as a prefix, so search-as-you-type works on partial words, and
+each word may match in any of the indexed languages.
+"""
+
+import re
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSQUERY
+
+from app.listings.models import SEARCH_DOCUMENT_SOURCES, Listing
+
+# Longer inputs are truncated; each word adds a term per language config
+MAX_SEARCH_TERMS = 8
+
+_CONFIGS = tuple(
+    dict.fromkeys(config for _, config, _ in SEARCH_DOCUMENT_SOURCES)
+)
+_WORD = re.compile(r"[^\W_]+")
+
+search_vector = Listing.__table__.c.search_vector
+
+
+def search_terms(text: str) -> list[str]:
+    """The words of ``text`` that are searched for, lowercased."""
+    return _WORD.findall(text.lower())[:MAX_SEARCH_TERMS]
+
+
+def build_search_query(text: str) -> Optional[sa.ColumnElement]:
+    """
+    tsquery for ``text``: every word must match (AND), each as a prefix
+    under any language config (OR). None if there is nothing to search for.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return None
+
+    query = None
+    for term in terms:
+        any_language = None
+        for config in _CONFIGS:
+            # 'simple' never drops a word, so no term collapses to empty
+            part = sa.func.to_tsquery(
+                sa.literal_column(f"'{config}'::regconfig"),
+                f"{term}:*",
+                type_=TSQUERY,
+            )
+            any_language = (
+                part
+                if any_language is None
+                else any_language.op("||", return_type=TSQUERY)(part)
+            )
+        query = (
+            any_language
+            if query is None
+            else query.op("&&", return_type=TSQUERY)(any_language)
+        )
+    return query
+
+
+def matches(tsquery: sa.ColumnElement) -> sa.ColumnElement:
+    return search_vector.op("@@", return_type=sa.Boolean)(tsquery)
+
+
+def search_rank(tsquery: sa.ColumnElement) -> sa.ColumnElement:
+    """Relevance score; double precision so it round-trips in cursors."""
+    return sa.cast(sa.func.ts_rank(search_vector, tsquery), sa.Float)
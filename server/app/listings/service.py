@@ -10,6 +10,8 @@ from sqlmodel import col, desc, or_, select
 
 from app.core.config import settings
 from app.core.file_storage import LocalStorageService
+from app.core.pagination import InvalidCursor, decode_cursor, encode_cursor
+from app.listings.cache import invalidate_feed
 from app.listings.enums import (
     D_CLASS_MAX_KM,
     DClass,
@@ -17,11 +19,14 @@ from app.listings.enums import (
     ListingStatus,
 )
 from app.listings.exceptions import (
+    InvalidFeedCursor,
     ListingNotFound,
     ListingNotOwned,
     MediaLimitExceeded,
 )
 from app.listings.models import (
+    CARD_LANGUAGES,
+    FeedCard,
     Listing,
     ListingEditLog,
     ListingTagLink,
@@ -30,6 +35,8 @@ from app.listings.models import (
     ZipDistance,
 )
 from app.listings.schemas import (
+    FacetCount,
+    FeedFacets,
     FeedResponse,
     ListingCreate,
     ListingEditLogEntry,
@@ -37,6 +44,14 @@ from app.listings.schemas import (
     ListingUpdate,
     TagPublic,
 )
+from app.listings.search import build_search_query, matches, search_rank
+from app.listings.tag_index import refresh_tag_index, tag_index
+from app.listings.visibility import (
+    VisibilityEngine,
+    fanout_enabled,
+    local_visibility,
+)
+from app.listings.zip_index import zip_index
 from app.users.models import User
 
 _MEDIA_PREFIX = "/media/"
@@ -66,6 +81,9 @@ ALLOWED_MEDIA_TYPES = {
 }
 MAX_FILES_PER_LISTING = 5
 
+# Most used tags returned by the feed facets
+FACET_TAG_LIMIT = 20
+
 
 def _localize(listing: Listing, lang: str) -> tuple[str, str]:
     """Pick the best title and description for the given language, falling back to original."""
@@ -103,6 +121,87 @@ _EDIT_LOG_SCALAR_FIELDS = (
 )
 
 
+def _sort_columns(source: Any) -> tuple[Any, Any]:
+    if source is FeedCard:
+        return FeedCard.created_at, FeedCard.listing_id
+    return Listing.created_at, Listing.id
+
+
+def _paginate(
+    query,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    rank: Optional[sa.ColumnElement] = None,
+    source: Any = Listing,
+):
+    """
+    Bounds `query` to one page plus one row (to detect whether another page
+    follows), newest first or, given a search `rank`, most relevant first.
+    A cursor resumes right after the sort key it encodes, so every page
+    costs the same; without one the legacy offset is applied.
+
+    `source` is the entity being paged: Listing, or FeedCard for the
+    read-model feed. Both sort on (created_at, listing id).
+    """
+    created, row_id = _sort_columns(source)
+    order = [desc(created), row_id]
+    parsers = [datetime.fromisoformat, uuid.UUID]
+    if rank is not None:
+        order.insert(0, desc(rank))
+        parsers.insert(0, float)
+
+    if cursor:
+        try:
+            *score, created_at, listing_id = decode_cursor(cursor, *parsers)
+        except InvalidCursor:
+            raise InvalidFeedCursor()
+        # The leading range condition is what the index can seek on
+        after = sa.and_(
+            created <= created_at,
+            or_(created < created_at, row_id > listing_id),
+        )
+        if rank is not None:
+            after = or_(rank < score[0], sa.and_(rank == score[0], after))
+        query = query.where(after)
+    else:
+        query = query.offset(offset)
+    return query.order_by(*order).limit(limit + 1)
+
+
+def _visible_to(
+    source: Any,
+    viewer_zip: str,
+    max_distance_km: Optional[int],
+    visibility: Optional[VisibilityEngine] = None,
+) -> sa.ColumnElement:
+    """Feed visibility from ``viewer_zip`` for Listing or FeedCard rows."""
+    visible_here = local_visibility(viewer_zip, visibility, source)
+    if max_distance_km is not None:
+        # Extra viewer-side distance cap; D5/D6 listings bypass it.
+        nearby = zip_index.within(viewer_zip, max_distance_km)
+        visible_here = sa.and_(
+            visible_here,
+            col(source.zip_code).in_([viewer_zip, *nearby]),
+        )
+    return or_(
+        col(source.d_class).in_(["D5", "D6"]),
+        source.d_class == None,  # noqa: E711 — legacy rows
+        visible_here,
+    )
+
+
+def _next_page(
+    keys: List[tuple], limit: int, offset: int, cursor: Optional[str]
+) -> tuple[Optional[int], Optional[str]]:
+    """Legacy offset and keyset cursor for the page after `keys` (one sort
+    key per fetched row)."""
+    if len(keys) <= limit:
+        return None, None
+    next_offset = None if cursor else offset + limit
+    return next_offset, encode_cursor(*keys[limit - 1])
+
+
 class ListingService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -114,36 +213,8 @@ class ListingService:
     async def search_tags(
         self, query: str, lang: str = "en"
     ) -> List[TagPublic]:
-        """Autocomplete for tags, searching the localized name column for the given lang."""
-        lang = lang.lower()
-        lang_col = {
-            "de": Tag.name_de,
-            "hu": Tag.name_hu,
-        }.get(lang, Tag.name_en)
-
-        pattern = f"%{query}%"
-        statement = (
-            select(Tag)
-            .where(
-                or_(
-                    col(Tag.name).ilike(pattern),
-                    col(lang_col).ilike(pattern),
-                )
-            )
-            .limit(10)
-        )
-        results = await self.session.execute(statement)
-        tags = results.scalars().all()
-
-        return [
-            TagPublic(
-                id=tag.id,
-                name=tag.name,  # canonical English — client submits this when creating listings
-                label=_tag_label(tag, lang),
-                is_official=tag.is_official,
-            )
-            for tag in tags
-        ]
+        """Autocomplete for tags, matching the canonical and the localized name for the given lang."""
+        return tag_index.search(query, lang)
 
     async def _process_tags(self, raw_tags: List[str]) -> List[Tag]:
         """Resolve canonical tag names to Tag rows, creating unknown ones as suggestions.
@@ -171,6 +242,58 @@ class ListingService:
 
         return [by_name[tag_name] for tag_name in ordered]
 
+    async def shift_tag_usage(
+        self, listing_ids: List[uuid.UUID], delta: int
+    ) -> None:
+        """
+        Add ``delta`` to the usage counter of every tag linked to these
+        listings. Callers apply -1 before a listing stops counting (leaves
+        ACTIVE or loses tags) and +1 once its new links are flushed.
+        """
+        if not listing_ids:
+            return
+        links = (
+            sa.select(ListingTagLink.tag_id, sa.func.count().label("listings"))
+            .where(col(ListingTagLink.listing_id).in_(listing_ids))
+            .group_by(ListingTagLink.tag_id)
+            .subquery()
+        )
+        await self.session.execute(
+            sa.update(Tag)
+            .where(Tag.id == links.c.tag_id)
+            .values(usage_count=Tag.usage_count + delta * links.c.listings)
+        )
+
+    async def reconcile_tag_usage(self) -> int:
+        """
+        Recount every tag's usage from listing_tags, fixing counters that
+        drifted. Returns how many tags were corrected.
+        """
+        actual = (
+            sa.select(sa.func.count())
+            .select_from(ListingTagLink)
+            .join(Listing, Listing.id == ListingTagLink.listing_id)
+            .where(
+                ListingTagLink.tag_id == Tag.id,
+                Listing.status == ListingStatus.ACTIVE,
+            )
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            sa.update(Tag)
+            .where(Tag.usage_count != actual)
+            .values(usage_count=actual)
+            .returning(Tag.id)
+        )
+        corrected = len(result.all())
+        await self.session.commit()
+        return corrected
+
+    async def _index_new_tags(self, tags: List[Tag]) -> None:
+        """Reload the autocomplete index once suggested tags are committed."""
+        if any(tag.id not in tag_index for tag in tags):
+            await refresh_tag_index()
+
     # --------------------------------------------------------
     # POST VISIBILITY (ZIP-code pre-computation)
     # --------------------------------------------------------
@@ -183,33 +306,34 @@ class ListingService:
         post_visibilities. Called after a listing is created or its zip/d_class changes.
 
         D5/D6 listings skip this — they are always shown to everyone.
+
+        All rows go in with one INSERT ... SELECT over zip_distances and
+        nothing is committed here, so they land in the caller's transaction
+        together with the listing write. The neighbourhood is read from the
+        table rather than the in-memory ZIP index, which may not be loaded
+        in scripts and jobs.
         """
         if d_class in (DClass.D5, DClass.D6) or not zip_code:
             return
 
         max_km = D_CLASS_MAX_KM[d_class]
+        post_id = sa.literal(listing_id, sa.Uuid)
 
-        if max_km == 0:
-            # D1: direct neighborhood — same ZIP only
-            self.session.add(
-                PostVisibility(post_id=listing_id, viewer_zip=zip_code)
-            )
-        else:
-            # D2–D4: all ZIPs within max_km, plus own ZIP as fallback
-            stmt = select(ZipDistance.zip_to).where(
+        # D1: direct neighborhood — same ZIP only.
+        # D2–D4: all ZIPs within max_km, plus own ZIP as fallback.
+        rows = sa.select(post_id, sa.literal(zip_code, sa.String))
+        if max_km:
+            nearby = sa.select(post_id, ZipDistance.zip_to).where(
                 ZipDistance.zip_from == zip_code,
                 ZipDistance.distance_km <= max_km,
             )
-            results = await self.session.execute(stmt)
-            target_zips: set[str] = {row[0] for row in results}
-            target_zips.add(zip_code)  # Always include own ZIP
-
-            for z in target_zips:
-                self.session.add(
-                    PostVisibility(post_id=listing_id, viewer_zip=z)
-                )
+            rows = sa.union(rows, nearby)
 
-        await self.session.commit()
+        await self.session.execute(
+            sa.insert(PostVisibility).from_select(
+                ["post_id", "viewer_zip"], rows
+            )
+        )
 
     async def _cleanup_post_visibilities(self, listing_id: uuid.UUID) -> None:
         """Remove all post_visibilities rows for a listing (before re-populating)."""
@@ -218,6 +342,93 @@ class ListingService:
         )
         await self.session.execute(stmt)
 
+    # --------------------------------------------------------
+    # FEED CARDS (read model for the feed)
+    # --------------------------------------------------------
+
+    async def refresh_feed_cards(self, listing_ids: List[uuid.UUID]) -> None:
+        """
+        Re-render the feed cards of the given listings in the current
+        transaction: ACTIVE listings get fresh cards in every card language,
+        the rest lose theirs. Call it before committing any change that
+        shows on a card (listing, owner, tag or translation).
+        """
+        listing_ids = list(dict.fromkeys(listing_ids))
+        if not listing_ids:
+            return
+
+        await self.session.flush()
+        await self.session.execute(
+            sa.delete(FeedCard).where(
+                col(FeedCard.listing_id).in_(listing_ids)
+            )
+        )
+
+        stmt = (
+            select(Listing)
+            .where(
+                col(Listing.id).in_(listing_ids),
+                Listing.status == ListingStatus.ACTIVE,
+            )
+            .options(selectinload(Listing.owner), selectinload(Listing.tags))
+            .execution_options(populate_existing=True)
+        )
+        listings = (await self.session.execute(stmt)).scalars().all()
+
+        rows = []
+        for listing in listings:
+            tag_ids = [tag.id for tag in listing.tags or []]
+            for lang in CARD_LANGUAGES:
+                card = await self.format_listing(listing, lang)
+                rows.append(
+                    {
+                        "listing_id": listing.id,
+                        "lang": lang,
+                        "category": listing.category,
+                        "zip_code": listing.zip_code,
+                        "d_class": listing.d_class,
+                        "tag_ids": tag_ids,
+                        "created_at": listing.created_at,
+                        "card": card.model_dump(mode="json"),
+                    }
+                )
+        if rows:
+            await self.session.execute(sa.insert(FeedCard), rows)
+
+    async def refresh_owner_feed_cards(self, owner_id: uuid.UUID) -> None:
+        """Re-render the cards of every listing an owner has (name, avatar, city)."""
+        stmt = select(Listing.id).where(
+            Listing.owner_id == owner_id,
+            Listing.status == ListingStatus.ACTIVE,
+        )
+        listing_ids = (await self.session.execute(stmt)).scalars().all()
+        await self.refresh_feed_cards(listing_ids)
+
+    async def tagged_listing_ids(self, tag_id: int) -> List[uuid.UUID]:
+        stmt = select(ListingTagLink.listing_id).where(
+            ListingTagLink.tag_id == tag_id
+        )
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def rebuild_feed_cards(self, batch_size: int = 500) -> int:
+        """
+        Re-render every card from scratch and commit. Backfills the read
+        model and repairs any drift; returns the number of listings carded.
+        """
+        await self.session.execute(sa.delete(FeedCard))
+        stmt = (
+            select(Listing.id)
+            .where(Listing.status == ListingStatus.ACTIVE)
+            .order_by(Listing.id)
+        )
+        listing_ids = (await self.session.execute(stmt)).scalars().all()
+        for start in range(0, len(listing_ids), batch_size):
+            await self.refresh_feed_cards(
+                listing_ids[start : start + batch_size]
+            )
+        await self.session.commit()
+        return len(listing_ids)
+
     # --------------------------------------------------------
     # LISTINGS CRUD
     # --------------------------------------------------------
@@ -243,15 +454,22 @@ class ListingService:
         listing.tags = final_tags
 
         self.session.add(listing)
-        await self.session.commit()
-        await self.session.refresh(listing, attribute_names=["tags"])
+        # Visibility rows and tag counts below reference the listing
+        await self.session.flush()
 
         # Populate visibility table for local listings (D1–D4)
-        if listing.zip_code and listing.d_class:
+        if fanout_enabled() and listing.zip_code and listing.d_class:
             await self._populate_post_visibilities(
                 listing.id, listing.zip_code, DClass(listing.d_class)
             )
+        await self.shift_tag_usage([listing.id], 1)
+
+        await self.refresh_feed_cards([listing.id])
+        await self.session.commit()
+        await self.session.refresh(listing, attribute_names=["tags"])
 
+        await invalidate_feed()
+        await self._index_new_tags(final_tags)
         return listing
 
     async def format_listing(
@@ -290,6 +508,7 @@ class ListingService:
         limit: int = 20,
         offset: int = 0,
         user_lang: str = "en",
+        cursor: Optional[str] = None,
     ) -> FeedResponse:
         """Owner-scoped listings across every status (incl. DELETED).
 
@@ -301,20 +520,26 @@ class ListingService:
         if status_filter is not None:
             query = query.where(Listing.status == status_filter)
 
-        query = (
-            query.order_by(desc(Listing.created_at), Listing.id)
-            .offset(offset)
-            .limit(limit)
-            .options(selectinload(Listing.owner), selectinload(Listing.tags))
+        query = _paginate(query, limit, offset, cursor).options(
+            selectinload(Listing.owner), selectinload(Listing.tags)
         )
 
-        listings = (await self.session.execute(query)).scalars().all()
+        listings = list((await self.session.execute(query)).scalars().all())
+        next_cursor, next_page_cursor = _next_page(
+            [(listing.created_at, listing.id) for listing in listings],
+            limit,
+            offset,
+            cursor,
+        )
         data = [
             await self.format_listing(listing, user_lang)
-            for listing in listings
+            for listing in listings[:limit]
         ]
-        next_cursor = offset + limit if len(listings) == limit else None
-        return FeedResponse(data=data, next_cursor=next_cursor)
+        return FeedResponse(
+            data=data,
+            next_cursor=next_cursor,
+            next_page_cursor=next_page_cursor,
+        )
 
     async def get_listing(self, listing_id: uuid.UUID) -> Listing:
         query = (
@@ -348,6 +573,11 @@ class ListingService:
         # Track if visibility needs to be rebuilt
         visibility_changed = "zip_code" in data or "d_class" in data
 
+        # Tag counters: take the listing out now, add it back once saved
+        usage_changed = "tags" in data or "status" in data
+        if usage_changed and listing.status == ListingStatus.ACTIVE:
+            await self.shift_tag_usage([listing.id], -1)
+
         if "tags" in data:
             data["tags"] = await self._process_tags(data["tags"])
         if "title" in data:
@@ -362,22 +592,29 @@ class ListingService:
         if "d_class" in data and data["d_class"] is not None:
             data["d_class"] = DClass(data["d_class"]).value
 
-        if visibility_changed:
-            await self._cleanup_post_visibilities(listing_id)
-
         listing.sqlmodel_update(data)
         self.session.add(listing)
         if edit_logs:
             self.session.add_all(edit_logs)
+
+        if usage_changed and listing.status == ListingStatus.ACTIVE:
+            await self.session.flush()  # count the new tag links
+            await self.shift_tag_usage([listing.id], 1)
+
+        # Rebuild post_visibilities in the same transaction as the edit
+        if visibility_changed:
+            await self._cleanup_post_visibilities(listing_id)
+            if fanout_enabled() and listing.zip_code and listing.d_class:
+                await self._populate_post_visibilities(
+                    listing.id, listing.zip_code, DClass(listing.d_class)
+                )
+
+        await self.refresh_feed_cards([listing.id])
         await self.session.commit()
         await self.session.refresh(listing)
 
-        # Re-populate post_visibilities after commit (new data is available)
-        if visibility_changed and listing.zip_code and listing.d_class:
-            await self._populate_post_visibilities(
-                listing.id, listing.zip_code, DClass(listing.d_class)
-            )
-
+        await invalidate_feed()
+        await self._index_new_tags(data.get("tags", []))
         return listing
 
     def _build_edit_logs(
@@ -495,8 +732,10 @@ class ListingService:
 
         listing.media_urls = (listing.media_urls or []) + new_keys
         self.session.add(listing)
+        await self.refresh_feed_cards([listing.id])
         await self.session.commit()
         await self.session.refresh(listing)
+        await invalidate_feed()
 
         return listing
 
@@ -537,9 +776,13 @@ class ListingService:
                     value_to=_edit_log_value(ListingStatus.DELETED),
                 )
             )
+            if listing.status == ListingStatus.ACTIVE:
+                await self.shift_tag_usage([listing.id], -1)
             listing.status = ListingStatus.DELETED
             self.session.add(listing)
+            await self.refresh_feed_cards([listing.id])
             await self.session.commit()
+            await invalidate_feed()
 
     # --------------------------------------------------------
     # FEED
@@ -555,6 +798,8 @@ class ListingService:
         limit: int = 20,
         offset: int = 0,
         user_lang: str = "en",
+        cursor: Optional[str] = None,
+        visibility: Optional[VisibilityEngine] = None,
     ) -> FeedResponse:
         """
         Main feed query.
@@ -563,80 +808,42 @@ class ListingService:
             - If viewer_zip is known:
                 SELECT listings WHERE d_class IN ('D5','D6')
                     OR d_class IS NULL          -- legacy listings without a class
-                    OR pv.viewer_zip = :viewer_zip
-                (with optional max_distance_km filter on D1–D4 using zip_distances)
+                    OR <local visibility>       -- see app.listings.visibility
+                (with optional max_distance_km filter on D1–D4 using the ZIP index)
             - If viewer_zip is not known: show all ACTIVE listings (backward compat)
+
+        Unsearched pages are served from the FeedCard read model. With
+        ``search_query``, results are ranked by relevance (newest first
+        among equals). Pass the previous page's ``next_page_cursor`` as
+        ``cursor`` for keyset pagination; ``offset`` still works without one.
         """
-        if viewer_zip:
-            if max_distance_km is not None:
-                # Join zip_distances to apply an additional viewer-side distance cap
-                # D5/D6 listings bypass this cap.
-                query = (
-                    select(Listing, ZipDistance.distance_km.label("dist"))
-                    .outerjoin(
-                        PostVisibility,
-                        sa.and_(
-                            PostVisibility.post_id == Listing.id,
-                            PostVisibility.viewer_zip == viewer_zip,
-                        ),
-                    )
-                    .outerjoin(
-                        ZipDistance,
-                        sa.and_(
-                            ZipDistance.zip_from == viewer_zip,
-                            ZipDistance.zip_to == Listing.zip_code,
-                        ),
-                    )
-                    .where(Listing.status == ListingStatus.ACTIVE)
-                    .where(
-                        or_(
-                            col(Listing.d_class).in_(["D5", "D6"]),
-                            Listing.d_class == None,  # noqa: E711 — legacy rows
-                            sa.and_(
-                                PostVisibility.viewer_zip == viewer_zip,
-                                or_(
-                                    ZipDistance.distance_km <= max_distance_km,
-                                    ZipDistance.distance_km
-                                    == None,  # same-ZIP rows  # noqa: E711
-                                ),
-                            ),
-                        )
-                    )
-                    .distinct(Listing.created_at, Listing.id)
-                )
-            else:
-                # Basic ZIP-based visibility (client's exact SQL pattern)
-                query = (
-                    select(Listing, ZipDistance.distance_km.label("dist"))
-                    .outerjoin(
-                        PostVisibility, PostVisibility.post_id == Listing.id
-                    )
-                    .outerjoin(
-                        ZipDistance,
-                        sa.and_(
-                            ZipDistance.zip_from == viewer_zip,
-                            ZipDistance.zip_to == Listing.zip_code,
-                        ),
-                    )
-                    .where(Listing.status == ListingStatus.ACTIVE)
-                    .where(
-                        or_(
-                            col(Listing.d_class).in_(["D5", "D6"]),
-                            Listing.d_class == None,  # noqa: E711 — legacy rows
-                            PostVisibility.viewer_zip == viewer_zip,
-                        )
-                    )
-                    .distinct(Listing.created_at, Listing.id)
-                )
+        lang = user_lang.lower()
+        # Unsearched feeds are read from the pre-rendered FeedCard rows:
+        # one scan, no joins. Search needs the listings' text index, and
+        # languages without cards fall back to rendering listings.
+        use_cards = not search_query and lang in CARD_LANGUAGES
+        source = FeedCard if use_cards else Listing
+        if use_cards:
+            # Cards only exist for ACTIVE listings
+            query = select(
+                FeedCard.card,
+                FeedCard.created_at,
+                FeedCard.listing_id,
+            ).where(FeedCard.lang == lang)
         else:
-            # No homebase ZIP — show all active listings (backward-compatible)
             query = select(Listing).where(
                 Listing.status == ListingStatus.ACTIVE
             )
 
+        # Without a homebase ZIP every active listing shows (backward compat)
+        if viewer_zip:
+            query = query.where(
+                _visible_to(source, viewer_zip, max_distance_km, visibility)
+            )
+
         # Category filter
         if categories:
-            query = query.where(col(Listing.category).in_(categories))
+            query = query.where(col(source.category).in_(categories))
 
         # Tag filter — a listing must carry every requested tag (AND semantics)
         if tags:
@@ -645,81 +852,169 @@ class ListingService:
                 name: tag_id
                 for name, tag_id in (await self.session.execute(id_stmt)).all()
             }
-            for tag in tags:
-                tag_id = tag_ids.get(tag)
-                if tag_id is None:
-                    # Unknown tag matches nothing, as with the old containment check
-                    query = query.where(sa.false())
-                    break
-                query = query.where(
-                    sa.exists().where(
-                        sa.and_(
-                            ListingTagLink.listing_id == Listing.id,
-                            ListingTagLink.tag_id == tag_id,
+            wanted = [tag_ids.get(tag) for tag in tags]
+            if None in wanted:
+                # Unknown tag matches nothing, as with the old containment check
+                query = query.where(sa.false())
+            elif use_cards:
+                query = query.where(col(FeedCard.tag_ids).contains(wanted))
+            else:
+                for tag_id in wanted:
+                    query = query.where(
+                        sa.exists().where(
+                            sa.and_(
+                                ListingTagLink.listing_id == Listing.id,
+                                ListingTagLink.tag_id == tag_id,
+                            )
                         )
                     )
-                )
 
-        # Full-text search (ILIKE across original + all translations)
+        # Full-text search: prefix match in any language, ranked
+        rank = None
         if search_query:
-            pattern = f"%{search_query}%"
-            query = query.where(
-                or_(
-                    col(Listing.title_original).ilike(pattern),
-                    col(Listing.description_original).ilike(pattern),
-                    col(Listing.title_en).ilike(pattern),
-                    col(Listing.title_de).ilike(pattern),
-                    col(Listing.title_hu).ilike(pattern),
-                    col(Listing.description_en).ilike(pattern),
-                    col(Listing.description_de).ilike(pattern),
-                    col(Listing.description_hu).ilike(pattern),
+            tsquery = build_search_query(search_query)
+            if tsquery is None:
+                query = query.where(sa.false())  # nothing searchable
+            else:
+                rank = search_rank(tsquery)
+                query = query.where(matches(tsquery)).add_columns(
+                    rank.label("rank")
                 )
-            )
 
-        query = (
-            query.order_by(desc(Listing.created_at), Listing.id)
-            .offset(offset)
-            .limit(limit)
-            .options(selectinload(Listing.owner), selectinload(Listing.tags))
-        )
+        query = _paginate(query, limit, offset, cursor, rank, source)
+        if not use_cards:
+            query = query.options(
+                selectinload(Listing.owner), selectinload(Listing.tags)
+            )
 
-        results = await self.session.execute(query)
-        rows = results.all() if viewer_zip else results.scalars().all()
+        rows = (await self.session.execute(query)).all()
+        if use_cards:
+            keys = [(row.created_at, row.listing_id) for row in rows]
+        else:
+            keys = [(row[0].created_at, row[0].id) for row in rows]
+        if rank is not None:
+            keys = [(row.rank, *key) for row, key in zip(rows, keys)]
+        next_cursor, next_page_cursor = _next_page(keys, limit, offset, cursor)
 
         feed_items = []
-        for row in rows:
-            if viewer_zip:
-                listing, dist_km = row[0], row[1]
+        for row in rows[:limit]:
+            if use_cards:
+                item = ListingPublic.model_validate(row.card)
             else:
-                listing, dist_km = row, None
-            title, description = _localize(listing, user_lang)
-            listing_tags = listing.tags or []
-            feed_items.append(
-                ListingPublic(
-                    id=listing.id,
-                    owner_code=listing.owner.user_code,
-                    owner_name=listing.owner.full_name,
-                    owner_avatar=listing.owner.avatar_url,
-                    category=listing.category,
-                    status=listing.status,
-                    title=title,
-                    description=description,
-                    payment_notes=listing.payment_notes,
-                    media_urls=[
-                        _ensure_url(k) for k in (listing.media_urls or [])
-                    ],
-                    tags=[_tag_label(t, user_lang) for t in listing_tags],
-                    tags_canonical=[t.name for t in listing_tags],
-                    zip_code=listing.zip_code,
-                    d_class=listing.d_class,
-                    owner_zip_code=listing.owner.zip_code,
-                    owner_city=listing.owner.city,
-                    distance_km=dist_km,
-                    available_until=listing.available_until,
-                    attributes=listing.attributes,
-                    created_at=listing.created_at,
+                item = await self.format_listing(row[0], user_lang)
+            if viewer_zip and item.zip_code:
+                item.distance_km = zip_index.distance(
+                    viewer_zip, item.zip_code
                 )
+            feed_items.append(item)
+
+        return FeedResponse(
+            data=feed_items,
+            next_cursor=next_cursor,
+            next_page_cursor=next_page_cursor,
+        )
+
+    async def get_feed_facets(
+        self,
+        search_query: Optional[str] = None,
+        viewer_zip: Optional[str] = None,
+        max_distance_km: Optional[int] = None,
+        user_lang: str = "en",
+    ) -> FeedFacets:
+        """
+        Per-category, per-tag and per-D-class counts of the listings the
+        feed would show for this viewer and search, before any category or
+        tag filter, so the counts stay put while the user toggles filters.
+
+        All counts come from one UNION ALL over a CTE of the visible cards.
+        Every ACTIVE listing has a card in each language; one language is
+        enough to count.
+        """
+        base = select(
+            FeedCard.listing_id,
+            FeedCard.category,
+            FeedCard.d_class,
+            FeedCard.tag_ids,
+        ).where(FeedCard.lang == CARD_LANGUAGES[0])
+        if viewer_zip:
+            base = base.where(
+                _visible_to(FeedCard, viewer_zip, max_distance_km)
             )
+        if search_query:
+            tsquery = build_search_query(search_query)
+            if tsquery is None:
+                base = base.where(sa.false())  # nothing searchable
+            else:
+                base = base.where(
+                    col(FeedCard.listing_id).in_(
+                        select(Listing.id).where(matches(tsquery))
+                    )
+                )
+        base = base.cte("visible")
+
+        def facet(name: str, value, label=None) -> list:
+            return [
+                sa.literal(name).label("facet"),
+                sa.cast(value, sa.String).label("value"),
+                sa.cast(label, sa.String).label("label"),
+                sa.func.count().label("count"),
+            ]
+
+        tagged = select(sa.func.unnest(base.c.tag_ids).label("tag_id"))
+        tagged = tagged.subquery()
+        top_tags = (
+            select(tagged.c.tag_id, sa.func.count().label("uses"))
+            .group_by(tagged.c.tag_id)
+            .order_by(desc("uses"), tagged.c.tag_id)
+            .limit(FACET_TAG_LIMIT)
+            .subquery()
+        )
+        label_column = {"de": Tag.name_de, "hu": Tag.name_hu}.get(
+            user_lang.lower(), Tag.name_en
+        )
+        tag_label = sa.func.coalesce(
+            sa.func.nullif(label_column, ""), Tag.name
+        )
 
-        next_cursor = offset + limit if len(rows) == limit else None
-        return FeedResponse(data=feed_items, next_cursor=next_cursor)
+        statement = sa.union_all(
+            select(*facet("total", sa.null())).select_from(base),
+            select(*facet("category", base.c.category)).group_by(
+                base.c.category
+            ),
+            # Legacy rows without a class are not offered as a filter
+            select(*facet("d_class", base.c.d_class))
+            .where(base.c.d_class.is_not(None))
+            .group_by(base.c.d_class),
+            select(
+                sa.literal("tag").label("facet"),
+                Tag.name.label("value"),
+                tag_label.label("label"),
+                top_tags.c.uses.label("count"),
+            ).join_from(top_tags, Tag, Tag.id == top_tags.c.tag_id),
+        )
+        rows = (await self.session.execute(statement)).all()
+
+        total = 0
+        facets: dict[str, List[FacetCount]] = {
+            "category": [],
+            "tag": [],
+            "d_class": [],
+        }
+        for row in rows:
+            if row.facet == "total":
+                total = row.count
+            else:
+                facets[row.facet].append(
+                    FacetCount(
+                        value=row.value, label=row.label, count=row.count
+                    )
+                )
+        for counts in facets.values():
+            counts.sort(key=lambda c: (-c.count, c.value))
+
+        return FeedFacets(
+            total=total,
+            categories=facets["category"],
+            tags=facets["tag"],
+            d_classes=facets["d_class"],
+        )
@@ -0,0 +1,165 @@
+"""
+In-memory index of tags for autocomplete.
+
+Tags are a few hundred rows that change rarely (seeded from
+tags_regio.json, plus user suggestions and admin edits), so each worker
+keeps them in memory and answers autocomplete without a database
+round-trip. Every name is indexed by all of its suffixes in a sorted
+list, so a prefix lookup with ``bisect`` finds a query anywhere in the
+name, as the ``ILIKE '%q%'`` it replaces did (German compounds like
+"Gartenarbeit" still match "arbeit").
+
+Matches are ranked official first, then by the number of active listings
+using the tag (``Tag.usage_count``), then by name.
+"""
+
+import logging
+from bisect import bisect_left
+from typing import NamedTuple, Optional
+
+import sqlalchemy as sa
+
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import metrics
+from app.listings.models import CARD_LANGUAGES, Tag
+from app.listings.schemas import TagPublic
+
+logger = logging.getLogger(__name__)
+
+# Results returned per autocomplete request
+AUTOCOMPLETE_LIMIT = 10
+
+# Key of the suffix list covering every name column, for admin search
+_ALL = "*"
+
+
+class _IndexedTag(NamedTuple):
+    id: int
+    name: str
+    labels: dict[str, Optional[str]]
+    is_official: bool
+    usage: int
+
+    def rank(self) -> tuple:
+        return (not self.is_official, -self.usage, self.name.casefold())
+
+
+# Per language: casefolded name suffixes and the tag id each came from,
+# sorted together by suffix
+_Suffixes = tuple[list[str], list[int]]
+
+
+def _suffixes(names) -> _Suffixes:
+    """Sorted suffix list over (tag id, name) pairs; blank names skipped."""
+    entries = set()
+    for tag_id, name in names:
+        folded = (name or "").casefold()
+        entries.update(
+            (folded[start:], tag_id) for start in range(len(folded))
+        )
+    ordered = sorted(entries)
+    return [suffix for suffix, _ in ordered], [tag_id for _, tag_id in ordered]
+
+
+class TagIndex:
+    def __init__(self):
+        self._tags: dict[int, _IndexedTag] = {}
+        self._suffixes: dict[str, _Suffixes] = {}
+        self._ranked: list[int] = []
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._suffixes)
+
+    def __contains__(self, tag_id: int) -> bool:
+        return tag_id in self._tags
+
+    def _lookup(self, query: str, key: str) -> set[int]:
+        suffixes, ids = self._suffixes.get(key, ([], []))
+        query = query.casefold()
+        found = set()
+        for position in range(bisect_left(suffixes, query), len(suffixes)):
+            if not suffixes[position].startswith(query):
+                break
+            found.add(ids[position])
+        return found
+
+    def matching_ids(self, query: str) -> list[int]:
+        """Ids of tags with ``query`` in the canonical or any localized name."""
+        return sorted(self._lookup(query, _ALL))
+
+    def search(
+        self, query: str, lang: str = "en", limit: int = AUTOCOMPLETE_LIMIT
+    ) -> list[TagPublic]:
+        """
+        Tags with ``query`` in the canonical name or the name for ``lang``
+        (English for unknown languages), best ranked first.
+        """
+        lang = lang.lower()
+        key = lang if lang in CARD_LANGUAGES else "en"
+        if query:
+            found = self._lookup(query, key)
+            tag_ids = [tag_id for tag_id in self._ranked if tag_id in found]
+        else:
+            tag_ids = self._ranked
+        return [
+            TagPublic(
+                id=tag.id,
+                name=tag.name,  # canonical English — client submits this when creating listings
+                label=tag.labels.get(lang) or tag.name,
+                is_official=tag.is_official,
+            )
+            for tag in (self._tags[tag_id] for tag_id in tag_ids[:limit])
+        ]
+
+    def build(self, rows) -> None:
+        """
+        Rebuilds from Tag rows. Readers keep using the old data until the
+        new one is swapped in whole.
+        """
+        tags = {
+            tag.id: _IndexedTag(
+                id=tag.id,
+                name=tag.name,
+                labels={
+                    lang: getattr(tag, f"name_{lang}")
+                    for lang in CARD_LANGUAGES
+                },
+                is_official=tag.is_official,
+                usage=tag.usage_count,
+            )
+            for tag in rows
+        }
+        suffixes = {
+            lang: _suffixes(
+                (tag.id, name)
+                for tag in tags.values()
+                for name in (tag.name, tag.labels[lang])
+            )
+            for lang in CARD_LANGUAGES
+        }
+        suffixes[_ALL] = _suffixes(
+            (tag.id, name)
+            for tag in tags.values()
+            for name in (tag.name, *tag.labels.values())
+        )
+        ranked = sorted(tags, key=lambda tag_id: tags[tag_id].rank())
+
+        self._tags, self._suffixes, self._ranked = tags, suffixes, ranked
+
+        metrics.set_gauge("tag_index_tags", len(tags))
+        logger.info(f"Tag index: loaded {len(tags)} tags")
+
+
+tag_index = TagIndex()
+
+
+async def refresh_tag_index() -> None:
+    """
+    Reload hook: rebuilds the index from the tags table. Called after tags
+    are created, edited or deleted in this worker, and on a schedule so
+    every worker picks up the others' changes and fresh usage counts.
+    """
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(sa.select(Tag))
+        tag_index.build(rows.scalars().all())
@@ -0,0 +1,80 @@
+"""
+Feed visibility engines for local (D1–D4) listings.
+
+``fanout`` — the original design. Each listing's reachable viewer ZIPs
+are precomputed into post_visibilities on every create/edit; the feed
+checks membership with an EXISTS.
+
+``radius`` — nothing is precomputed. A listing keeps only its ZIP and
+D-class, and the feed expands the viewer's ZIP into the listing ZIPs
+that reach it per D-class (from the in-memory ZIP index), matched
+against ix_listings_zip_d_class. No per-listing rows to write or delete.
+
+The engine is chosen with VISIBILITY_ENGINE; see
+scripts/benchmark_visibility.py for a side-by-side comparison.
+"""
+
+from typing import Any, Literal, Optional
+
+import sqlalchemy as sa
+from sqlmodel import col, or_
+
+from app.listings.config import listing_settings
+from app.listings.enums import D_CLASS_MAX_KM
+from app.listings.models import FeedCard, Listing, PostVisibility
+from app.listings.zip_index import zip_index
+
+VisibilityEngine = Literal["fanout", "radius"]
+
+
+def fanout_visibility(
+    viewer_zip: str, listing_id: Any = Listing.id
+) -> sa.ColumnElement:
+    # An EXISTS keeps one row per listing, so the feed needs no DISTINCT
+    # and can stream straight off the index.
+    return sa.exists().where(
+        PostVisibility.post_id == listing_id,
+        PostVisibility.viewer_zip == viewer_zip,
+    )
+
+
+def radius_visibility(
+    viewer_zip: str,
+    zip_code: Any = Listing.zip_code,
+    d_class: Any = Listing.d_class,
+) -> sa.ColumnElement:
+    clauses = []
+    for local_class, max_km in D_CLASS_MAX_KM.items():
+        # Own ZIP always counts, as in the fan-out; D1 is own ZIP only
+        zips = {viewer_zip}
+        if max_km:
+            zips.update(zip_index.sources_within(viewer_zip, max_km))
+        clauses.append(
+            sa.and_(
+                d_class == local_class.value,
+                col(zip_code).in_(sorted(zips)),
+            )
+        )
+    return or_(*clauses)
+
+
+def local_visibility(
+    viewer_zip: str,
+    engine: Optional[VisibilityEngine] = None,
+    source: Any = Listing,
+) -> sa.ColumnElement:
+    """
+    Condition for a D1–D4 listing being visible from ``viewer_zip``.
+    ``source`` is Listing or the FeedCard read model; both carry the
+    listing's ZIP and D-class.
+    """
+    engine = engine or listing_settings.VISIBILITY_ENGINE
+    if engine == "radius":
+        return radius_visibility(viewer_zip, source.zip_code, source.d_class)
+    listing_id = source.listing_id if source is FeedCard else source.id
+    return fanout_visibility(viewer_zip, listing_id)
+
+
+def fanout_enabled() -> bool:
+    """post_visibilities is only maintained while the fan-out engine is on."""
+    return listing_settings.VISIBILITY_ENGINE == "fanout"
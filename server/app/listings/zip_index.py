@@ -0,0 +1,170 @@
+"""
+In-memory copy of ``zip_distances`` for visibility and distance lookups.
+
+The table is static reference data (a few hundred thousand ZIP pairs), so
+each worker loads it once at startup and answers "ZIPs within K km" and
+"distance from A to B" without a database round-trip. ZIP codes are
+interned to small integers and every ZIP's neighbours, in both
+directions, are kept in parallel arrays sorted by distance, a couple of
+megabytes in all.
+"""
+
+import logging
+from array import array
+from bisect import bisect_right
+from typing import Optional
+
+import sqlalchemy as sa
+
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import metrics
+from app.listings.models import ZipDistance
+
+logger = logging.getLogger(__name__)
+
+# Per source ZIP: neighbour ids and their distances, nearest first
+_Neighbours = tuple[array, array]
+
+
+class ZipIndex:
+    def __init__(self):
+        self._zips: list[str] = []
+        self._neighbours: dict[str, _Neighbours] = {}
+        self._reverse: dict[str, _Neighbours] = {}
+        self._fingerprint: Optional[tuple] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._fingerprint is not None
+
+    def within(self, zip_code: str, max_km: int) -> list[str]:
+        """ZIPs reachable from ``zip_code`` within ``max_km``, nearest first."""
+        zips, neighbours = self._zips, self._neighbours.get(zip_code)
+        if neighbours is None:
+            return []
+        ids, distances = neighbours
+        end = bisect_right(distances, max_km)
+        return [zips[i] for i in ids[:end]]
+
+    def sources_within(self, zip_code: str, max_km: int) -> list[str]:
+        """ZIPs from which ``zip_code`` is reachable within ``max_km``.
+
+        The reverse of ``within``; driving distances are not always
+        symmetric, so visibility checks from the viewer's side use this.
+        """
+        zips, neighbours = self._zips, self._reverse.get(zip_code)
+        if neighbours is None:
+            return []
+        ids, distances = neighbours
+        end = bisect_right(distances, max_km)
+        return [zips[i] for i in ids[:end]]
+
+    def distance(self, zip_from: str, zip_to: str) -> Optional[int]:
+        """Driving distance in km, or None if the pair is not in the data."""
+        zips, neighbours = self._zips, self._neighbours.get(zip_from)
+        if neighbours is None:
+            return None
+        ids, distances = neighbours
+        for position, zip_id in enumerate(ids):
+            if zips[zip_id] == zip_to:
+                return distances[position]
+        return None
+
+    def build(self, rows, fingerprint: tuple) -> None:
+        """
+        Rebuilds from (zip_from, zip_to, distance_km) rows ordered by
+        zip_from then distance. Duplicate pairs keep their shortest
+        distance, as the feed's MIN() over the table did. Readers keep
+        using the old data until the new one is swapped in whole.
+        """
+        zips: list[str] = []
+        ids_by_zip: dict[str, int] = {}
+        neighbours: dict[str, _Neighbours] = {}
+        seen: set[int] = set()
+        current = None
+
+        for zip_from, zip_to, distance_km in rows:
+            if zip_from != current:
+                current = zip_from
+                ids, distances = neighbours[zip_from] = (
+                    array("H"),
+                    array("H"),
+                )
+                seen = set()
+            zip_id = ids_by_zip.get(zip_to)
+            if zip_id is None:
+                zip_id = ids_by_zip[zip_to] = len(zips)
+                zips.append(zip_to)
+            if zip_id in seen:
+                continue
+            seen.add(zip_id)
+            ids.append(zip_id)
+            distances.append(distance_km)
+
+        incoming: dict[str, list[tuple[int, int]]] = {}
+        for zip_from, (ids, distances) in neighbours.items():
+            from_id = ids_by_zip.get(zip_from)
+            if from_id is None:
+                from_id = ids_by_zip[zip_from] = len(zips)
+                zips.append(zip_from)
+            for zip_id, distance_km in zip(ids, distances):
+                incoming.setdefault(zips[zip_id], []).append(
+                    (distance_km, from_id)
+                )
+        reverse: dict[str, _Neighbours] = {}
+        for zip_to, sources in incoming.items():
+            sources.sort()
+            reverse[zip_to] = (
+                array("H", [zip_id for _, zip_id in sources]),
+                array("H", [distance_km for distance_km, _ in sources]),
+            )
+
+        self._zips, self._neighbours, self._reverse = (
+            zips,
+            neighbours,
+            reverse,
+        )
+        self._fingerprint = fingerprint
+
+        pairs = sum(len(ids) for ids, _ in neighbours.values())
+        metrics.set_gauge("zip_index_zips", len(neighbours))
+        metrics.set_gauge("zip_index_pairs", pairs)
+        logger.info(
+            f"ZIP index: loaded {pairs} pairs for {len(neighbours)} ZIPs"
+        )
+
+
+zip_index = ZipIndex()
+
+
+def _fingerprint_statement() -> sa.Select:
+    return sa.select(
+        sa.func.count(),
+        sa.func.coalesce(sa.func.max(ZipDistance.id), 0),
+        sa.func.coalesce(sa.func.sum(ZipDistance.distance_km), 0),
+    )
+
+
+async def refresh_zip_index(force: bool = False) -> bool:
+    """
+    Reload hook: rebuilds the index if ``zip_distances`` changed since the
+    last load (or always, with ``force``). Cheap when nothing changed, so
+    it also runs on a schedule to pick up edits in every worker. Returns
+    whether a reload happened.
+    """
+    async with AsyncSessionLocal() as session:
+        fingerprint = tuple(
+            (await session.execute(_fingerprint_statement())).one()
+        )
+        if not force and fingerprint == zip_index._fingerprint:
+            return False
+
+        rows = await session.execute(
+            sa.select(
+                ZipDistance.zip_from,
+                ZipDistance.zip_to,
+                ZipDistance.distance_km,
+            ).order_by(ZipDistance.zip_from, ZipDistance.distance_km)
+        )
+        zip_index.build(rows, fingerprint)
+    return True
@@ -1,3 +1,4 @@
+import asyncio
 import mimetypes
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -8,13 +9,22 @@ from fastapi.responses import Response
 from starlette.middleware.cors import CORSMiddleware
 
 from app.admin.routes import router as admin_router
-from app.auth.exceptions import BadAuthRequest, NotAuthorized, PermissionDenied
+from app.auth.exceptions import (
+    AuthUnavailable,
+    BadAuthRequest,
+    NotAuthorized,
+    PermissionDenied,
+)
 from app.auth.handlers import (
+    auth_unavailable_handler,
     bad_auth_request_handler,
     not_authorized_handler,
     permission_denied_handler,
 )
+from app.auth.revocation import revoked_tokens
 from app.auth.routes import router as auth_router
+from app.auth.security import hashing_pool
+from app.banking.config import banking_settings
 from app.banking.enforcer import run_payment_enforcer
 from app.banking.exceptions import (
     BankingBadRequest,
@@ -22,7 +32,12 @@ from app.banking.exceptions import (
     BankingForbidden,
     BankingNotFound,
 )
-from app.banking.fees import run_demurrage, run_monthly_fees
+from app.banking.fees import (
+    run_demurrage,
+    run_ledger_audit,
+    run_monthly_fees,
+    run_sink_rollup,
+)
 from app.banking.handlers import (
     banking_bad_request_handler,
     banking_conflict_handler,
@@ -36,10 +51,13 @@ from app.broadcast.routes import router as broadcast_router
 from app.chat.routes import router as chat_router
 from app.core.config import settings
 from app.core.database import init_db, test_db_connection
+from app.core.exceptions import RateLimitExceeded
 from app.core.file_storage import StorageServiceDep
-from app.core.handlers import global_exception_handler
+from app.core.handlers import global_exception_handler, rate_limit_handler
+from app.core.redis import close_redis, open_redis, ping_redis
 from app.email.exceptions import EmailBaseException
 from app.email.handlers import email_error_handler
+from app.listings.config import listing_settings
 from app.listings.exceptions import (
     InvalidListingData,
     ListingNotFound,
@@ -53,6 +71,8 @@ from app.listings.handlers import (
     tag_not_found_handler,
 )
 from app.listings.routes import router as listing_router
+from app.listings.tag_index import refresh_tag_index
+from app.listings.zip_index import refresh_zip_index
 from app.users.exceptions import (
     AccessDenied,
     InvalidUserRequest,
@@ -67,6 +87,7 @@ from app.users.handlers import (
     resource_not_found_handler,
     system_failure_handler,
 )
+from app.users.principal import principal_cache
 from app.users.routes import router as user_router
 
 
@@ -77,8 +98,10 @@ async def run_listing_expiry() -> None:
     import sqlalchemy as sa
 
     from app.core.database import AsyncSessionLocal
+    from app.listings.cache import invalidate_feed
     from app.listings.enums import ListingStatus
     from app.listings.models import Listing
+    from app.listings.service import ListingService
 
     async with AsyncSessionLocal() as session:
         now = datetime.now(timezone.utc)
@@ -90,10 +113,64 @@ async def run_listing_expiry() -> None:
                 Listing.status == ListingStatus.ACTIVE,
             )
             .values(status=ListingStatus.INACTIVE)
+            .returning(Listing.id)
         )
-        await session.execute(stmt)
+        expired = (await session.execute(stmt)).scalars().all()
+        service = ListingService(session)
+        await service.shift_tag_usage(expired, -1)
+        await service.refresh_feed_cards(expired)
         await session.commit()
 
+    if expired:
+        await invalidate_feed()
+
+
+async def run_feed_card_rebuild(only_if_empty: bool = False) -> None:
+    """
+    Re-render every feed card. Runs nightly to repair drift in the read
+    model, and at startup (only_if_empty) to backfill a fresh table.
+    """
+    import logging
+
+    import sqlalchemy as sa
+
+    from app.core.database import AsyncSessionLocal
+    from app.listings.cache import invalidate_feed
+    from app.listings.models import FeedCard
+    from app.listings.service import ListingService
+
+    async with AsyncSessionLocal() as session:
+        if only_if_empty:
+            has_cards = await session.execute(
+                sa.select(FeedCard.lang).limit(1)
+            )
+            if has_cards.first() is not None:
+                return
+        carded = await ListingService(session).rebuild_feed_cards()
+
+    await invalidate_feed()
+    logging.getLogger(__name__).info(
+        f"Feed cards: rebuilt for {carded} listing(s)"
+    )
+
+
+async def run_tag_usage_reconcile() -> None:
+    """Recount tag usage from listing_tags to correct counter drift."""
+    import logging
+
+    from app.core.database import AsyncSessionLocal
+    from app.core.metrics import metrics
+    from app.listings.service import ListingService
+
+    async with AsyncSessionLocal() as session:
+        corrected = await ListingService(session).reconcile_tag_usage()
+
+    if corrected:
+        metrics.incr("tag_usage_corrections_total", corrected)
+        logging.getLogger(__name__).warning(
+            f"Tag usage: corrected {corrected} drifted counter(s)"
+        )
+
 
 scheduler = AsyncIOScheduler()
 scheduler.add_job(
@@ -104,6 +181,35 @@ scheduler.add_job(
     id="listing_expiry",
     replace_existing=True,
 )
+scheduler.add_job(
+    run_feed_card_rebuild,
+    trigger="cron",
+    hour=3,
+    minute=30,
+    id="feed_card_rebuild",
+    replace_existing=True,
+)
+scheduler.add_job(
+    refresh_zip_index,
+    trigger="interval",
+    minutes=listing_settings.ZIP_INDEX_REFRESH_MINUTES,
+    id="zip_index_refresh",
+    replace_existing=True,
+)
+scheduler.add_job(
+    refresh_tag_index,
+    trigger="interval",
+    minutes=listing_settings.TAG_INDEX_REFRESH_MINUTES,
+    id="tag_index_refresh",
+    replace_existing=True,
+)
+scheduler.add_job(
+    run_tag_usage_reconcile,
+    trigger="interval",
+    minutes=listing_settings.TAG_USAGE_RECONCILE_MINUTES,
+    id="tag_usage_reconcile",
+    replace_existing=True,
+)
 scheduler.add_job(
     run_payment_enforcer,
     trigger="interval",
@@ -128,6 +234,20 @@ scheduler.add_job(
     id="demurrage",
     replace_existing=True,
 )
+scheduler.add_job(
+    run_sink_rollup,
+    trigger="interval",
+    minutes=banking_settings.SINK_ROLLUP_INTERVAL_MINUTES,
+    id="sink_rollup",
+    replace_existing=True,
+)
+scheduler.add_job(
+    run_ledger_audit,
+    trigger="interval",
+    minutes=banking_settings.LEDGER_AUDIT_INTERVAL_MINUTES,
+    id="ledger_audit",
+    replace_existing=True,
+)
 
 
 @asynccontextmanager
@@ -135,10 +255,23 @@ async def lifespan(_application: FastAPI) -> AsyncGenerator:
     # Startup
     await test_db_connection()
     await init_db()
+    await open_redis()
+    await refresh_zip_index(force=True)
+    await refresh_tag_index()
+    await run_feed_card_rebuild(only_if_empty=True)
     scheduler.start()
+    listeners = [
+        asyncio.create_task(principal_cache.listen()),
+        asyncio.create_task(revoked_tokens.listen()),
+    ]
     yield
     # Shutdown
+    for listener in listeners:
+        listener.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
     scheduler.shutdown(wait=False)
+    hashing_pool.shutdown()
+    await close_redis()
 
 
 app = FastAPI(
@@ -164,7 +297,9 @@ if settings.all_cors_origins:
 
 @app.get("/healthcheck", include_in_schema=False)
 async def healthcheck() -> dict[str, str]:
-    return {"status": "ok"}
+    # Redis is reported, not required: the app degrades without it
+    redis_status = "ok" if await ping_redis() else "unavailable"
+    return {"status": "ok", "redis": redis_status}
 
 
 @app.get("/media/{key:path}", include_in_schema=False)
@@ -194,6 +329,8 @@ app.include_router(broadcast_router, prefix="/broadcasts", tags=["broadcasts"])
 app.add_exception_handler(NotAuthorized, not_authorized_handler)  # type: ignore
 app.add_exception_handler(PermissionDenied, permission_denied_handler)  # type: ignore
 app.add_exception_handler(BadAuthRequest, bad_auth_request_handler)  # type: ignore
+app.add_exception_handler(AuthUnavailable, auth_unavailable_handler)  # type: ignore
+app.add_exception_handler(RateLimitExceeded, rate_limit_handler)  # type: ignore
 
 # User handlers
 app.add_exception_handler(ResourceNotFound, resource_not_found_handler)  # type: ignore
@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timezone
 from typing import Annotated
 
@@ -5,15 +6,19 @@ import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from app.auth.config import auth_settings
+from app.auth.revocation import revoked_tokens
 from app.auth.schemas import TokenPayload
 from app.core.config import settings
 from app.core.database import SessionDep
+from app.core.redis import RedisDep
 from app.users.enums import VerificationStatus
 from app.users.models import User
+from app.users.principal import Principal, principal_cache
 from app.users.service import UserService
 
 # AUTH CONFIG
@@ -23,26 +28,31 @@ TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
 # SERVICE DEPENDENCY
-def get_user_service(session: SessionDep) -> UserService:
+def get_user_service(session: SessionDep, redis: RedisDep) -> UserService:
     """
-    Dependency to get a UserService instance with an active AsyncSession.
+    Dependency to get a UserService instance with an active AsyncSession
+    and the shared Redis client.
     """
-    return UserService(session)
+    return UserService(session, redis)
 
 
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
 # USER RETRIEVAL DEPENDENCIES
-async def get_current_user(session: SessionDep, token: TokenDep) -> User:
+async def _authenticate(
+    session: AsyncSession, token: str, require_verified: bool
+) -> Principal:
     """
-    Decodes the JWT token and fetches the current user from the database.
+    Decodes the JWT token and checks it against the user's cached
+    principal (see app/users/principal.py); no query once cached.
     """
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[auth_settings.ALGORITHM]
         )
         token_data = TokenPayload(**payload)
+        user_id = uuid.UUID(token_data.sub)
     except (InvalidTokenError, Exception):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -50,71 +60,55 @@ async def get_current_user(session: SessionDep, token: TokenDep) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # user = await session.get(User, token_data.sub)
-    query = (
-        select(User)
-        .where(User.id == token_data.sub)
-        .options(selectinload(User.verified_by))
-    )
-    result = await session.execute(query)
-    user = result.scalar_one_or_none()
+    # Logged out (see app/auth/revocation.py)
+    if await revoked_tokens.is_revoked(payload.get("jti")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    if not user:
+    principal = await principal_cache.get_or_load(session, user_id)
+
+    if not principal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
     token_iat = payload.get("iat")
-    if user.tokens_valid_from and token_iat:
+    if principal.tokens_valid_from and token_iat:
         if (
             datetime.fromtimestamp(token_iat, tz=timezone.utc)
-            < user.tokens_valid_from
+            < principal.tokens_valid_from
         ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Session invalidated, please log in again",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-    if user.verification_status != VerificationStatus.VERIFIED:
+    if (
+        require_verified
+        and principal.verification_status != VerificationStatus.VERIFIED
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User not verified",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user
+    return principal
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
-
-
-async def get_current_user_any_status(
-    session: SessionDep, token: TokenDep
-) -> User:
-    """
-    Like get_current_user but does NOT require VERIFIED status.
-    Use only on endpoints that must be accessible to PENDING users (e.g. /users/me).
-    """
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[auth_settings.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (InvalidTokenError, Exception):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
+async def _load_user(session: AsyncSession, principal: Principal) -> User:
+    """Fetches the full user row for handlers that need more than the principal."""
     query = (
         select(User)
-        .where(User.id == token_data.sub)
+        .where(User.id == principal.id)
         .options(selectinload(User.verified_by))
     )
     result = await session.execute(query)
@@ -126,25 +120,44 @@ async def get_current_user_any_status(
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-        )
-    token_iat = payload.get("iat")
-    if user.tokens_valid_from and token_iat:
-        if (
-            datetime.fromtimestamp(token_iat, tz=timezone.utc)
-            < user.tokens_valid_from
-        ):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Session invalidated, please log in again",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
     return user
 
 
+async def get_current_principal(
+    session: SessionDep, token: TokenDep
+) -> Principal:
+    """
+    Authenticates a VERIFIED user without loading the user row. Use on
+    endpoints that only need the id, code, name or language.
+    """
+    return await _authenticate(session, token, require_verified=True)
+
+
+CurrentPrincipal = Annotated[Principal, Depends(get_current_principal)]
+
+
+async def get_current_user(session: SessionDep, token: TokenDep) -> User:
+    """
+    Authenticates a VERIFIED user and fetches the user from the database.
+    """
+    principal = await _authenticate(session, token, require_verified=True)
+    return await _load_user(session, principal)
+
+
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+async def get_current_user_any_status(
+    session: SessionDep, token: TokenDep
+) -> User:
+    """
+    Like get_current_user but does NOT require VERIFIED status.
+    Use only on endpoints that must be accessible to PENDING users (e.g. /users/me).
+    """
+    principal = await _authenticate(session, token, require_verified=False)
+    return await _load_user(session, principal)
+
+
 CurrentUserAnyStatus = Annotated[User, Depends(get_current_user_any_status)]
 
 
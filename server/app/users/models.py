@@ -186,5 +186,16 @@ class User(SQLModel, table=True):
     @property
     def full_name(self) -> str:
         """Helper to format full name consistently"""
-        parts = [self.last_name, self.middle_name, self.first_name]
+        return self.format_full_name(
+            self.first_name, self.middle_name, self.last_name
+        )
+
+    @staticmethod
+    def format_full_name(
+        first_name: str | None,
+        middle_name: str | None,
+        last_name: str | None,
+    ) -> str:
+        """Same formatting as `full_name`, for rows read without the ORM."""
+        parts = [last_name, middle_name, first_name]
         return " ".join(filter(None, parts))
@@ -0,0 +1,141 @@
+"""
+Per-worker cache of the authenticated principal.
+
+Every authenticated request needs a handful of user fields to decide
+whether the token is still good (active, verified, not invalidated by a
+password reset). They are cached in memory per worker, keyed by user id,
+so authorizing a request costs no query once the user has been seen.
+
+Writes that change any of these fields call ``principal_cache.invalidate``
+after committing. That evicts the entry locally and publishes the user id
+on a Redis channel; every worker's ``listen`` task evicts it as well. If
+Redis is unreachable the short TTL bounds how long a stale entry lives.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.auth.config import auth_settings
+from app.core.cache import LocalLRU
+from app.core.metrics import metrics
+from app.core.redis import get_redis, subscribe
+from app.users.enums import Language, VerificationStatus
+from app.users.models import User
+
+logger = logging.getLogger(__name__)
+
+_CHANNEL = "principal:invalidate"
+
+# User columns a Principal is built from; writes touching any of them must
+# invalidate the user's entry
+PRINCIPAL_FIELDS = {
+    "user_code",
+    "first_name",
+    "middle_name",
+    "last_name",
+    "language",
+    "is_active",
+    "is_system_admin",
+    "verification_status",
+    "tokens_valid_from",
+}
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The user fields authorization and light handlers need."""
+
+    id: uuid.UUID
+    user_code: str
+    full_name: str
+    language: Language
+    is_active: bool
+    is_system_admin: bool
+    verification_status: VerificationStatus
+    tokens_valid_from: Optional[datetime]
+
+
+class PrincipalCache:
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._local = LocalLRU(max_size, ttl_seconds)
+        # Bumped on every eviction, so a load that raced one is not stored
+        self._generation = 0
+
+    async def get_or_load(
+        self, session: AsyncSession, user_id: uuid.UUID
+    ) -> Optional[Principal]:
+        """The cached principal, loaded from the database on a miss."""
+        principal = self._local.get(str(user_id))
+        if principal is not None:
+            metrics.incr("principal_cache_requests_total", result="hit")
+            return principal
+
+        metrics.incr("principal_cache_requests_total", result="miss")
+        generation = self._generation
+        result = await session.execute(
+            select(
+                User.user_code,
+                User.first_name,
+                User.middle_name,
+                User.last_name,
+                User.language,
+                User.is_active,
+                User.is_system_admin,
+                User.verification_status,
+                User.tokens_valid_from,
+            ).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        principal = Principal(
+            id=user_id,
+            user_code=row.user_code,
+            full_name=User.format_full_name(
+                row.first_name, row.middle_name, row.last_name
+            ),
+            language=row.language,
+            is_active=row.is_active,
+            is_system_admin=row.is_system_admin,
+            verification_status=row.verification_status,
+            tokens_valid_from=row.tokens_valid_from,
+        )
+        if generation == self._generation:
+            self._local.set(str(user_id), principal)
+        return principal
+
+    def evict(self, user_id: uuid.UUID | str) -> None:
+        self._generation += 1
+        self._local.pop(str(user_id))
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drops the user's entry here and, through Redis, on every worker."""
+        self.evict(user_id)
+        metrics.incr("principal_cache_invalidations_total")
+        try:
+            await get_redis().publish(_CHANNEL, str(user_id))
+        except (RedisError, OSError) as e:
+            metrics.incr("principal_cache_errors_total", op="publish")
+            logger.warning(f"Principal cache: Redis publish failed: {e}")
+
+    async def _resync(self) -> None:
+        # Invalidations published while unsubscribed were missed
+        self._local.clear()
+
+    async def listen(self) -> None:
+        """Evicts entries other workers invalidate; run as a task."""
+        await subscribe(_CHANNEL, self.evict, on_subscribe=self._resync)
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=auth_settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=auth_settings.PRINCIPAL_CACHE_SIZE,
+)
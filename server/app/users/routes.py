@@ -4,6 +4,7 @@ from typing import Any, List
 from fastapi import (
     APIRouter,
     BackgroundTasks,
+    Depends,
     HTTPException,
     Query,
     UploadFile,
@@ -11,7 +12,11 @@ from fastapi import (
 )
 from fastapi.responses import StreamingResponse
 
-from app.auth.dependencies import AuthServiceDep
+from app.auth.dependencies import (
+    AuthServiceDep,
+    register_invite_limit,
+    register_ip_limit,
+)
 from app.auth.schemas import InvitePublic
 from app.core.config import settings
 from app.core.file_storage import StorageServiceDep
@@ -33,7 +38,7 @@ from app.email.tasks import (
 from app.users.config import user_settings
 from app.users.dependencies import (
     CurrentAdmin,
-    CurrentUser,
+    CurrentPrincipal,
     CurrentUserAnyStatus,
     UserServiceDep,
 )
@@ -84,7 +89,7 @@ async def read_users(
 )
 async def search_users(
     service: UserServiceDep,
-    _: CurrentUser,
+    _: CurrentPrincipal,
     q: str = Query(
         min_length=2, description="Search string (name or user code)."
     ),
@@ -114,7 +119,11 @@ async def search_users(
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "description": "System saturated (no IDs left) or internal error."
         },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "description": "Too many registration attempts."
+        },
     },
+    dependencies=[Depends(register_ip_limit)],
 )
 async def register_user(
     user_in: UserCreate,
@@ -131,6 +140,9 @@ async def register_user(
 
     - **user_in**: Registration payload including invite code and profile data.
     """
+    # Per invite code, before the invite lookup and the password hash
+    await register_invite_limit.check(user_in.invite_code)
+
     db_user = await service.create_user(user_in)
 
     # Only send emails on successful registrations
@@ -198,7 +210,9 @@ async def read_user_me(current_user: CurrentUserAnyStatus) -> Any:
     },
 )
 async def update_user_me(
-    user_in: UserUpdate, current_user: CurrentUser, service: UserServiceDep
+    user_in: UserUpdate,
+    current_user: CurrentPrincipal,
+    service: UserServiceDep,
 ) -> Any:
     """
     Update own profile.
@@ -224,7 +238,7 @@ async def update_user_me(
 )
 async def upload_avatar(
     file: UploadFile,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: UserServiceDep,
     storage: StorageServiceDep,
 ) -> Any:
@@ -248,7 +262,7 @@ async def upload_avatar(
     status_code=status.HTTP_200_OK,
 )
 async def read_my_invites(
-    current_user: CurrentUser, service: AuthServiceDep
+    current_user: CurrentPrincipal, service: AuthServiceDep
 ) -> Any:
     """
     Get the invite codes for the current user.
@@ -270,7 +284,7 @@ async def read_my_invites(
     },
 )
 async def request_new_invites(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     auth_service: AuthServiceDep,
 ) -> List[InvitePublic]:
     """
@@ -333,7 +347,7 @@ async def get_user_avatar(
     },
 )
 async def read_user_by_code(
-    user_code: str, _: CurrentUser, service: UserServiceDep
+    user_code: str, _: CurrentPrincipal, service: UserServiceDep
 ) -> Any:
     """
     Admin: Get specific user by code.
@@ -380,7 +394,7 @@ async def get_cities_by_zip(zip_code: str, service: UserServiceDep) -> Any:
 )
 async def request_email_change(
     body: dict,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     service: UserServiceDep,
     background_tasks: BackgroundTasks,
 ) -> Any:
@@ -2,7 +2,6 @@ import secrets
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
-from urllib.parse import urlparse
 
 from fastapi import UploadFile
 from redis.asyncio import Redis
@@ -15,6 +14,8 @@ from app.auth.service import AuthService
 from app.banking.service import BankingService
 from app.core.config import settings
 from app.core.file_storage import LocalStorageService
+from app.core.redis import get_redis
+from app.listings.cache import invalidate_feed
 from app.listings.models import ZipRegistry
 from app.users.enums import VerificationStatus
 from app.users.exceptions import (
@@ -27,6 +28,7 @@ from app.users.exceptions import (
     UserNotFound,
 )
 from app.users.models import User
+from app.users.principal import PRINCIPAL_FIELDS, principal_cache
 from app.users.schemas import (
     UserAdminUpdate,
     UserCreate,
@@ -38,23 +40,23 @@ from app.users.utils import generate_user_code
 _ALLOWED_AVATAR_TYPES = {"image/jpeg", "image/png"}
 _MAX_AVATAR_BYTES = 5 * 1024 * 1024  # 5 MB
 
+# User fields rendered into the feed cards of their listings
+_FEED_CARD_FIELDS = {
+    "first_name",
+    "middle_name",
+    "last_name",
+    "user_code",
+    "avatar_url",
+    "zip_code",
+    "city",
+}
+
 
 class UserService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, redis: Optional[Redis] = None):
         self.session = session
-        # Initialize Redis; only pass SSL options for rediss:// URLs since the
-        # plain Connection class rejects an `ssl` kwarg (from_url derives the
-        # connection class from the URL scheme).
-        _ssl_kwargs = (
-            {"ssl_cert_reqs": None}
-            if urlparse(settings.REDIS_URL).scheme == "rediss"
-            else {}
-        )
-        self.redis = Redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-            **_ssl_kwargs,
-        )
+        # Email-change tokens; the process-wide pool unless one is injected
+        self.redis = redis or get_redis()
 
     async def get_users(self, skip: int = 0, limit: int = 100) -> UsersPublic:
         # Get total number of rows in table
@@ -188,7 +190,7 @@ class UserService:
         db_user = User.model_validate(
             user_in,
             update={
-                "password_hash": get_password_hash(user_in.password),
+                "password_hash": await get_password_hash(user_in.password),
                 "user_code": user_code,
                 "is_active": True,  # Active but not verified
                 # "is_verified": False,
@@ -260,16 +262,34 @@ class UserService:
             )
 
         if "password" in update_data:
-            hashed = get_password_hash(update_data["password"])
+            hashed = await get_password_hash(update_data["password"])
             update_data["password_hash"] = hashed
             del update_data["password"]
 
         db_user.sqlmodel_update(update_data)
         self.session.add(db_user)
+        feed_changed = bool(_FEED_CARD_FIELDS & update_data.keys())
+        if feed_changed:
+            await self._refresh_feed_cards(db_user.id)
         await self.session.commit()
         await self.session.refresh(db_user)
+        if PRINCIPAL_FIELDS & update_data.keys():
+            await principal_cache.invalidate(db_user.id)
+        if feed_changed:
+            await invalidate_feed()
         return db_user
 
+    async def _refresh_feed_cards(self, user_id: uuid.UUID) -> None:
+        """
+        Re-render the feed cards showing this user as owner. Callers
+        invalidate the feed cache once the change is committed.
+        """
+        # Imported here: app.listings.service imports this module in turn
+        # (through app.core.database).
+        from app.listings.service import ListingService
+
+        await ListingService(self.session).refresh_owner_feed_cards(user_id)
+
     async def upload_avatar(
         self,
         user_id: uuid.UUID,
@@ -301,8 +321,10 @@ class UserService:
         key = await storage.upload(file, folder=f"users/{user_id}")
         db_user.avatar_url = key
         self.session.add(db_user)
+        await self._refresh_feed_cards(db_user.id)
         await self.session.commit()
         await self.session.refresh(db_user)
+        await invalidate_feed()
         return db_user
 
     async def admin_update_user(
@@ -336,8 +358,15 @@ class UserService:
         # The UserAdminUpdate schema will be updated in the future.
 
         self.session.add(db_user)
+        feed_changed = bool(_FEED_CARD_FIELDS & update_data.keys())
+        if feed_changed:
+            await self._refresh_feed_cards(db_user.id)
         await self.session.commit()
         await self.session.refresh(db_user)
+        if PRINCIPAL_FIELDS & update_data.keys():
+            await principal_cache.invalidate(db_user.id)
+        if feed_changed:
+            await invalidate_feed()
         return db_user
 
     async def get_cities_by_zip(self, zip_code: str) -> list[str]:
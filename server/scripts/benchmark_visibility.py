@@ -0,0 +1,176 @@
+"""
+Compare the two feed visibility engines (see app/listings/visibility.py).
+
+Usage (from the server/ directory):
+    python scripts/benchmark_visibility.py [--viewers 50] [--repeat 5] [--keep]
+
+Runs against the configured database:
+  1. Rebuilds post_visibilities for every ACTIVE local (D1–D4) listing,
+     timing the per-listing delete + insert the fan-out engine pays on
+     each create/edit. The radius engine writes nothing beyond the
+     listing row itself.
+  2. Reports the storage each engine needs: the post_visibilities table
+     for fan-out, ix_listings_zip_d_class for radius.
+  3. Times the first feed page for a sample of viewer ZIPs under each
+     engine and checks both return the same listings.
+
+Everything runs in one transaction that is rolled back, unless --keep is
+given; use --keep to resync post_visibilities before switching
+VISIBILITY_ENGINE back to "fanout".
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Make sure app imports resolve when run from server/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sqlalchemy as sa
+from sqlmodel import col
+
+import app.main  # noqa: F401 — registers every model mapper
+from app.core.database import AsyncSessionLocal, engine
+from app.listings.enums import D_CLASS_MAX_KM, DClass, ListingStatus
+from app.listings.models import Listing, PostVisibility
+from app.listings.service import ListingService
+from app.listings.zip_index import refresh_zip_index
+
+LOCAL_CLASSES = [d_class.value for d_class in D_CLASS_MAX_KM]
+
+
+def _ms(samples: list[float]) -> str:
+    if not samples:
+        return "n/a"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"median {statistics.median(ordered) * 1000:8.2f} ms   "
+        f"p95 {p95 * 1000:8.2f} ms"
+    )
+
+
+async def _relation_size(session, name: str) -> int:
+    result = await session.execute(
+        sa.text("SELECT pg_total_relation_size(CAST(:name AS regclass))"),
+        {"name": name},
+    )
+    return result.scalar_one()
+
+
+async def benchmark(viewers: int, repeat: int, keep: bool) -> None:
+    await refresh_zip_index(force=True)
+
+    async with AsyncSessionLocal() as session:
+        listings = (
+            await session.execute(
+                sa.select(Listing.id, Listing.zip_code, Listing.d_class).where(
+                    Listing.status == ListingStatus.ACTIVE,
+                    col(Listing.d_class).in_(LOCAL_CLASSES),
+                    col(Listing.zip_code).is_not(None),
+                )
+            )
+        ).all()
+        print(f"Active local listings: {len(listings)}")
+        if not listings:
+            return
+
+        # 1. Write cost of the fan-out, listing by listing
+        service = ListingService(session)
+        write_times = []
+        for listing_id, zip_code, d_class in listings:
+            started = time.perf_counter()
+            await service._cleanup_post_visibilities(listing_id)
+            await service._populate_post_visibilities(
+                listing_id, zip_code, DClass(d_class)
+            )
+            write_times.append(time.perf_counter() - started)
+
+        # 2. Storage
+        visibility_rows = (
+            await session.execute(
+                sa.select(sa.func.count()).select_from(PostVisibility)
+            )
+        ).scalar_one()
+        fanout_bytes = await _relation_size(session, "post_visibilities")
+        radius_bytes = await _relation_size(session, "ix_listings_zip_d_class")
+
+        # 3. Feed latency
+        # Viewers where listings actually are, so the local paths get work
+        candidates = sorted({zip_code for _, zip_code, _ in listings})
+        sample = random.sample(candidates, k=min(viewers, len(candidates)))
+        feed_times: dict[str, list[float]] = {"fanout": [], "radius": []}
+        mismatches = 0
+        for viewer_zip in sample:
+            pages = {}
+            for visibility in feed_times:
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    page = await service.get_feed(
+                        viewer_zip=viewer_zip, visibility=visibility
+                    )
+                    feed_times[visibility].append(
+                        time.perf_counter() - started
+                    )
+                pages[visibility] = [item.id for item in page.data]
+            mismatches += pages["fanout"] != pages["radius"]
+
+        if keep:
+            await session.commit()
+        else:
+            await session.rollback()
+
+    await engine.dispose()
+
+    print()
+    print("Storage")
+    print(
+        f"  fanout  post_visibilities       {visibility_rows:>10} rows  "
+        f"{fanout_bytes / 1024:>10.0f} KiB"
+    )
+    print(
+        f"  radius  ix_listings_zip_d_class {'':>10}       "
+        f"{radius_bytes / 1024:>10.0f} KiB"
+    )
+    print()
+    print("Write latency per listing create/edit (visibility only)")
+    print(f"  fanout  {_ms(write_times)}")
+    print("  radius  nothing to write")
+    print()
+    print(f"Feed latency, first page ({len(sample)} viewer ZIPs x {repeat})")
+    for visibility, samples in feed_times.items():
+        print(f"  {visibility:<7} {_ms(samples)}")
+    print(f"  pages that differ between engines: {mismatches}")
+    print()
+    print("Committed." if keep else "Rolled back.")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark fan-out vs. query-time feed visibility."
+    )
+    parser.add_argument(
+        "--viewers",
+        type=int,
+        default=50,
+        help="Viewer ZIPs to sample for feed timings (default: 50)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Feed requests per viewer ZIP and engine (default: 5)",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Commit the rebuilt post_visibilities instead of rolling back",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.viewers, args.repeat, args.keep))
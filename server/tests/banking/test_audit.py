@@ -0,0 +1,61 @@
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.banking.enums import Currency
+from app.banking.models import Account
+from app.banking.service import BankingService
+from app.core.database import AsyncSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_audit_finds_tampered_balance(session, make_member):
+    alice = await make_member(time=100)
+    service = BankingService(session)
+
+    clean = await service.audit_ledger()
+    await session.execute(
+        sa.update(Account)
+        .where(Account.user_id == alice.id, Account.type == Currency.TIME)
+        .values(balance_time=Account.balance_time + 5)
+    )
+    await session.commit()
+    tampered = await service.audit_ledger()
+
+    assert clean.drift_count == 0
+    assert tampered.drift_count == 1
+    assert tampered.transactions_scanned == 0
+
+
+async def test_late_commit_is_folded_in_by_next_run(
+    session, make_member, monkeypatch
+):
+    alice = await make_member(time=600)
+    bob = await make_member()
+    service = BankingService(session)
+    first = await service.audit_ledger()
+
+    async with AsyncSessionLocal() as writer:
+        # Hold the writer's transaction open across an audit run
+        async def hold():
+            pass
+
+        monkeypatch.setattr(writer, "commit", hold)
+        await BankingService(writer).transfer_funds(
+            alice.user_code, bob.user_code, 60, Decimal(0), "In flight"
+        )
+        during = await service.audit_ledger()
+        await AsyncSession.commit(writer)
+
+    after = await service.audit_ledger()
+    settled = await service.audit_ledger()
+
+    assert first.transactions_scanned == 1
+    assert during.transactions_scanned == 0
+    assert after.transactions_scanned == 1
+    assert settled.transactions_scanned == 0
+    runs = (first, during, after, settled)
+    assert all(run.drift_count == 0 for run in runs)
@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+import pytest
+
+from app.banking.exceptions import BalanceHistoryUnavailable
+from app.banking.service import BankingService
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_history_steps_back_from_current_balance(session, make_member):
+    alice = await make_member(time=100, regio=Decimal("10.00"))
+    bob = await make_member()
+    service = BankingService(session)
+    await service.transfer_funds(
+        alice.user_code, bob.user_code, 30, Decimal("2.50"), "Lunch"
+    )
+
+    history = await service.get_balance_history(alice.user_code, days=3)
+
+    today, *earlier = reversed(history.data)
+    assert (today.balance.time, today.balance.regio) == (70, Decimal("7.50"))
+    assert (today.incoming.time, today.outgoing.time) == (100, 30)
+    for point in earlier:
+        assert (point.balance.time, point.balance.regio) == (0, Decimal(0))
+    assert history.totals.incoming.regio == Decimal("10.00")
+    assert history.totals.outgoing.regio == Decimal("2.50")
+
+
+async def test_sink_has_no_history(session, sink):
+    with pytest.raises(BalanceHistoryUnavailable):
+        await BankingService(session).get_balance_history(sink.user_code)
+
+
+async def test_history_without_activity_is_flat(session, make_member):
+    carol = await make_member()
+
+    history = await BankingService(session).get_balance_history(
+        carol.user_code, days=2
+    )
+
+    assert [p.balance.time for p in history.data] == [0, 0]
+    assert history.totals.incoming.time == 0
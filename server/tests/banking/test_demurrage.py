@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from app.banking.enums import Currency
+from app.banking.models import Account, Transaction
+from app.banking.service import BankingService
+
+pytestmark = pytest.mark.anyio
+
+
+async def backdate(session, user, days: int) -> datetime:
+    """Moves a member's last demurrage charge `days` into the past."""
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    await session.execute(
+        sa.update(Account)
+        .where(Account.user_id == user.id, Account.type == Currency.TIME)
+        .values(last_demurrage_calc=since)
+    )
+    await session.commit()
+    return since
+
+
+async def last_calc(session, user) -> datetime:
+    return await session.scalar(
+        sa.select(Account.last_demurrage_calc).where(
+            Account.user_id == user.id, Account.type == Currency.TIME
+        )
+    )
+
+
+async def test_demurrage_charges_balance_above_threshold(
+    session, make_member, balances
+):
+    rich = await make_member(time=3000)
+    modest = await make_member(time=1000)
+    await backdate(session, rich, 365)
+    await backdate(session, modest, 365)
+
+    summary = await BankingService(session).process_demurrage()
+
+    # 6% a year on the 1200 minutes above the 1800 threshold
+    assert summary["processed_users"] == 1
+    assert summary["total_minutes_collected"] == 72
+    assert summary["failed"] == []
+    assert await balances(rich) == (3000 - 72, Decimal(0))
+    assert await balances(modest) == (1000, Decimal(0))
+
+
+async def test_second_run_charges_nothing(session, make_member, balances):
+    rich = await make_member(time=3000)
+    since = await backdate(session, rich, 30)
+    service = BankingService(session)
+
+    first = await service.process_demurrage()
+    second = await service.process_demurrage()
+
+    charged = 3000 - (await balances(rich))[0]
+    assert first["processed_users"] == 1
+    assert charged == first["total_minutes_collected"] > 0
+    assert (second["candidates"], second["processed_users"]) == (0, 0)
+    assert await last_calc(session, rich) > since
+
+
+async def test_stale_charges_are_not_applied_twice(
+    session, make_member, balances
+):
+    rich = await make_member(time=3000)
+    await backdate(session, rich, 30)
+    service = BankingService(session)
+    now = datetime.now(timezone.utc)
+
+    # Two overlapping runs that computed the same charges
+    charges = await service._compute_demurrage_charges(now)
+    applied = await service._apply_demurrage_chunk(charges, now)
+    again = await service._apply_demurrage_chunk(charges, now)
+
+    assert len(applied) == 1
+    assert again == []
+    assert await balances(rich) == (3000 - applied[0].amount_time, Decimal(0))
+    assert await last_calc(session, rich) == now
+    recorded = await session.scalar(
+        sa.select(sa.func.count())
+        .select_from(Transaction)
+        .where(Transaction.reference.startswith("Demurrage"))
+    )
+    assert recorded == 1
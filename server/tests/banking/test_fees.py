@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from app.banking.config import banking_settings
+from app.banking.constants import MONTHLY_FEE_MINUTES
+from app.banking.models import Transaction
+from app.banking.service import BankingService
+
+pytestmark = pytest.mark.anyio
+
+
+async def fee_rows(session):
+    rows = await session.execute(
+        sa.select(Transaction.sender_id, Transaction.fee_period)
+        .where(Transaction.fee_period.is_not(None))
+        .order_by(Transaction.created_at)
+    )
+    return rows.all()
+
+
+async def test_fee_is_charged_once_per_period(session, make_member, balances):
+    alice = await make_member(time=100)
+    bob = await make_member()
+    service = BankingService(session)
+    period = datetime.now(timezone.utc).strftime("%Y-%m")
+
+    first = await service.collect_monthly_fees()
+    second = await service.collect_monthly_fees()
+
+    assert (first["period"], first["charged"]) == (period, 2)
+    assert first["total_minutes"] == 2 * MONTHLY_FEE_MINUTES
+    assert (second["charged"], second["already_charged"]) == (0, 2)
+    assert await balances(alice) == (100 - MONTHLY_FEE_MINUTES, Decimal(0))
+    # The fee may take a member below zero
+    assert await balances(bob) == (-MONTHLY_FEE_MINUTES, Decimal(0))
+    assert sorted(await fee_rows(session)) == sorted(
+        [(alice.id, period), (bob.id, period)]
+    )
+
+
+async def test_rerun_charges_only_missed_members(
+    session, make_member, balances, monkeypatch
+):
+    members = [await make_member(time=100) for _ in range(3)]
+    service = BankingService(session)
+    period = datetime.now(timezone.utc).strftime("%Y-%m")
+    monkeypatch.setattr(banking_settings, "LEDGER_BATCH_SIZE", 2)
+
+    # A run that crashed after charging one member
+    await service._charge_fee_chunk([members[1].id], period)
+    summary = await service.collect_monthly_fees()
+
+    assert (summary["charged"], summary["already_charged"]) == (2, 1)
+    assert summary["failed"] == []
+    for member in members:
+        assert await balances(member) == (
+            100 - MONTHLY_FEE_MINUTES,
+            Decimal(0),
+        )
+    assert len(await fee_rows(session)) == 3
+
+
+async def test_fee_chunks_share_the_period(session, make_member, monkeypatch):
+    for _ in range(3):
+        await make_member()
+    monkeypatch.setattr(banking_settings, "LEDGER_BATCH_SIZE", 1)
+
+    summary = await BankingService(session).collect_monthly_fees()
+
+    rows = await session.execute(
+        sa.select(Transaction.created_at, Transaction.fee_period)
+        .where(Transaction.fee_period.is_not(None))
+        .order_by(Transaction.created_at)
+    )
+    stamps, periods = zip(*rows.all())
+    assert summary["charged"] == 3
+    assert set(periods) == {summary["period"]}
+    # Each chunk is stamped with its own time, not the job's start
+    assert len(set(stamps)) == 3
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from app.banking.exceptions import InvalidHistoryCursor
+from app.banking.models import Transaction
+from app.banking.service import BankingService
+from app.core.pagination import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+async def walk(service, user, page_size: int) -> list:
+    """Follows `next_cursor` from the first page to the last."""
+    seen = []
+    history = await service.get_transaction_history(user, page_size=page_size)
+    while True:
+        assert len(history.data) <= page_size
+        seen += [tx.id for tx in history.data]
+        if history.meta.next_cursor is None:
+            return seen
+        history = await service.get_transaction_history(
+            user, page_size=page_size, cursor=history.meta.next_cursor
+        )
+
+
+async def test_cursor_walks_every_transaction_once(session, make_member):
+    alice = await make_member(time=500)
+    bob = await make_member(time=500)
+    service = BankingService(session)
+    for minutes in range(1, 5):
+        await service.transfer_funds(
+            alice.user_code, bob.user_code, minutes, Decimal(0), "Out"
+        )
+        await service.transfer_funds(
+            bob.user_code, alice.user_code, minutes, Decimal(0), "In"
+        )
+
+    # Rows written by one bulk statement share a timestamp
+    tied = (
+        sa.select(Transaction.id)
+        .where(Transaction.reference == "Out")
+        .scalar_subquery()
+    )
+    await session.execute(
+        sa.update(Transaction)
+        .where(Transaction.id.in_(tied))
+        .values(created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    )
+    await session.commit()
+
+    party = (Transaction.sender_id == alice.id) | (
+        Transaction.receiver_id == alice.id
+    )
+    expected = await session.scalars(
+        sa.select(Transaction.id)
+        .where(party)
+        .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+    )
+    expected = list(expected)
+
+    assert len(expected) == 9
+    for page_size in (1, 2, 4, 9, 20):
+        assert await walk(service, alice, page_size) == expected
+
+
+async def test_cursor_pages_match_offset_pages(session, make_member):
+    alice = await make_member(time=500)
+    bob = await make_member()
+    service = BankingService(session)
+    for minutes in range(1, 6):
+        await service.transfer_funds(
+            alice.user_code, bob.user_code, minutes, Decimal(0), "Out"
+        )
+
+    first = await service.get_transaction_history(alice, page_size=4)
+    by_cursor = await service.get_transaction_history(
+        alice, page_size=4, cursor=first.meta.next_cursor
+    )
+    by_page = await service.get_transaction_history(alice, page=2, page_size=4)
+
+    assert first.meta.total_count == 6
+    assert [tx.id for tx in by_cursor.data] == [tx.id for tx in by_page.data]
+    assert by_cursor.meta.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", encode_cursor("2024-01-01"), encode_cursor("x", "y")],
+)
+async def test_invalid_cursor_is_rejected(session, make_member, cursor):
+    alice = await make_member()
+
+    with pytest.raises(InvalidHistoryCursor):
+        await BankingService(session).get_transaction_history(
+            alice, cursor=cursor
+        )
+
+
+async def test_sink_history_skips_the_total(session, sink, make_member):
+    alice = await make_member(time=100)
+    await make_member(time=50)
+    service = BankingService(session)
+
+    sink_page = await service.get_transaction_history(sink, page_size=1)
+    member_page = await service.get_transaction_history(alice, page_size=1)
+
+    assert len(sink_page.data) == 1
+    assert sink_page.meta.next_cursor is not None
+    assert sink_page.meta.total_count is None
+    assert sink_page.meta.total_pages is None
+    assert member_page.meta.total_count == 1
+    assert member_page.meta.total_pages == 1
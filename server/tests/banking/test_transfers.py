@@ -0,0 +1,188 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from app.banking.enums import PaymentStatus
+from app.banking.exceptions import (
+    InsufficientFunds,
+    InvalidPaymentRequestStatus,
+)
+from app.banking.models import (
+    PaymentRequest,
+    SinkCredit,
+    Transaction,
+    TransactionCounter,
+)
+from app.banking.service import BankingService
+from app.core.database import AsyncSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+async def count(session, model, *where) -> int:
+    statement = sa.select(sa.func.count()).select_from(model).where(*where)
+    return await session.scalar(statement)
+
+
+async def test_transfer_moves_both_currencies(session, make_member, balances):
+    alice = await make_member(time=120, regio=Decimal("20.00"))
+    bob = await make_member()
+
+    tx = await BankingService(session).transfer_funds(
+        alice.user_code, bob.user_code, 45, Decimal("5.50"), "Lunch"
+    )
+
+    assert await balances(alice) == (75, Decimal("14.50"))
+    assert await balances(bob) == (45, Decimal("5.50"))
+    recorded = await session.get(Transaction, tx.id)
+    assert (recorded.sender_id, recorded.receiver_id) == (alice.id, bob.id)
+    assert recorded.ledger_xid is not None
+    counters = await session.execute(
+        sa.select(TransactionCounter.user_id, TransactionCounter.total)
+    )
+    # The opening balance counts for alice, the sink is never counted
+    assert dict(counters.all()) == {alice.id: 2, bob.id: 1}
+
+
+async def test_refused_transfer_writes_nothing(session, make_member, balances):
+    alice = await make_member(time=10)
+    bob = await make_member()
+    before = await count(session, Transaction)
+
+    # T1 members may go down to -60 minutes
+    with pytest.raises(InsufficientFunds):
+        await BankingService(session).transfer_funds(
+            alice.user_code, bob.user_code, 71, Decimal(0), "Too much"
+        )
+
+    assert await balances(alice) == (10, Decimal(0))
+    assert await balances(bob) == (0, Decimal(0))
+    assert await count(session, Transaction) == before
+
+
+async def test_concurrent_transfers_cannot_overdraw(
+    session, make_member, balances
+):
+    alice = await make_member(time=40)
+    bob = await make_member()
+
+    async def pay():
+        async with AsyncSessionLocal() as own:
+            return await BankingService(own).transfer_funds(
+                alice.user_code, bob.user_code, 80, Decimal(0), "Race"
+            )
+
+    # Either payment fits within the -60 floor, both together do not
+    results = await asyncio.gather(pay(), pay(), return_exceptions=True)
+
+    refused = [r for r in results if isinstance(r, InsufficientFunds)]
+    assert len(refused) == 1
+    assert await balances(alice) == (-40, Decimal(0))
+    assert await balances(bob) == (80, Decimal(0))
+
+
+async def test_transfer_to_sink_is_journaled(
+    session, sink, make_member, balances
+):
+    alice = await make_member(time=100)
+    service = BankingService(session)
+    sink_before = await balances(sink)
+
+    await service.transfer_funds(
+        alice.user_code, sink.user_code, 30, Decimal(0), "Donation"
+    )
+
+    assert await balances(alice) == (70, Decimal(0))
+    assert await balances(sink) == sink_before
+    assert await count(session, SinkCredit) == 1
+
+    rolled = await service.roll_up_sink_credits()
+    assert rolled["entries"] == 1
+    assert await balances(sink) == (sink_before[0] + 30, sink_before[1])
+    assert (await service.roll_up_sink_credits())["entries"] == 0
+
+
+async def test_payment_request_executes_once(session, make_member, balances):
+    creditor = await make_member()
+    debtor = await make_member(time=100)
+    service = BankingService(session)
+    request = await service.create_payment_request(
+        creditor.user_code, debtor.user_code, 30, Decimal(0), "Gardening"
+    )
+
+    await service.process_payment_request(request.id, debtor.id, "APPROVE")
+    with pytest.raises(InvalidPaymentRequestStatus):
+        await service.process_payment_request(request.id, debtor.id, "APPROVE")
+
+    assert await balances(debtor) == (70, Decimal(0))
+    paid = Transaction.payment_request_id == request.id
+    assert await count(session, Transaction, paid) == 1
+
+
+async def test_enforcer_finalises_without_paying_twice(
+    session, make_member, balances
+):
+    creditor = await make_member()
+    debtor = await make_member(time=100)
+    service = BankingService(session)
+    request = await service.create_payment_request(
+        creditor.user_code, debtor.user_code, 30, Decimal(0), "Overdue"
+    )
+
+    assert await service.force_execute_payment_requests([request.id]) == [
+        request.id
+    ]
+    assert await service.force_execute_payment_requests([request.id]) == []
+
+    # A crash between the transfer and the status update leaves the
+    # request PENDING with its transaction already written
+    await session.execute(
+        sa.update(PaymentRequest)
+        .where(PaymentRequest.id == request.id)
+        .values(status=PaymentStatus.PENDING, transaction_id=None)
+    )
+    await session.commit()
+    assert await service.force_execute_payment_requests([request.id]) == [
+        request.id
+    ]
+
+    assert await balances(debtor) == (70, Decimal(0))
+    paid = Transaction.payment_request_id == request.id
+    assert await count(session, Transaction, paid) == 1
+
+
+async def test_enforcer_skips_requests_another_worker_holds(
+    session, make_member
+):
+    creditor = await make_member()
+    debtor = await make_member(time=100)
+    service = BankingService(session)
+    held, free = [
+        await service.create_payment_request(
+            creditor.user_code, debtor.user_code, 10, Decimal(0), "Overdue"
+        )
+        for _ in range(2)
+    ]
+    await service.force_execute_payment_requests([held.id])
+    # Paid but not yet finalised, as after a crash
+    await session.execute(
+        sa.update(PaymentRequest)
+        .where(PaymentRequest.id == held.id)
+        .values(status=PaymentStatus.PENDING, transaction_id=None)
+    )
+    await session.commit()
+
+    async with AsyncSessionLocal() as other:
+        await other.execute(
+            sa.select(PaymentRequest.id)
+            .where(PaymentRequest.id == held.id)
+            .with_for_update()
+        )
+        executed = await asyncio.wait_for(
+            service.force_execute_payment_requests([held.id, free.id]), 5
+        )
+        await other.rollback()
+
+    assert executed == [free.id]
@@ -0,0 +1,140 @@
+"""
+Shared fixtures.
+
+The tests run against the PostgreSQL server the app is configured for
+(the usual environment / .env). Every test starts from empty tables, so
+POSTGRES_DB must name a scratch database ending in "_test"; the schema is
+created on first use. Redis is optional: caches and rate limits fall back
+to memory when it is unreachable.
+"""
+
+import itertools
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+import sqlalchemy as sa
+from sqlmodel import SQLModel
+
+from app.banking.enums import Currency
+from app.banking.models import Account
+from app.banking.service import BankingService
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.users.enums import TrustLevel, VerificationStatus
+from app.users.models import User
+
+_codes = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def schema():
+    if not settings.POSTGRES_DB.endswith("_test"):
+        pytest.skip(
+            "database tests need POSTGRES_DB set to a scratch database "
+            "ending in _test"
+        )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+    except (OSError, sa.exc.DBAPIError) as e:
+        pytest.skip(f"PostgreSQL is unreachable: {e}")
+    yield
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(schema):
+    tables = ", ".join(t.name for t in SQLModel.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(sa.text(f"TRUNCATE {tables} RESTART IDENTITY"))
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+async def sink(session) -> User:
+    """The system sink user and its accounts, as init_db creates them."""
+    user = User(
+        user_code=settings.SYSTEM_SINK_CODE,
+        email=settings.SYSTEM_SINK_EMAIL,
+        password_hash="-",
+        first_name=settings.SYSTEM_SINK_FIRST_NAME,
+        last_name=settings.SYSTEM_SINK_LAST_NAME,
+        zip_code="1015",
+        city="Budapest",
+        verification_status=VerificationStatus.VERIFIED,
+        is_system_admin=True,
+        trust_level=TrustLevel.T6,
+    )
+    session.add(user)
+    await session.flush()
+    await BankingService(session).create_initial_accounts(user.id)
+    await session.commit()
+    return user
+
+
+@pytest.fixture
+def make_member(session, sink):
+    """
+    Creates a verified member. An opening balance is paid from the sink
+    with an ordinary transfer, so the ledger stays consistent.
+    """
+
+    async def make(
+        time: int = 0,
+        regio: Decimal = Decimal(0),
+        zip_code: str = "1015",
+        first_name: Optional[str] = None,
+    ) -> User:
+        number = next(_codes)
+        user = User(
+            user_code=f"T{number:04d}",
+            email=f"member{number}@example.com",
+            password_hash="-",
+            first_name=first_name or f"Member{number}",
+            last_name="Test",
+            zip_code=zip_code,
+            city="Budapest",
+            verification_status=VerificationStatus.VERIFIED,
+        )
+        session.add(user)
+        await session.flush()
+        await BankingService(session).create_initial_accounts(user.id)
+        await session.commit()
+        if time or regio:
+            await BankingService(session).transfer_funds(
+                sink.user_code,
+                user.user_code,
+                time,
+                regio,
+                "Opening balance",
+                skip_limit_check=True,
+            )
+        return user
+
+    return make
+
+
+@pytest.fixture
+def balances(session):
+    """Reads a member's (TIME, REGIO) balances straight from the accounts."""
+
+    async def read(user: User) -> tuple[int, Decimal]:
+        rows = await session.execute(
+            sa.select(
+                Account.type, Account.balance_time, Account.balance_regio
+            ).where(Account.user_id == user.id)
+        )
+        by_type = {row.type: row for row in rows}
+        return (
+            by_type[Currency.TIME].balance_time,
+            by_type[Currency.REGIO].balance_regio,
+        )
+
+    return read
@@ -0,0 +1,35 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 17, 9, 30, 0, 123456, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, row_id, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, datetime.fromisoformat, uuid.UUID, int) == [
+        created_at,
+        row_id,
+        42,
+    ]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "%%%",
+        encode_cursor("2024-01-01T00:00:00+00:00"),
+        encode_cursor("yesterday", str(uuid.uuid4())),
+        encode_cursor("2024-01-01T00:00:00+00:00", "not-a-uuid"),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
@@ -0,0 +1,127 @@
+import asyncio
+import types
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.core.exceptions import RateLimitExceeded
+from app.core.rate_limit import RateLimiter
+from app.core.redis import close_redis, get_redis, ping_redis
+
+pytestmark = pytest.mark.anyio
+
+
+def limiter(capacity: int, per_seconds: float) -> RateLimiter:
+    # A fresh name per test, so buckets never carry over
+    return RateLimiter(f"test-{uuid.uuid4().hex[:8]}", capacity, per_seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drives the in-memory backend's clock by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "memory")
+    monkeypatch.setattr(
+        rate_limit, "time", types.SimpleNamespace(monotonic=lambda: now[0])
+    )
+    return now
+
+
+@pytest.fixture
+async def redis_backend(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "redis")
+    if not await ping_redis():
+        await close_redis()
+        pytest.skip("Redis is unreachable")
+    yield get_redis()
+    await close_redis()
+
+
+async def test_memory_bucket_denies_once_empty(clock):
+    login = limiter(3, 60)
+
+    for _ in range(3):
+        await login.check("alice@example.com")
+    with pytest.raises(RateLimitExceeded) as denied:
+        await login.check("alice@example.com")
+
+    # One token comes back every 20 seconds
+    assert denied.value.retry_after == pytest.approx(20)
+    await login.check("bob@example.com")
+
+
+async def test_memory_bucket_refills_over_time(clock):
+    login = limiter(3, 60)
+    for _ in range(3):
+        await login.check("alice@example.com")
+
+    clock[0] += 10
+    with pytest.raises(RateLimitExceeded) as denied:
+        await login.check("alice@example.com")
+    assert denied.value.retry_after == pytest.approx(10)
+
+    clock[0] += 10
+    await login.check("alice@example.com")
+
+    # A long pause refills to capacity, never beyond
+    clock[0] += 3600
+    for _ in range(3):
+        await login.check("alice@example.com")
+    with pytest.raises(RateLimitExceeded):
+        await login.check("alice@example.com")
+
+
+async def test_keys_ignore_case_and_whitespace(clock):
+    reset = limiter(1, 60)
+
+    await reset.check("Alice@Example.com")
+    with pytest.raises(RateLimitExceeded):
+        await reset.check("  alice@example.com ")
+
+
+async def test_dependency_limits_per_client_ip(clock):
+    login = limiter(1, 60)
+
+    def request(host: str):
+        return types.SimpleNamespace(client=types.SimpleNamespace(host=host))
+
+    await login(request("203.0.113.7"))
+    await login(request("203.0.113.8"))
+    with pytest.raises(RateLimitExceeded):
+        await login(request("203.0.113.7"))
+
+
+async def test_unreachable_redis_falls_back_to_memory(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "redis")
+    unreachable = Redis.from_url(
+        "redis://127.0.0.1:1", socket_connect_timeout=0.5
+    )
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: unreachable)
+    login = limiter(1, 60)
+
+    await login.check("alice@example.com")
+    with pytest.raises(RateLimitExceeded):
+        await login.check("alice@example.com")
+    await unreachable.aclose()
+
+
+async def test_redis_bucket_denies_and_refills(redis_backend):
+    # Ten tokens a second, so the test can wait for a refill
+    login = limiter(2, 0.2)
+
+    await login.check("alice@example.com")
+    await login.check("alice@example.com")
+    with pytest.raises(RateLimitExceeded) as denied:
+        await login.check("alice@example.com")
+    assert 0 < denied.value.retry_after <= 0.1
+
+    await asyncio.sleep(denied.value.retry_after + 0.05)
+    await login.check("alice@example.com")
+
+    keys = await redis_backend.keys(f"ratelimit:{login.name}:*")
+    assert len(keys) == 1
+    # Buckets expire once they would be full again
+    assert 0 < await redis_backend.ttl(keys[0]) <= 1
@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+
+import pytest
+import sqlalchemy as sa
+
+from app.core.pagination import encode_cursor
+from app.listings.enums import ListingStatus
+from app.listings.exceptions import InvalidFeedCursor
+from app.listings.models import FeedCard, Listing
+from app.listings.schemas import CreateSearchServiceListing
+from app.listings.service import ListingService
+
+pytestmark = pytest.mark.anyio
+
+
+async def post_listings(session, owner, count: int) -> list:
+    service = ListingService(session)
+    listings = []
+    for n in range(count):
+        data = CreateSearchServiceListing(
+            title=f"Garden help {n}",
+            description="Looking for someone to help in the garden.",
+        )
+        listings.append((await service.create_listing(owner, data)).id)
+    return listings
+
+
+async def tie_timestamps(session, listing_ids: list) -> None:
+    """Gives listings one shared created_at, as a bulk import would."""
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for model, id_column in (
+        (Listing, Listing.id),
+        (FeedCard, FeedCard.listing_id),
+    ):
+        await session.execute(
+            sa.update(model)
+            .where(id_column.in_(listing_ids))
+            .values(created_at=created_at)
+        )
+    await session.commit()
+
+
+async def walk(fetch, limit: int) -> list:
+    """Follows `next_page_cursor` from the first page to the last."""
+    seen = []
+    cursor = None
+    while True:
+        page = await fetch(limit=limit, cursor=cursor)
+        assert len(page.data) <= limit
+        seen += [item.id for item in page.data]
+        cursor = page.next_page_cursor
+        if cursor is None:
+            return seen
+
+
+@pytest.fixture
+async def listings(session, make_member):
+    owner = await make_member()
+    ids = await post_listings(session, owner, 7)
+    await tie_timestamps(session, ids[1:5])
+    return owner, ids
+
+
+@pytest.mark.parametrize(
+    "lang",
+    [
+        "en",  # served from feed cards
+        "fr",  # no cards in this language, rendered from listings
+    ],
+)
+async def test_feed_cursor_walks_every_listing_once(session, listings, lang):
+    _, ids = listings
+    service = ListingService(session)
+
+    def feed(**page):
+        return service.get_feed(user_lang=lang, **page)
+
+    expected = await walk(feed, 100)
+
+    assert sorted(expected) == sorted(ids)
+    for limit in (1, 2, 3, 7):
+        assert await walk(feed, limit) == expected
+
+
+async def test_search_cursor_walks_every_match_once(session, listings):
+    _, ids = listings
+    service = ListingService(session)
+
+    def search(**page):
+        return service.get_feed(search_query="garden", **page)
+
+    expected = await walk(search, 100)
+
+    assert sorted(expected) == sorted(ids)
+    for limit in (1, 2, 3):
+        assert await walk(search, limit) == expected
+
+
+async def test_my_listings_cursor_includes_every_status(session, listings):
+    owner, ids = listings
+    await session.execute(
+        sa.update(Listing)
+        .where(Listing.id == ids[2])
+        .values(status=ListingStatus.DELETED)
+    )
+    await session.commit()
+    service = ListingService(session)
+
+    def mine(**page):
+        return service.get_my_listings(owner, **page)
+
+    expected = await walk(mine, 100)
+
+    assert sorted(expected) == sorted(ids)
+    for limit in (1, 2, 3):
+        assert await walk(mine, limit) == expected
+
+
+async def test_cursor_matches_offset(session, listings):
+    service = ListingService(session)
+
+    first = await service.get_feed(limit=3)
+    by_cursor = await service.get_feed(limit=3, cursor=first.next_page_cursor)
+    by_offset = await service.get_feed(limit=3, offset=first.next_cursor)
+
+    assert [i.id for i in by_cursor.data] == [i.id for i in by_offset.data]
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", encode_cursor(1.0, "2024-01-01", "x")]
+)
+async def test_invalid_feed_cursor_is_rejected(session, cursor):
+    with pytest.raises(InvalidFeedCursor):
+        await ListingService(session).get_feed(cursor=cursor)
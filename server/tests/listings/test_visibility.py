@@ -0,0 +1,82 @@
+import pytest
+import sqlalchemy as sa
+
+from app.listings.config import listing_settings
+from app.listings.enums import DClass
+from app.listings.models import PostVisibility, ZipDistance
+from app.listings.schemas import CreateSearchServiceListing, ListingUpdate
+from app.listings.service import ListingService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def distances(session, monkeypatch):
+    monkeypatch.setattr(listing_settings, "VISIBILITY_ENGINE", "fanout")
+    session.add_all(
+        [
+            ZipDistance(zip_from="1015", zip_to="1016", distance_km=5),
+            ZipDistance(zip_from="1015", zip_to="1017", distance_km=15),
+            ZipDistance(zip_from="1015", zip_to="1018", distance_km=35),
+            ZipDistance(zip_from="1016", zip_to="1015", distance_km=5),
+        ]
+    )
+    await session.commit()
+
+
+async def viewer_zips(session, listing_id) -> set[str]:
+    rows = await session.scalars(
+        sa.select(PostVisibility.viewer_zip).where(
+            PostVisibility.post_id == listing_id
+        )
+    )
+    return set(rows)
+
+
+@pytest.mark.parametrize(
+    "d_class, expected",
+    [
+        (DClass.D1, {"1015"}),
+        (DClass.D2, {"1015", "1016"}),
+        (DClass.D3, {"1015", "1016", "1017"}),
+        (DClass.D5, set()),
+    ],
+)
+async def test_visibility_rows_come_from_zip_distances(
+    session, distances, make_member, d_class, expected
+):
+    # The in-memory ZIP index is never loaded here
+    owner = await make_member()
+    listing = await ListingService(session).create_listing(
+        owner,
+        CreateSearchServiceListing(
+            title="Garden help",
+            description="Looking for someone to help in the garden.",
+            zip_code="1015",
+            d_class=d_class,
+        ),
+    )
+
+    assert await viewer_zips(session, listing.id) == expected
+
+
+async def test_update_replaces_visibility_rows(
+    session, distances, make_member
+):
+    owner = await make_member()
+    service = ListingService(session)
+    listing = await service.create_listing(
+        owner,
+        CreateSearchServiceListing(
+            title="Garden help",
+            description="Looking for someone to help in the garden.",
+            zip_code="1015",
+            d_class=DClass.D4,
+        ),
+    )
+
+    await service.update_listing(
+        listing.id, owner, ListingUpdate(zip_code="1016", d_class=DClass.D2)
+    )
+
+    assert await viewer_zips(session, listing.id) == {"1015", "1016"}